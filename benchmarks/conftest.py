@@ -0,0 +1,230 @@
+# Copyright (c) 2023, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+import asyncio
+import gc
+import json
+import os
+import sys
+import tracemalloc
+from statistics import median
+from time import perf_counter
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Optional
+
+import pytest
+
+from benchmarks.stub_core import StubCore
+
+# Number of calls whose leftover allocations are averaged for `retained blocks`
+ALLOCATION_CALLS = 200
+
+results: List["BenchmarkResult"] = []
+
+
+def pytest_configure():
+    os.environ.setdefault("SUPERTOKENS_ENV", "testing")
+
+
+def pytest_addoption(parser: Any):
+    group = parser.getgroup("benchmark")
+    group.addoption(
+        "--benchmark-min-time",
+        type=float,
+        default=1.0,
+        help="Seconds spent measuring the throughput of each benchmark",
+    )
+    group.addoption(
+        "--benchmark-rounds",
+        type=int,
+        default=5,
+        help="Number of timed rounds, the median of which is reported",
+    )
+    group.addoption(
+        "--benchmark-json",
+        default=None,
+        help="Write the results to this file, to be used as a baseline later",
+    )
+    group.addoption(
+        "--benchmark-compare",
+        default=None,
+        help="Fail the benchmarks that got slower than in this baseline file",
+    )
+    group.addoption(
+        "--benchmark-max-regression",
+        type=float,
+        default=20.0,
+        help="Allowed drop in throughput (in percent) compared to the baseline",
+    )
+
+
+class BenchmarkResult:
+    def __init__(
+        self,
+        name: str,
+        ops_per_second: float,
+        peak_kib: float,
+        retained_blocks: float,
+    ):
+        self.name = name
+        self.ops_per_second = ops_per_second
+        self.peak_kib = peak_kib
+        self.retained_blocks = retained_blocks
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "opsPerSecond": self.ops_per_second,
+            "peakKiB": self.peak_kib,
+            "retainedBlocks": self.retained_blocks,
+        }
+
+
+class Benchmark:
+    """
+    Measures a function called in a loop: its throughput (median of a few
+    rounds), the peak memory allocated during one call and the number of
+    memory blocks that are still allocated after a call (which should stay
+    close to 0, unless a cache is being filled).
+    """
+
+    def __init__(
+        self,
+        name: str,
+        loop: asyncio.AbstractEventLoop,
+        min_time: float,
+        rounds: int,
+        baseline: Optional[Dict[str, Any]],
+        max_regression: float,
+    ):
+        self.name = name
+        self.loop = loop
+        self.min_time = min_time
+        self.rounds = rounds
+        self.baseline = baseline
+        self.max_regression = max_regression
+        self.result: Optional[BenchmarkResult] = None
+
+    def __call__(self, func: Callable[[], Any]) -> BenchmarkResult:
+        def run(calls: int):
+            for _ in range(calls):
+                func()
+
+        return self._measure(run)
+
+    def run_async(self, func: Callable[[], Awaitable[Any]]) -> BenchmarkResult:
+        async def run_calls(calls: int):
+            for _ in range(calls):
+                await func()
+
+        def run(calls: int):
+            self.loop.run_until_complete(run_calls(calls))
+
+        return self._measure(run)
+
+    def _measure(self, run: Callable[[int], None]) -> BenchmarkResult:
+        # warm up caches (JWKS, api version, connections, ...) before timing
+        run(1)
+
+        calls = 1
+        while True:
+            start = perf_counter()
+            run(calls)
+            duration = perf_counter() - start
+            if duration >= self.min_time / self.rounds or calls >= 1 << 20:
+                break
+            calls *= 2
+
+        ops_per_second: List[float] = []
+        for _ in range(self.rounds):
+            start = perf_counter()
+            run(calls)
+            ops_per_second.append(calls / (perf_counter() - start))
+
+        tracemalloc.start()
+        run(1)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        gc.collect()
+        blocks_before = sys.getallocatedblocks()
+        run(ALLOCATION_CALLS)
+        gc.collect()
+        retained_blocks = (sys.getallocatedblocks() - blocks_before) / ALLOCATION_CALLS
+
+        self.result = BenchmarkResult(
+            self.name, median(ops_per_second), peak / 1024, retained_blocks
+        )
+        results.append(self.result)
+
+        if self.baseline is not None:
+            change = (
+                self.result.ops_per_second / self.baseline["opsPerSecond"] - 1
+            ) * 100
+            if change < -self.max_regression:
+                pytest.fail(f"{self.name} is {-change:.1f}% slower than the baseline")
+        return self.result
+
+
+@pytest.fixture(scope="session")
+def stub_core() -> Iterator[StubCore]:
+    core = StubCore().start()
+    yield core
+    core.stop()
+
+
+@pytest.fixture(scope="session")
+def baseline(pytestconfig: Any) -> Dict[str, Dict[str, Any]]:
+    path = pytestconfig.getoption("--benchmark-compare")
+    if path is None:
+        return {}
+    with open(path) as f:
+        return {r["name"]: r for r in json.load(f)}
+
+
+@pytest.fixture
+def benchmark(
+    request: Any, pytestconfig: Any, baseline: Dict[str, Dict[str, Any]]
+) -> Iterator[Benchmark]:
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    bench = Benchmark(
+        request.node.name,
+        loop,
+        pytestconfig.getoption("--benchmark-min-time"),
+        pytestconfig.getoption("--benchmark-rounds"),
+        baseline.get(request.node.name),
+        pytestconfig.getoption("--benchmark-max-regression"),
+    )
+    yield bench
+    loop.close()
+
+
+def pytest_terminal_summary(terminalreporter: Any, config: Any):
+    if len(results) == 0:
+        return
+
+    terminalreporter.section("benchmarks")
+    width = max(len(r.name) for r in results)
+    terminalreporter.write_line(
+        f"{'name':<{width}}  {'ops/s':>10}  {'us/op':>10}  {'peak KiB':>9}  {'retained blocks':>15}"
+    )
+    for r in results:
+        terminalreporter.write_line(
+            f"{r.name:<{width}}  {r.ops_per_second:>10.0f}  {1e6 / r.ops_per_second:>10.1f}"
+            f"  {r.peak_kib:>9.1f}  {r.retained_blocks:>15.2f}"
+        )
+
+    path = config.getoption("--benchmark-json")
+    if path is not None:
+        with open(path, "w") as f:
+            json.dump([r.to_json() for r in results], f, indent=2)
@@ -0,0 +1,175 @@
+# Copyright (c) 2023, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+import json
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from itertools import count
+from threading import Thread
+from time import sleep, time
+from typing import Any, Dict, Optional, Tuple
+
+import jwt
+from cryptography.hazmat.primitives.asymmetric import rsa
+from jwt.algorithms import RSAAlgorithm
+
+KEY_ID = "d-benchmark"
+
+
+class StubCore:
+    """
+    A local HTTP server that answers the core APIs used by the benchmarks with
+    canned responses. Access tokens are signed with a key published on its
+    JWKS endpoint, so the SDK verifies them exactly like it would with a core.
+    """
+
+    def __init__(self):
+        self.private_key = rsa.generate_private_key(
+            public_exponent=65537, key_size=2048
+        )
+        jwk = json.loads(RSAAlgorithm.to_jwk(self.private_key.public_key()))
+        self.jwks = {"keys": [{**jwk, "kid": KEY_ID, "alg": "RS256", "use": "sig"}]}
+        self.counter = count()
+        self.request_count = 0
+        # added to every response, to stand for the network and the database
+        self.latency_seconds = 0.0
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), self._get_handler())
+        self.server.daemon_threads = True
+        self.thread: Optional[Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "StubCore":
+        self.thread = Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+    def create_access_token(
+        self,
+        user_id: str,
+        payload: Optional[Dict[str, Any]] = None,
+        session_handle: Optional[str] = None,
+    ) -> str:
+        now = int(time())
+        return jwt.encode(  # type: ignore
+            {
+                **(payload or {}),
+                "sub": user_id,
+                "iat": now,
+                "exp": now + 3600,
+                "sessionHandle": session_handle or f"handle-{next(self.counter)}",
+                "refreshTokenHash1": "hash",
+                "parentRefreshTokenHash1": None,
+                "antiCsrfToken": None,
+                "tId": "public",
+            },
+            self.private_key,  # type: ignore
+            algorithm="RS256",
+            headers={"kid": KEY_ID, "version": "4"},
+        )
+
+    def _create_session(self, body: Dict[str, Any]) -> Dict[str, Any]:
+        user_id = body.get("userId", "user")
+        payload = body.get("userDataInJWT", {})
+        session_handle = f"handle-{next(self.counter)}"
+        now_ms = int(time() * 1000)
+        return {
+            "status": "OK",
+            "session": {
+                "handle": session_handle,
+                "userId": user_id,
+                "userDataInJWT": payload,
+                "tenantId": "public",
+            },
+            "accessToken": {
+                "token": self.create_access_token(user_id, payload, session_handle),
+                "expiry": now_ms + 3600 * 1000,
+                "createdTime": now_ms,
+            },
+            "refreshToken": {
+                "token": f"refresh-{next(self.counter)}",
+                "expiry": now_ms + 100 * 24 * 3600 * 1000,
+                "createdTime": now_ms,
+            },
+        }
+
+    def _handle(
+        self, method: str, path: str, body: Dict[str, Any]
+    ) -> Tuple[int, Dict[str, Any]]:
+        if path.startswith("/public/"):
+            path = path[len("/public") :]
+
+        if method == "GET" and path == "/apiversion":
+            return 200, {"versions": ["3.0"]}
+        if method == "GET" and path == "/.well-known/jwks.json":
+            return 200, self.jwks
+        if method == "POST" and path == "/recipe/session":
+            return 200, self._create_session(body)
+        if method == "POST" and path == "/recipe/session/refresh":
+            return 200, self._create_session({"userId": "user"})
+        if method == "POST" and path == "/recipe/session/remove":
+            return 200, {"status": "OK", "sessionHandlesRevoked": []}
+        if method == "POST" and path in ("/recipe/signin", "/recipe/signup"):
+            user = {
+                "id": f"user-{next(self.counter)}",
+                "email": body["email"],
+                "timeJoined": int(time() * 1000),
+                "tenantIds": ["public"],
+            }
+            return 200, {"status": "OK", "user": user}
+        return 404, {"message": f"{method} {path} is not stubbed"}
+
+    def _get_handler(self):
+        stub_core = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # the headers and the body are sent separately, without this the
+            # client waits for a delayed ACK before getting the body
+            disable_nagle_algorithm = True
+
+            def _respond(self, method: str):
+                stub_core.request_count += 1
+                if stub_core.latency_seconds > 0:
+                    sleep(stub_core.latency_seconds)
+                length = int(self.headers.get("Content-Length") or 0)
+                body = json.loads(self.rfile.read(length)) if length > 0 else {}
+                (
+                    status,
+                    response,
+                ) = stub_core._handle(  # pylint: disable=protected-access
+                    method, self.path.split("?")[0], body
+                )
+                content = json.dumps(response).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(content)))
+                self.end_headers()
+                self.wfile.write(content)
+
+            def do_GET(self):  # pylint: disable=invalid-name
+                self._respond("GET")
+
+            def do_POST(self):  # pylint: disable=invalid-name
+                self._respond("POST")
+
+            def log_message(self, *_: Any):  # pylint: disable=arguments-differ
+                pass
+
+        return Handler
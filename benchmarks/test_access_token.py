@@ -0,0 +1,39 @@
+# Copyright (c) 2023, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+from typing import Any
+
+from benchmarks.stub_core import StubCore
+from benchmarks.utils import init_supertokens
+from supertokens_python.recipe import session
+from supertokens_python.recipe.session.access_token import get_info_from_access_token
+from supertokens_python.recipe.session.jwt import (
+    parse_jwt_without_signature_verification,
+)
+
+
+def test_parse_jwt_without_signature_verification(benchmark: Any, stub_core: StubCore):
+    access_token = stub_core.create_access_token("user", {"role": "admin"})
+
+    benchmark(lambda: parse_jwt_without_signature_verification(access_token))
+
+
+def test_get_info_from_access_token(benchmark: Any, stub_core: StubCore):
+    init_supertokens(stub_core, "fastapi", [session.init()])
+    access_token = stub_core.create_access_token("user", {"role": "admin"})
+
+    def verify():
+        parsed = parse_jwt_without_signature_verification(access_token)
+        return get_info_from_access_token(parsed, False)
+
+    benchmark(verify)
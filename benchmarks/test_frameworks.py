@@ -0,0 +1,111 @@
+# Copyright (c) 2023, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+import json
+from itertools import count
+from typing import Any, Callable, Dict
+
+import pytest
+
+from benchmarks.stub_core import StubCore
+from benchmarks.utils import init_supertokens
+from supertokens_python.recipe import emailpassword, session
+
+emails = count()
+
+
+def get_form_fields() -> Dict[str, Any]:
+    return {
+        "formFields": [
+            {"id": "email", "value": f"user{next(emails)}@example.com"},
+            {"id": "password", "value": "validpass123"},
+        ]
+    }
+
+
+def get_fastapi_client() -> Callable[[str], int]:
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+
+    from supertokens_python.framework.fastapi import get_middleware
+
+    app = FastAPI()
+    app.add_middleware(get_middleware())
+    client = TestClient(app)
+
+    def post(path: str) -> int:
+        return client.post(path, json=get_form_fields()).status_code
+
+    return post
+
+
+def get_flask_client() -> Callable[[str], int]:
+    from flask import Flask
+
+    from supertokens_python.framework.flask import Middleware
+
+    app = Flask(__name__)
+    Middleware(app)
+    client = app.test_client()
+
+    def post(path: str) -> int:
+        return client.post(path, json=get_form_fields()).status_code
+
+    return post
+
+
+def get_django_client() -> Callable[[str], int]:
+    from django.conf import settings
+
+    if not settings.configured:
+        settings.configure(SECRET_KEY="benchmark", ALLOWED_HOSTS=["*"])
+
+    from django.http import HttpRequest, HttpResponse
+    from django.test import RequestFactory
+
+    from supertokens_python.framework.django import middleware
+
+    def view(_: HttpRequest) -> HttpResponse:
+        return HttpResponse(status=404)
+
+    handler = middleware(view)
+    factory = RequestFactory()
+
+    def post(path: str) -> int:
+        request = factory.post(
+            path, json.dumps(get_form_fields()), content_type="application/json"
+        )
+        return handler(request).status_code
+
+    return post
+
+
+CLIENTS = {
+    "fastapi": get_fastapi_client,
+    "flask": get_flask_client,
+    "django": get_django_client,
+}
+
+
+@pytest.mark.parametrize("framework", ["fastapi", "flask", "django"])
+@pytest.mark.parametrize("path", ["/auth/signup", "/auth/signin"])
+def test_emailpassword_api(
+    benchmark: Any, stub_core: StubCore, framework: str, path: str
+):
+    init_supertokens(stub_core, framework, [emailpassword.init(), session.init()])
+    post = CLIENTS[framework]()
+
+    def call_api():
+        assert post(path) == 200
+
+    benchmark(call_api)
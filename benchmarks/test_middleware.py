@@ -0,0 +1,49 @@
+# Copyright (c) 2023, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+from typing import Any
+
+import pytest
+from starlette.responses import JSONResponse
+
+from benchmarks.stub_core import StubCore
+from benchmarks.utils import create_starlette_request, init_supertokens
+from supertokens_python import Supertokens
+from supertokens_python.framework.fastapi.fastapi_request import FastApiRequest
+from supertokens_python.framework.fastapi.fastapi_response import FastApiResponse
+from supertokens_python.recipe import emailpassword, session
+
+
+@pytest.mark.parametrize(
+    "method,path,handled",
+    [
+        # session's signout API, which returns OK without a session or a core call
+        ("POST", "/auth/signout", True),
+        ("GET", "/auth/unknown", False),
+        ("GET", "/outside/api/base/path", False),
+    ],
+    ids=["matched", "unmatched", "outside_base_path"],
+)
+def test_middleware_routing(
+    benchmark: Any, stub_core: StubCore, method: str, path: str, handled: bool
+):
+    init_supertokens(stub_core, "fastapi", [emailpassword.init(), session.init()])
+    st = Supertokens.get_instance()
+
+    async def dispatch():
+        request = FastApiRequest(create_starlette_request(method, path))
+        response = FastApiResponse(JSONResponse({}))
+        result = await st.middleware(request, response, {})
+        assert (result is not None) == handled
+
+    benchmark.run_async(dispatch)
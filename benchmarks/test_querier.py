@@ -0,0 +1,54 @@
+# Copyright (c) 2023, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+import asyncio
+from typing import Any
+
+from benchmarks.stub_core import StubCore
+from benchmarks.utils import init_supertokens
+from supertokens_python.normalised_url_path import NormalisedURLPath
+from supertokens_python.querier import Querier
+from supertokens_python.recipe import session
+
+REMOVE_SESSIONS_PATH = NormalisedURLPath("/recipe/session/remove")
+
+
+def test_core_request_in_wsgi_mode(benchmark: Any, stub_core: StubCore):
+    init_supertokens(stub_core, "flask", [session.init()])
+    querier = Querier.get_instance()
+
+    async def send_request():
+        await querier.send_post_request(REMOVE_SESSIONS_PATH, {"sessionHandles": []})
+
+    benchmark.run_async(send_request)
+
+
+def test_concurrent_core_requests_in_wsgi_mode(benchmark: Any, stub_core: StubCore):
+    # e.g. the dashboard fetching the information of a user's sessions, from a
+    # core that takes a few milliseconds to answer
+    init_supertokens(stub_core, "flask", [session.init()])
+    querier = Querier.get_instance()
+    stub_core.latency_seconds = 0.005
+
+    async def send_requests():
+        await asyncio.gather(
+            *[
+                querier.send_post_request(REMOVE_SESSIONS_PATH, {"sessionHandles": []})
+                for _ in range(10)
+            ]
+        )
+
+    try:
+        benchmark.run_async(send_requests)
+    finally:
+        stub_core.latency_seconds = 0.0
@@ -0,0 +1,81 @@
+# Copyright (c) 2023, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+from itertools import count
+from typing import Any, List
+
+from benchmarks.stub_core import StubCore
+from benchmarks.utils import create_starlette_request, init_supertokens
+from supertokens_python.framework.fastapi.fastapi_request import FastApiRequest
+from supertokens_python.recipe import session
+from supertokens_python.recipe.session.claims import BooleanClaim
+from supertokens_python.recipe.session.interfaces import (
+    SessionClaimValidator,
+)
+from supertokens_python.recipe.session.recipe import SessionRecipe
+from supertokens_python.recipe.session.session_request_functions import (
+    get_session_from_request,
+    refresh_session_in_request,
+)
+
+IsAdminClaim = BooleanClaim("st-benchmark-is-admin", lambda *_: True)  # type: ignore
+
+
+def test_get_session_from_request_with_claim_validators(
+    benchmark: Any, stub_core: StubCore
+):
+    init_supertokens(stub_core, "fastapi", [session.init()])
+    recipe = SessionRecipe.get_instance()
+    access_token = stub_core.create_access_token(
+        "user", IsAdminClaim.add_to_payload_({}, True, {})
+    )
+
+    def override_global_claim_validators(
+        validators: List[SessionClaimValidator], *_: Any
+    ) -> List[SessionClaimValidator]:
+        return validators + [IsAdminClaim.validators.is_true(None)]
+
+    async def get_session():
+        request = create_starlette_request(
+            "GET", "/api", {"Authorization": f"Bearer {access_token}"}
+        )
+        s = await get_session_from_request(
+            FastApiRequest(request),
+            recipe.config,
+            recipe.recipe_implementation,
+            override_global_claim_validators=override_global_claim_validators,
+            user_context={},
+        )
+        assert s is not None
+
+    benchmark.run_async(get_session)
+
+
+def test_refresh_session_in_request(benchmark: Any, stub_core: StubCore):
+    init_supertokens(stub_core, "fastapi", [session.init()])
+    recipe = SessionRecipe.get_instance()
+    refresh_tokens = count()
+
+    async def refresh_session():
+        # a new refresh token every time, a refresh with the same token would
+        # reuse the result of the previous one instead of calling the core
+        request = create_starlette_request(
+            "POST",
+            "/auth/session/refresh",
+            {"Authorization": f"Bearer refresh-{next(refresh_tokens)}"},
+        )
+        await refresh_session_in_request(
+            FastApiRequest(request), {}, recipe.config, recipe.recipe_implementation
+        )
+
+    benchmark.run_async(refresh_session)
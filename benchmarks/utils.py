@@ -0,0 +1,71 @@
+# Copyright (c) 2023, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+from typing import Any, Callable, Dict, List, Optional
+
+from starlette.requests import Request
+
+from benchmarks.stub_core import StubCore
+from supertokens_python import InputAppInfo, Supertokens, SupertokensConfig, init
+from supertokens_python.recipe.emailpassword.recipe import EmailPasswordRecipe
+from supertokens_python.recipe.multitenancy.recipe import MultitenancyRecipe
+from supertokens_python.recipe.session.recipe import SessionRecipe
+
+
+def reset():
+    Supertokens.reset()
+    SessionRecipe.reset()
+    EmailPasswordRecipe.reset()
+    MultitenancyRecipe.reset()
+
+
+def init_supertokens(
+    stub_core: StubCore, framework: str, recipe_list: List[Callable[..., Any]]
+):
+    reset()
+    init(
+        app_info=InputAppInfo(
+            app_name="ST",
+            api_domain="http://api.supertokens.io",
+            website_domain="http://supertokens.io",
+            api_base_path="/auth",
+        ),
+        framework=framework,  # type: ignore
+        mode="asgi" if framework == "fastapi" else "wsgi",
+        supertokens_config=SupertokensConfig(stub_core.url),
+        recipe_list=recipe_list,
+        telemetry=False,
+    )
+
+
+def create_starlette_request(
+    method: str, path: str, headers: Optional[Dict[str, str]] = None
+) -> Request:
+    async def receive() -> Dict[str, Any]:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    return Request(
+        {
+            "type": "http",
+            "method": method,
+            "path": path,
+            "query_string": b"",
+            "root_path": "",
+            "server": ("api.supertokens.io", 80),
+            "scheme": "http",
+            "headers": [
+                (k.lower().encode(), v.encode()) for k, v in (headers or {}).items()
+            ],
+        },
+        receive,
+    )
@@ -46,10 +46,14 @@ extras_require = {
             "python-dotenv==0.19.2",
         ]
     ),
+    "opentelemetry": (["opentelemetry-api"]),
+    "orjson": (["orjson"]),
+    "ujson": (["ujson"]),
 }
 
 exclude_list = [
     "tests",
+    "benchmarks",
     "examples",
     "hooks",
     ".gitignore",
@@ -19,6 +19,8 @@ from typing_extensions import Literal
 from supertokens_python.framework.request import BaseRequest
 
 from . import supertokens
+from .json_codec import JSONCodec, JSONCodecName
+from .rate_limiting import RateLimiter
 from .recipe_module import RecipeModule
 
 InputAppInfo = supertokens.InputAppInfo
@@ -34,9 +36,18 @@ def init(
     recipe_list: List[Callable[[supertokens.AppInfo], RecipeModule]],
     mode: Union[Literal["asgi", "wsgi"], None] = None,
     telemetry: Union[bool, None] = None,
+    json_codec: Union[JSONCodecName, JSONCodec, None] = None,
+    rate_limiter: Union[RateLimiter, None] = None,
 ):
     return Supertokens.init(
-        app_info, framework, supertokens_config, recipe_list, mode, telemetry
+        app_info,
+        framework,
+        supertokens_config,
+        recipe_list,
+        mode,
+        telemetry,
+        json_codec,
+        rate_limiter,
     )
 
 
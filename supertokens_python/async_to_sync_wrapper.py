@@ -12,12 +12,118 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+from __future__ import annotations
+
 import asyncio
-from typing import Any, Coroutine, TypeVar
+import contextvars
+import threading
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Any, Coroutine, Optional, TypeVar
 
 _T = TypeVar("_T")
 
 
+class _BackgroundEventLoop:
+    def __init__(self, timeout: Optional[float]):
+        self.timeout = timeout
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(
+            target=self._run, name="supertokens-event-loop", daemon=True
+        )
+        self.thread.start()
+
+    def _run(self):
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    def submit(self, co: Coroutine[Any, Any, _T]) -> Future[_T]:
+        future: Future[_T] = Future()
+
+        def on_task_done(task: asyncio.Task[_T]):
+            if future.cancelled():
+                return
+            if task.cancelled():
+                future.cancel()
+            elif task.exception() is not None:
+                future.set_exception(task.exception())  # type: ignore
+            else:
+                future.set_result(task.result())
+
+        def create_task():
+            if future.cancelled():
+                co.close()
+                return
+            # This runs in a copy of the caller's context, so the framework's
+            # context local state (for example flask's request and g) is still
+            # reachable from the coroutine.
+            task = self.loop.create_task(co)
+            task.add_done_callback(on_task_done)
+
+            def on_future_done(_: Future[_T]):
+                if future.cancelled():
+                    self.loop.call_soon_threadsafe(task.cancel)
+
+            future.add_done_callback(on_future_done)
+
+        self.loop.call_soon_threadsafe(create_task, context=contextvars.copy_context())
+        return future
+
+    def stop(self):
+        async def cancel_tasks():
+            # Cancelling the tasks still running lets them clean up (e.g. close
+            # their http clients) before the loop is closed
+            tasks = [
+                task
+                for task in asyncio.all_tasks()
+                if task is not asyncio.current_task()
+            ]
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            await self.loop.shutdown_asyncgens()
+
+        asyncio.run_coroutine_threadsafe(cancel_tasks(), self.loop).result()
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join()
+        self.loop.close()
+
+
+_background_event_loop: Optional[_BackgroundEventLoop] = None
+_background_event_loop_lock = threading.Lock()
+
+
+def start_background_event_loop(timeout: Optional[float] = None) -> None:
+    """
+    Makes the syncio functions (and the flask and sync django middlewares) run
+    their coroutines on a single event loop owned by a background thread,
+    instead of on an event loop of the calling thread. Anything tied to an event
+    loop (like the in flight api version request) is then shared by all the
+    threads.
+
+    `timeout` is the default number of seconds a sync call waits for its
+    coroutine before it's cancelled. By default it waits forever.
+    """
+    global _background_event_loop
+    with _background_event_loop_lock:
+        if _background_event_loop is None:
+            _background_event_loop = _BackgroundEventLoop(timeout)
+        else:
+            _background_event_loop.timeout = timeout
+
+
+def stop_background_event_loop() -> None:
+    global _background_event_loop
+    with _background_event_loop_lock:
+        if _background_event_loop is not None:
+            _background_event_loop.stop()
+            _background_event_loop = None
+
+
+def is_background_event_loop_running() -> bool:
+    return _background_event_loop is not None
+
+
 def check_event_loop():
     try:
         asyncio.get_event_loop()
@@ -27,7 +133,25 @@ def check_event_loop():
             asyncio.set_event_loop(loop)
 
 
-def sync(co: Coroutine[Any, Any, _T]) -> _T:
+def sync(co: Coroutine[Any, Any, _T], timeout: Optional[float] = None) -> _T:
+    background_event_loop = _background_event_loop
+    if background_event_loop is not None:
+        if threading.current_thread() is background_event_loop.thread:
+            # Waiting for the loop from its own thread would never return
+            co.close()
+            raise Exception(
+                "The syncio functions cannot be called from the background event "
+                "loop. Await the asyncio functions instead"
+            )
+        future = background_event_loop.submit(co)
+        if timeout is None:
+            timeout = background_event_loop.timeout
+        try:
+            return future.result(timeout)
+        except FutureTimeoutError:
+            future.cancel()
+            raise
+
     check_event_loop()
     loop = asyncio.get_event_loop()
     return loop.run_until_complete(co)
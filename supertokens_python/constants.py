@@ -29,3 +29,12 @@ API_VERSION = "/apiversion"
 API_VERSION_HEADER = "cdi-version"
 DASHBOARD_VERSION = "0.7"
 HUNDRED_YEARS_IN_MS = 3153600000000
+# Top level domains resolved for same site resolution, by hostname
+TOP_LEVEL_DOMAIN_CACHE_SIZE = 1000
+# Session handles / users recently written through the SDK, so that request memos
+# can tell which of their values are stale. Older writes make every memoised value
+# fetched before them stale.
+REQUEST_MEMO_MAX_TRACKED_WRITES = 10000
+# Default number of threads running the blocking core requests of the pooled
+# client used in wsgi mode (SupertokensConfig.wsgi_core_request_threads)
+SYNC_QUERIER_MAX_WORKERS = 32
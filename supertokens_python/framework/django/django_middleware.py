@@ -14,10 +14,26 @@
 from __future__ import annotations
 
 import asyncio
-from typing import Any, Union
+from typing import Any, Awaitable, Callable, TypeVar, Union
 
 from asgiref.sync import async_to_sync
 
+from supertokens_python.async_to_sync_wrapper import (
+    is_background_event_loop_running,
+    sync,
+)
+
+_T = TypeVar("_T")
+
+
+def _run_sync(func: Callable[..., Awaitable[_T]], *args: Any) -> _T:
+    # With the background event loop, the coroutine runs on it like the syncio
+    # functions and the flask middleware do, so that what is tied to a loop is
+    # shared between requests.
+    if is_background_event_loop_running():
+        return sync(func(*args))  # type: ignore
+    return async_to_sync(func)(*args)
+
 
 def middleware(get_response: Any):
     from supertokens_python import Supertokens
@@ -74,8 +90,8 @@ def middleware(get_response: Any):
         user_context = default_user_context(custom_request)
 
         try:
-            result: Union[DjangoResponse, None] = async_to_sync(st.middleware)(
-                custom_request, response, user_context
+            result: Union[DjangoResponse, None] = _run_sync(
+                st.middleware, custom_request, response, user_context
             )
 
             if result is None:
@@ -91,9 +107,9 @@ def middleware(get_response: Any):
 
         except SuperTokensError as e:
             response = DjangoResponse(HttpResponse())
-            result: Union[DjangoResponse, None] = async_to_sync(
-                st.handle_supertokens_error
-            )(DjangoRequest(request), e, response)
+            result: Union[DjangoResponse, None] = _run_sync(
+                st.handle_supertokens_error, DjangoRequest(request), e, response
+            )
             if result is not None:
                 return result.response
         raise Exception("Should never come here")
@@ -13,11 +13,11 @@
 # under the License.
 from __future__ import annotations
 
-import json
 from typing import TYPE_CHECKING, Any, Dict, Union
 from urllib.parse import parse_qsl
 
 from supertokens_python.framework.request import BaseRequest
+from supertokens_python.json_codec import get_json_codec
 
 if TYPE_CHECKING:
     from supertokens_python.recipe.session.interfaces import SessionContainer
@@ -37,9 +37,12 @@ class DjangoRequest(BaseRequest):
     def get_query_params(self) -> Dict[str, Any]:
         return self.request.GET.dict()
 
+    def get_client_ip(self) -> Union[str, None]:
+        return self.request.META.get("REMOTE_ADDR")
+
     async def json(self) -> Union[Any, None]:
         try:
-            body = json.loads(self.request.body)
+            body = get_json_codec().loads(self.request.body)
             return body
         except Exception:
             return {}
@@ -13,62 +13,130 @@
 # under the License.
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Union
+from typing import TYPE_CHECKING, Any, Dict, Union
 
 from supertokens_python.framework import BaseResponse
 
 if TYPE_CHECKING:
-    from fastapi import FastAPI, Request
+    from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 
 def get_middleware():
-    from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
+    from starlette.requests import Request
+    from starlette.responses import Response
+
+    from supertokens_python import Supertokens
+    from supertokens_python.exceptions import SuperTokensError
+    from supertokens_python.framework.fastapi.fastapi_request import FastApiRequest
+    from supertokens_python.framework.fastapi.fastapi_response import FastApiResponse
+    from supertokens_python.normalised_url_path import NormalisedURLPath
+    from supertokens_python.recipe.session import SessionContainer
+    from supertokens_python.supertokens import manage_session_post_response
     from supertokens_python.utils import default_user_context
 
-    class Middleware(BaseHTTPMiddleware):
-        def __init__(self, app: FastAPI):
-            super().__init__(app)
-
-        async def dispatch(self, request: Request, call_next: RequestResponseEndpoint):
-            from supertokens_python import Supertokens
-            from supertokens_python.exceptions import SuperTokensError
-            from supertokens_python.framework.fastapi.fastapi_request import (
-                FastApiRequest,
-            )
-            from supertokens_python.framework.fastapi.fastapi_response import (
-                FastApiResponse,
-            )
-            from supertokens_python.recipe.session import SessionContainer
-            from supertokens_python.supertokens import manage_session_post_response
+    def is_supertokens_path(scope: Scope) -> bool:
+        # Same as FastApiRequest.get_path, without building the request url
+        path: str = scope["path"]
+        root_path: str = scope.get("root_path", "")
+        if root_path != "" and path.startswith(root_path):
+            path = path[len(root_path) :]
+        app_info = Supertokens.get_instance().app_info
+        return app_info.api_gateway_path.append(NormalisedURLPath(path)).startswith(
+            app_info.api_base_path
+        )
+
+    def apply_session_to_response_start(
+        state: Dict[str, Any], message: Message
+    ) -> Message:
+        session = state.get("supertokens")
+        if not isinstance(session, SessionContainer) or not session.response_mutators:
+            return message
+
+        # The mutators work on a response object, so they are run on one that
+        # holds the headers of the response being sent
+        response = Response()
+        response.raw_headers = list(message.get("headers", []))
+        manage_session_post_response(session, FastApiResponse(response))
+        return {**message, "headers": response.raw_headers}
+
+    def get_receive_for_app(request: Request, receive: Receive) -> Receive:
+        # The SDK may have read the body of a request it then didn't handle (e.g.
+        # to rate limit it). The app is given that body again.
+        body: Union[bytes, None] = getattr(request, "_body", None)
+        if body is None:
+            return receive
+        body_sent = False
+
+        async def receive_with_body() -> Message:
+            nonlocal body_sent
+            if body_sent:
+                return await receive()
+            body_sent = True
+            return {"type": "http.request", "body": body, "more_body": False}
+
+        return receive_with_body
+
+    async def send_response(
+        result: Union[BaseResponse, None], scope: Scope, receive: Receive, send: Send
+    ):
+        if not isinstance(result, FastApiResponse):
+            raise Exception("Should never come here")
+        await result.response(scope, receive, send)
+
+    class Middleware:
+        def __init__(self, app: ASGIApp):
+            self.app = app
+
+        async def __call__(self, scope: Scope, receive: Receive, send: Send):
+            if scope["type"] != "http":
+                await self.app(scope, receive, send)
+                return
 
             st = Supertokens.get_instance()
-            from fastapi.responses import Response
+            # verify_session and get_session store the session in request.state,
+            # which is this dict
+            state: Dict[str, Any] = scope.setdefault("state", {})
 
-            try:
+            if is_supertokens_path(scope):
+                request = Request(scope, receive)
                 custom_request = FastApiRequest(request)
-                response = FastApiResponse(Response())
-                user_context = default_user_context(custom_request)
-                result: Union[BaseResponse, None] = await st.middleware(
-                    custom_request, response, user_context
-                )
-                if result is None:
-                    response = await call_next(request)
-                    result = FastApiResponse(response)
-
-                if hasattr(request.state, "supertokens") and isinstance(
-                    request.state.supertokens, SessionContainer
-                ):
-                    manage_session_post_response(request.state.supertokens, result)
-                if isinstance(result, FastApiResponse):
-                    return result.response
+                try:
+                    result = await st.middleware(
+                        custom_request,
+                        FastApiResponse(Response()),
+                        default_user_context(custom_request),
+                    )
+                    session = state.get("supertokens")
+                    if result is not None and isinstance(session, SessionContainer):
+                        manage_session_post_response(session, result)
+                except SuperTokensError as e:
+                    result = await st.handle_supertokens_error(
+                        custom_request, e, FastApiResponse(Response())
+                    )
+                if result is not None:
+                    await send_response(result, scope, receive, send)
+                    return
+                receive = get_receive_for_app(request, receive)
+
+            response_started = False
+
+            async def send_with_session(message: Message):
+                nonlocal response_started
+                if message["type"] == "http.response.start":
+                    response_started = True
+                    message = apply_session_to_response_start(state, message)
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_with_session)
             except SuperTokensError as e:
-                response = FastApiResponse(Response())
-                result: Union[BaseResponse, None] = await st.handle_supertokens_error(
-                    FastApiRequest(request), e, response
+                if response_started:
+                    raise
+                result = await st.handle_supertokens_error(
+                    FastApiRequest(Request(scope, receive)),
+                    e,
+                    FastApiResponse(Response()),
                 )
-                if isinstance(result, FastApiResponse):
-                    return result.response
-
-            raise Exception("Should never come here")
+                await send_response(result, scope, receive, send)
 
     return Middleware
@@ -17,6 +17,7 @@ from typing import TYPE_CHECKING, Any, Dict, Union
 from urllib.parse import parse_qsl
 
 from supertokens_python.framework.request import BaseRequest
+from supertokens_python.json_codec import get_json_codec
 
 if TYPE_CHECKING:
     from supertokens_python.recipe.session.interfaces import SessionContainer
@@ -38,7 +39,7 @@ class FastApiRequest(BaseRequest):
 
     async def json(self) -> Union[Any, None]:
         try:
-            return await self.request.json()
+            return get_json_codec().loads(await self.request.body())
         except Exception:
             return {}
 
@@ -69,5 +70,10 @@ class FastApiRequest(BaseRequest):
         # So we trim the extra root_path (from the left) from the url
         return url[url.startswith(root_path) and len(root_path) :]
 
+    def get_client_ip(self) -> Union[str, None]:
+        if self.request.client is None:
+            return None
+        return self.request.client.host
+
     async def form_data(self):
         return dict(parse_qsl((await self.request.body()).decode("utf-8")))
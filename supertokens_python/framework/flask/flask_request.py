@@ -39,6 +39,11 @@ class FlaskRequest(BaseRequest):
         except Exception:
             return {}
 
+    def get_client_ip(self) -> Union[str, None]:
+        if isinstance(self.request, dict):
+            return self.request.get("REMOTE_ADDR")
+        return self.request.remote_addr
+
     def method(self) -> str:
         if isinstance(self.request, dict):
             temp: str = self.request["REQUEST_METHOD"]
@@ -73,3 +73,10 @@ class BaseRequest(ABC):
     @abstractmethod
     def get_path(self) -> str:
         pass
+
+    def get_client_ip(self) -> Union[str, None]:
+        """
+        The address of the client that sent the request, as seen by the server
+        (so the address of the proxy if there is one).
+        """
+        return None
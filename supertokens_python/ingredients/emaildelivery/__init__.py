@@ -12,13 +12,15 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
-from typing import Generic, TypeVar
+from typing import Any, Dict, Generic, TypeVar
 
 from supertokens_python.ingredients.emaildelivery.types import (
     EmailDeliveryConfigWithService,
     EmailDeliveryInterface,
 )
 
+from supertokens_python.metrics import DELIVERY, get_metrics_collector
+
 _T = TypeVar("_T")
 
 
@@ -31,3 +33,14 @@ class EmailDeliveryIngredient(Generic[_T]):
             if config.override is None
             else config.override(config.service)
         )
+
+        original_send_email = self.ingredient_interface_impl.send_email
+
+        async def send_email(template_vars: _T, user_context: Dict[str, Any]) -> None:
+            with get_metrics_collector().start_span(
+                DELIVERY,
+                {"channel": "email", "type": type(template_vars).__name__},
+            ):
+                await original_send_email(template_vars, user_context)
+
+        self.ingredient_interface_impl.send_email = send_email  # type: ignore
@@ -12,13 +12,15 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
-from typing import Generic, TypeVar
+from typing import Any, Dict, Generic, TypeVar
 
 from supertokens_python.ingredients.smsdelivery.types import (
     SMSDeliveryConfigWithService,
     SMSDeliveryInterface,
 )
 
+from supertokens_python.metrics import DELIVERY, get_metrics_collector
+
 _T = TypeVar("_T")
 
 
@@ -31,3 +33,14 @@ class SMSDeliveryIngredient(Generic[_T]):
             if config.override is None
             else config.override(config.service)
         )
+
+        original_send_sms = self.ingredient_interface_impl.send_sms
+
+        async def send_sms(template_vars: _T, user_context: Dict[str, Any]) -> None:
+            with get_metrics_collector().start_span(
+                DELIVERY,
+                {"channel": "sms", "type": type(template_vars).__name__},
+            ):
+                await original_send_sms(template_vars, user_context)
+
+        self.ingredient_interface_impl.send_sms = send_sms  # type: ignore
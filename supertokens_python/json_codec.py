@@ -0,0 +1,114 @@
+# Copyright (c) 2023, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import json
+from typing import Any, Union
+
+from typing_extensions import Literal
+
+
+class JSONCodec:
+    """
+    Encodes and decodes the JSON of the requests and responses of the SDK and
+    of the core, using the standard library. Subclass it to use another library.
+
+    Everything is encoded compactly, as UTF-8 without escaping non ASCII
+    characters, and NaN / Infinity are not allowed.
+    """
+
+    name = "stdlib"
+
+    def dumps(self, obj: Any, sort_keys: bool = False) -> str:
+        return json.dumps(
+            obj,
+            ensure_ascii=False,
+            allow_nan=False,
+            separators=(",", ":"),
+            sort_keys=sort_keys,
+        )
+
+    def dumps_bytes(self, obj: Any, sort_keys: bool = False) -> bytes:
+        return self.dumps(obj, sort_keys).encode("utf-8")
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        return json.loads(data)
+
+
+class OrjsonCodec(JSONCodec):
+    name = "orjson"
+
+    def __init__(self):
+        import orjson  # pylint: disable=import-error
+
+        self.orjson = orjson
+
+    def dumps(self, obj: Any, sort_keys: bool = False) -> str:
+        return self.dumps_bytes(obj, sort_keys).decode("utf-8")
+
+    def dumps_bytes(self, obj: Any, sort_keys: bool = False) -> bytes:
+        return self.orjson.dumps(obj, option=self.orjson.OPT_SORT_KEYS if sort_keys else 0)  # type: ignore
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        return self.orjson.loads(data)  # type: ignore
+
+
+class UjsonCodec(JSONCodec):
+    name = "ujson"
+
+    def __init__(self):
+        import ujson  # pylint: disable=import-error
+
+        self.ujson = ujson
+
+    def dumps(self, obj: Any, sort_keys: bool = False) -> str:
+        return self.ujson.dumps(  # type: ignore
+            obj,
+            ensure_ascii=False,
+            escape_forward_slashes=False,
+            sort_keys=sort_keys,
+        )
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        return self.ujson.loads(data)  # type: ignore
+
+
+JSONCodecName = Literal["stdlib", "orjson", "ujson"]
+
+_codec: JSONCodec = JSONCodec()
+
+
+def get_json_codec() -> JSONCodec:
+    return _codec
+
+
+def set_json_codec(codec: Union[JSONCodecName, JSONCodec, None]) -> None:
+    """
+    Sets the codec used for all the JSON that the SDK encodes or decodes while
+    handling a request. It is called by `init` with its `json_codec` argument.
+    Passing None goes back to the standard library.
+    """
+    global _codec
+    if codec is None or codec == "stdlib":
+        _codec = JSONCodec()
+    elif codec == "orjson":
+        _codec = OrjsonCodec()
+    elif codec == "ujson":
+        _codec = UjsonCodec()
+    elif isinstance(codec, JSONCodec):
+        _codec = codec
+    else:
+        raise ValueError(
+            "json_codec must be one of 'stdlib', 'orjson', 'ujson' or a JSONCodec"
+        )
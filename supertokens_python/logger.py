@@ -14,9 +14,13 @@
 
 import json
 import logging
+import sys
 from datetime import datetime
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener
 from os import getenv, path
-from typing import Union
+from queue import Full, Queue
+from typing import Any, Callable, Dict, Union
 
 from .constants import VERSION
 
@@ -36,9 +40,14 @@ def _get_log_timestamp() -> str:
     return datetime.utcnow().isoformat()[:-3] + "Z"
 
 
+@lru_cache(maxsize=256)
+def _get_relative_path(pathname: str) -> str:
+    return path.relpath(pathname, supertokens_dir)
+
+
 class CustomStreamHandler(logging.StreamHandler):  # type: ignore
     def emit(self, record: logging.LogRecord):
-        relative_path = path.relpath(record.pathname, supertokens_dir)
+        relative_path = _get_relative_path(record.pathname)
 
         record.msg = json.dumps(
             {
@@ -59,16 +68,93 @@ streamHandler.setFormatter(streamFormatter)
 _logger.addHandler(streamHandler)
 
 
+# stacklevel makes the record point at the caller of log_debug_message instead
+# of this module. It is only supported from python 3.8 onwards.
+_CALLER_STACK_LEVEL: Dict[str, Any] = (
+    {"stacklevel": 2} if sys.version_info >= (3, 8) else {}
+)
+
+
 # The debug logger can be used like this:
 # log_debug_message("Hello")
 # Output log format:
 # com.supertokens {"t": "2022-03-24T06:28:33.659Z", "sdkVer": "0.5.1", "message": "Hello", "file": "logger.py:73"}
+#
+# Arguments that are expensive to compute can be wrapped in Lazy. They are only
+# computed if debug logging is enabled:
+# log_debug_message("payload: %s", Lazy(lambda: json.dumps(payload)))
+# Other arguments, including callables, are passed to the logger as they are.
+class Lazy:
+    __slots__ = ("compute",)
 
-# Export logger.debug as log_debug_message function
-log_debug_message = _logger.debug
+    def __init__(self, compute: Callable[[], Any]):
+        self.compute = compute
+
+
+def log_debug_message(msg: str, *args: Any) -> None:
+    if not _logger.isEnabledFor(logging.DEBUG):
+        return
+
+    _logger.debug(
+        msg,
+        *[arg.compute() if isinstance(arg, Lazy) else arg for arg in args],
+        **_CALLER_STACK_LEVEL,
+    )
 
 
 def get_maybe_none_as_str(o: Union[str, None]) -> str:
     if o is None:
         return "None"
     return o
+
+
+class _SDKQueueHandler(QueueHandler):
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except Full:
+            pass
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Only the message is resolved on the calling thread. Serialising it
+        # and writing it to the stream is left to the listener thread.
+        record.msg = record.getMessage()
+        record.args = None
+        record.exc_info = None
+        return record
+
+
+_queue_listener: Union[QueueListener, None] = None
+
+
+def enable_queue_logging(max_queue_size: int = 10000) -> None:
+    """
+    Moves the formatting and writing of SDK log records to a background thread,
+    so that logging does not block the request being served. Records are dropped
+    if more than `max_queue_size` of them are waiting to be written.
+    """
+    global _queue_listener
+    if _queue_listener is not None:
+        return
+
+    queue: Queue[Any] = Queue(max_queue_size)
+    _queue_listener = QueueListener(queue, streamHandler)
+    _logger.removeHandler(streamHandler)
+    _logger.addHandler(_SDKQueueHandler(queue))
+    _queue_listener.start()
+
+
+def disable_queue_logging() -> None:
+    """
+    Flushes pending log records and goes back to writing them on the calling thread.
+    """
+    global _queue_listener
+    if _queue_listener is None:
+        return
+
+    for handler in list(_logger.handlers):
+        if isinstance(handler, _SDKQueueHandler):
+            _logger.removeHandler(handler)
+    _queue_listener.stop()
+    _queue_listener = None
+    _logger.addHandler(streamHandler)
@@ -0,0 +1,420 @@
+# Copyright (c) 2023, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import threading
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from time import perf_counter
+from types import TracebackType
+from typing import Any, Dict, List, Optional, Tuple, Type, Union
+
+# Names of the metrics and spans recorded by the SDK
+CORE_REQUEST = "supertokens.core.request"
+MIDDLEWARE_DISPATCH = "supertokens.middleware.dispatch"
+ACCESS_TOKEN_VERIFICATION = "supertokens.session.access_token_verification"
+CLAIM_REFETCH = "supertokens.session.claim_refetch"
+JWKS_REFRESH = "supertokens.session.jwks_refresh"
+DELIVERY = "supertokens.delivery"
+CACHE_LOOKUP = "supertokens.cache.lookup"
+RATE_LIMITED = "supertokens.rate_limited"
+
+Attributes = Dict[str, str]
+
+
+class Span:
+    """
+    Times the block it is used around. The duration is reported to the
+    collector when the block exits, along with the attributes of the span and
+    an `error` attribute if the block raised.
+    """
+
+    def __init__(self, collector: MetricsCollector, name: str, attributes: Attributes):
+        self.collector = collector
+        self.name = name
+        self.attributes = attributes
+        self._start = 0.0
+
+    def set_attribute(self, key: str, value: str) -> None:
+        self.attributes[key] = value
+
+    def __enter__(self) -> Span:
+        self._start = perf_counter()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        duration_ms = (perf_counter() - self._start) * 1000
+        if exc_type is not None:
+            self.attributes["error"] = exc_type.__name__
+        self.collector.record_duration(self.name, duration_ms, self.attributes)
+
+
+class MetricsCollector(ABC):
+    @abstractmethod
+    def record_duration(
+        self, name: str, duration_ms: float, attributes: Attributes
+    ) -> None:
+        pass
+
+    @abstractmethod
+    def increment(self, name: str, attributes: Attributes, value: int = 1) -> None:
+        pass
+
+    def start_span(self, name: str, attributes: Optional[Attributes] = None) -> Span:
+        return Span(self, name, {} if attributes is None else attributes)
+
+    def record_cache_lookup(self, cache: str, hit: bool) -> None:
+        self.increment(
+            CACHE_LOOKUP, {"cache": cache, "result": "hit" if hit else "miss"}
+        )
+
+
+class _NoOpSpan(Span):
+    def set_attribute(self, key: str, value: str) -> None:
+        pass
+
+    def __enter__(self) -> Span:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        pass
+
+
+class NoOpMetricsCollector(MetricsCollector):
+    def __init__(self):
+        self._span = _NoOpSpan(self, "", {})
+
+    def record_duration(
+        self, name: str, duration_ms: float, attributes: Attributes
+    ) -> None:
+        pass
+
+    def increment(self, name: str, attributes: Attributes, value: int = 1) -> None:
+        pass
+
+    def start_span(self, name: str, attributes: Optional[Attributes] = None) -> Span:
+        return self._span
+
+    def record_cache_lookup(self, cache: str, hit: bool) -> None:
+        pass
+
+
+DEFAULT_BUCKET_BOUNDARIES_MS = [
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    25.0,
+    50.0,
+    100.0,
+    250.0,
+    500.0,
+    1000.0,
+    2500.0,
+    5000.0,
+    10000.0,
+]
+
+
+class HistogramSnapshot:
+    def __init__(
+        self,
+        boundaries: List[float],
+        bucket_counts: List[int],
+        count: int,
+        total: float,
+        min_: Optional[float],
+        max_: Optional[float],
+    ):
+        # bucket_counts[i] is the number of values <= boundaries[i] and greater
+        # than the previous boundary. The last bucket holds the values above
+        # the last boundary.
+        self.boundaries = boundaries
+        self.bucket_counts = bucket_counts
+        self.count = count
+        self.total = total
+        self.min = min_
+        self.max = max_
+
+    @property
+    def mean(self) -> Optional[float]:
+        if self.count == 0:
+            return None
+        return self.total / self.count
+
+    def percentile(self, p: float) -> Optional[float]:
+        """
+        Returns the upper boundary of the bucket that contains the p-th percentile
+        (0 < p <= 100), or the max value if it falls in the overflow bucket.
+        """
+        if self.count == 0:
+            return None
+        rank = p / 100 * self.count
+        seen = 0
+        for i, bucket_count in enumerate(self.bucket_counts):
+            seen += bucket_count
+            if seen >= rank:
+                if i < len(self.boundaries):
+                    return self.boundaries[i]
+                break
+        return self.max
+
+
+class _Histogram:
+    def __init__(self, boundaries: List[float]):
+        self.boundaries = boundaries
+        self.bucket_counts = [0] * (len(boundaries) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+
+    def record(self, value: float) -> None:
+        self.bucket_counts[bisect_left(self.boundaries, value)] += 1
+        self.count += 1
+        self.total += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+
+_Key = Tuple[str, Tuple[Tuple[str, str], ...]]
+
+
+def _matches(
+    key_attributes: Tuple[Tuple[str, str], ...], attributes: Optional[Attributes]
+) -> bool:
+    if attributes is None:
+        return True
+    key_attributes_dict = dict(key_attributes)
+    return all(key_attributes_dict.get(k) == v for k, v in attributes.items())
+
+
+class InMemoryMetricsCollector(MetricsCollector):
+    """
+    Keeps histograms of durations and counters in memory, keyed by metric name
+    and attributes. Meant for tests, benchmarks and debugging endpoints.
+    """
+
+    def __init__(self, bucket_boundaries_ms: Optional[List[float]] = None):
+        self.bucket_boundaries_ms = (
+            DEFAULT_BUCKET_BOUNDARIES_MS
+            if bucket_boundaries_ms is None
+            else sorted(bucket_boundaries_ms)
+        )
+        self._lock = threading.Lock()
+        self._histograms: Dict[_Key, _Histogram] = {}
+        self._counters: Dict[_Key, int] = {}
+
+    @staticmethod
+    def _key(name: str, attributes: Attributes) -> _Key:
+        return name, tuple(sorted(attributes.items()))
+
+    def record_duration(
+        self, name: str, duration_ms: float, attributes: Attributes
+    ) -> None:
+        key = self._key(name, attributes)
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = _Histogram(self.bucket_boundaries_ms)
+                self._histograms[key] = histogram
+            histogram.record(duration_ms)
+
+    def increment(self, name: str, attributes: Attributes, value: int = 1) -> None:
+        key = self._key(name, attributes)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def get_histogram(
+        self, name: str, attributes: Optional[Attributes] = None
+    ) -> HistogramSnapshot:
+        """
+        Merges the histograms of `name` whose attributes contain `attributes`.
+        """
+        boundaries = self.bucket_boundaries_ms
+        merged = _Histogram(boundaries)
+        with self._lock:
+            for (key_name, key_attributes), histogram in self._histograms.items():
+                if key_name != name or not _matches(key_attributes, attributes):
+                    continue
+                for i, bucket_count in enumerate(histogram.bucket_counts):
+                    merged.bucket_counts[i] += bucket_count
+                merged.count += histogram.count
+                merged.total += histogram.total
+                if histogram.min is not None:
+                    merged.min = (
+                        histogram.min
+                        if merged.min is None
+                        else min(merged.min, histogram.min)
+                    )
+                if histogram.max is not None:
+                    merged.max = (
+                        histogram.max
+                        if merged.max is None
+                        else max(merged.max, histogram.max)
+                    )
+        return HistogramSnapshot(
+            boundaries,
+            merged.bucket_counts,
+            merged.count,
+            merged.total,
+            merged.min,
+            merged.max,
+        )
+
+    def get_counter(self, name: str, attributes: Optional[Attributes] = None) -> int:
+        """
+        Sums the counters of `name` whose attributes contain `attributes`.
+        """
+        with self._lock:
+            return sum(
+                value
+                for (key_name, key_attributes), value in self._counters.items()
+                if key_name == name and _matches(key_attributes, attributes)
+            )
+
+    def get_cache_hit_ratio(self, cache: str) -> Optional[float]:
+        hits = self.get_counter(CACHE_LOOKUP, {"cache": cache, "result": "hit"})
+        misses = self.get_counter(CACHE_LOOKUP, {"cache": cache, "result": "miss"})
+        if hits + misses == 0:
+            return None
+        return hits / (hits + misses)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._histograms = {}
+            self._counters = {}
+
+
+class _OpenTelemetrySpan(Span):
+    def __init__(
+        self,
+        collector: OpenTelemetryMetricsCollector,
+        name: str,
+        attributes: Attributes,
+    ):
+        super().__init__(collector, name, attributes)
+        self._otel_span_cm: Any = None
+        self._otel_span: Any = None
+
+    def set_attribute(self, key: str, value: str) -> None:
+        super().set_attribute(key, value)
+        if self._otel_span is not None:
+            self._otel_span.set_attribute(key, value)
+
+    def __enter__(self) -> Span:
+        collector: OpenTelemetryMetricsCollector = self.collector  # type: ignore
+        self._otel_span_cm = collector.tracer.start_as_current_span(
+            self.name, attributes=dict(self.attributes)
+        )
+        self._otel_span = self._otel_span_cm.__enter__()
+        return super().__enter__()
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        super().__exit__(exc_type, exc_value, traceback)
+        self._otel_span_cm.__exit__(exc_type, exc_value, traceback)
+
+
+class OpenTelemetryMetricsCollector(MetricsCollector):
+    """
+    Reports durations as OpenTelemetry histograms (in ms), counters as
+    OpenTelemetry counters and spans as OpenTelemetry spans. Requires the
+    `opentelemetry-api` package.
+    """
+
+    def __init__(self, meter: Any = None, tracer: Any = None):
+        try:
+            from opentelemetry import metrics, trace  # type: ignore
+        except ImportError:
+            raise Exception(
+                "Please install opentelemetry-api to use the OpenTelemetryMetricsCollector"
+            )
+
+        from .constants import VERSION
+
+        self.meter: Any = (
+            meter
+            if meter is not None
+            else metrics.get_meter("supertokens_python", VERSION)
+        )
+        self.tracer: Any = (
+            tracer
+            if tracer is not None
+            else trace.get_tracer("supertokens_python", VERSION)
+        )
+        self._lock = threading.Lock()
+        self._histograms: Dict[str, Any] = {}
+        self._counters: Dict[str, Any] = {}
+
+    def _get_histogram(self, name: str) -> Any:
+        histogram = self._histograms.get(name)
+        if histogram is None:
+            with self._lock:
+                histogram = self._histograms.get(name)
+                if histogram is None:
+                    histogram = self.meter.create_histogram(name, unit="ms")
+                    self._histograms[name] = histogram
+        return histogram
+
+    def _get_counter(self, name: str) -> Any:
+        counter = self._counters.get(name)
+        if counter is None:
+            with self._lock:
+                counter = self._counters.get(name)
+                if counter is None:
+                    counter = self.meter.create_counter(name)
+                    self._counters[name] = counter
+        return counter
+
+    def record_duration(
+        self, name: str, duration_ms: float, attributes: Attributes
+    ) -> None:
+        self._get_histogram(name).record(duration_ms, attributes=attributes)
+
+    def increment(self, name: str, attributes: Attributes, value: int = 1) -> None:
+        self._get_counter(name).add(value, attributes=attributes)
+
+    def start_span(self, name: str, attributes: Optional[Attributes] = None) -> Span:
+        return _OpenTelemetrySpan(self, name, {} if attributes is None else attributes)
+
+
+_collector: MetricsCollector = NoOpMetricsCollector()
+
+
+def get_metrics_collector() -> MetricsCollector:
+    return _collector
+
+
+def set_metrics_collector(collector: Union[MetricsCollector, None]) -> None:
+    """
+    Sets the collector that the SDK reports its metrics and spans to. Passing
+    None goes back to the default collector, which discards everything.
+    """
+    global _collector
+    _collector = NoOpMetricsCollector() if collector is None else collector
@@ -12,14 +12,16 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 from __future__ import annotations
+import asyncio
 import logging
+import threading
 import traceback
 
-from json import JSONDecodeError
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from os import environ
-from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict
-
-from httpx import AsyncClient, ConnectTimeout, NetworkError, Response
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, Mapping, Tuple
 
 from .constants import (
     API_KEY_HEADER,
@@ -27,15 +29,23 @@ from .constants import (
     API_VERSION_HEADER,
     RID_KEY_HEADER,
     SUPPORTED_CDI_VERSIONS,
+    SYNC_QUERIER_MAX_WORKERS,
 )
 from .normalised_url_path import NormalisedURLPath
 
 if TYPE_CHECKING:
+    from httpx import Client, Response
+
     from .supertokens import Host
 
 from typing import List, Set, Union
 
+from typing_extensions import Literal
+
+from .async_to_sync_wrapper import is_background_event_loop_running
 from .exceptions import raise_general_exception
+from .json_codec import get_json_codec
+from .metrics import CORE_REQUEST, get_metrics_collector
 from .process_state import AllowedProcessStates, ProcessState
 from .utils import find_max_version, is_4xx_error, is_5xx_error
 
@@ -50,6 +60,20 @@ class Querier:
     api_version = None
     __last_tried_index: int = 0
     __hosts_alive_for_testing: Set[str] = set()
+    # The in flight /apiversion request and the loop it runs on, shared by all
+    # the callers that need the api version before it is known.
+    __api_version_task: Union[
+        None, Tuple[asyncio.AbstractEventLoop, asyncio.Future[str]]
+    ] = None
+    # (api version, rid, is json request) -> headers sent to the core
+    __headers_cache: Dict[Tuple[str, Union[str, None], bool], Mapping[str, str]] = {}
+    __mode: Literal["asgi", "wsgi"] = "asgi"
+    # Pooled client used to query the core in wsgi mode, and the threads its
+    # blocking calls run on
+    __sync_client: Union[None, Client] = None
+    __sync_executor: Union[None, ThreadPoolExecutor] = None
+    __sync_max_workers: int = SYNC_QUERIER_MAX_WORKERS
+    __sync_client_lock = threading.Lock()
 
     def __init__(self, hosts: List[Host], rid_to_core: Union[None, str] = None):
         self.__hosts = hosts
@@ -73,10 +97,29 @@ class Querier:
             raise_general_exception("calling testing function in non testing env")
         return Querier.__hosts_alive_for_testing
 
-    async def get_api_version(self):
+    async def get_api_version(self) -> str:
         if Querier.api_version is not None:
+            get_metrics_collector().record_cache_lookup("api_version", True)
             return Querier.api_version
 
+        get_metrics_collector().record_cache_lookup("api_version", False)
+
+        loop = asyncio.get_event_loop()
+        if (
+            Querier.__api_version_task is None
+            or Querier.__api_version_task[0] is not loop
+            or Querier.__api_version_task[1].done()
+        ):
+            Querier.__api_version_task = (
+                loop,
+                asyncio.ensure_future(self.__fetch_api_version()),
+            )
+
+        # shield so that a cancelled caller doesn't cancel the request for
+        # everyone else waiting on it
+        return await asyncio.shield(Querier.__api_version_task[1])
+
+    async def __fetch_api_version(self) -> str:
         ProcessState.get_instance().add_state(
             AllowedProcessStates.CALLING_SERVICE_IN_GET_API_VERSION
         )
@@ -85,8 +128,7 @@ class Querier:
             headers = {}
             if Querier.__api_key is not None:
                 headers = {API_KEY_HEADER: Querier.__api_key}
-            async with AsyncClient() as client:
-                return await client.get(url, headers=headers)  # type:ignore
+            return await Querier.__request("GET", url, headers=headers)
 
         response = await self.__send_request_helper(
             NormalisedURLPath(API_VERSION), "GET", f, len(self.__hosts)
@@ -113,21 +155,85 @@ class Querier:
         return Querier(Querier.__hosts, rid_to_core)
 
     @staticmethod
-    def init(hosts: List[Host], api_key: Union[str, None] = None):
+    def init(
+        hosts: List[Host],
+        api_key: Union[str, None] = None,
+        mode: Literal["asgi", "wsgi"] = "asgi",
+        sync_max_workers: int = SYNC_QUERIER_MAX_WORKERS,
+    ):
         if not Querier.__init_called:
             Querier.__init_called = True
             Querier.__hosts = hosts
             Querier.__api_key = api_key
+            Querier.__mode = mode
+            Querier.__sync_max_workers = sync_max_workers
+            if Querier.__sync_client is not None:
+                Querier.__sync_client.close()
+                Querier.__sync_client = None
+            if Querier.__sync_executor is not None:
+                Querier.__sync_executor.shutdown(wait=False)
+                Querier.__sync_executor = None
             Querier.api_version = None
+            Querier.__api_version_task = None
+            Querier.__headers_cache = {}
             Querier.__last_tried_index = 0
             Querier.__hosts_alive_for_testing = set()
 
-    async def __get_headers_with_api_version(self, path: NormalisedURLPath):
-        headers = {API_VERSION_HEADER: await self.get_api_version()}
-        if Querier.__api_key is not None:
-            headers = {**headers, API_KEY_HEADER: Querier.__api_key}
-        if path.is_a_recipe_path() and self.__rid_to_core is not None:
-            headers = {**headers, RID_KEY_HEADER: self.__rid_to_core}
+    @staticmethod
+    async def __request(method: str, url: str, **kwargs: Any) -> Response:
+        # In wsgi mode the core is queried with a blocking client that keeps its
+        # connections alive across requests and threads, instead of opening a new
+        # async client each time. Its calls run on a thread pool so that they don't
+        # block the loop: concurrent core calls of a request still overlap and
+        # timeouts around them still fire. With the background event loop the
+        # async client is used, since that loop outlives the request.
+        if Querier.__mode == "wsgi" and not is_background_event_loop_running():
+            client, executor = Querier.__get_sync_client()
+            return await asyncio.get_running_loop().run_in_executor(
+                executor, partial(client.request, method, url, **kwargs)
+            )
+
+        from httpx import AsyncClient
+
+        async with AsyncClient() as client:
+            return await client.request(method, url, **kwargs)  # type: ignore
+
+    @staticmethod
+    def __get_sync_client() -> Tuple[Client, ThreadPoolExecutor]:
+        with Querier.__sync_client_lock:
+            if Querier.__sync_client is None:
+                from httpx import Client
+
+                Querier.__sync_client = Client()
+            if Querier.__sync_executor is None:
+                Querier.__sync_executor = ThreadPoolExecutor(
+                    max_workers=Querier.__sync_max_workers,
+                    thread_name_prefix="supertokens-querier",
+                )
+            return Querier.__sync_client, Querier.__sync_executor
+
+    async def __get_headers_with_api_version(
+        self, path: NormalisedURLPath, is_json_request: bool = False
+    ) -> Mapping[str, str]:
+        api_version = await self.get_api_version()
+        rid = None
+        if self.__rid_to_core is not None and path.is_a_recipe_path():
+            rid = self.__rid_to_core
+        key = (api_version, rid, is_json_request)
+
+        # The headers only depend on the key, so they are built once and the
+        # same read only mapping is passed to httpx for every request.
+        headers = Querier.__headers_cache.get(key)
+        if headers is None:
+            new_headers = {API_VERSION_HEADER: api_version}
+            if Querier.__api_key is not None:
+                new_headers[API_KEY_HEADER] = Querier.__api_key
+            if rid is not None:
+                new_headers[RID_KEY_HEADER] = rid
+            if is_json_request:
+                new_headers["content-type"] = "application/json; charset=utf-8"
+            headers = MappingProxyType(new_headers)
+            Querier.__headers_cache[key] = headers
         return headers
 
     async def send_get_request(
@@ -137,12 +243,12 @@ class Querier:
             params = {}
 
         async def f(url: str) -> Response:
-            async with AsyncClient() as client:
-                return await client.get(  # type:ignore
-                    url,
-                    params=params,
-                    headers=await self.__get_headers_with_api_version(path),
-                )
+            return await Querier.__request(
+                "GET",
+                url,
+                params=params,
+                headers=await self.__get_headers_with_api_version(path),
+            )
 
         return await self.__send_request_helper(path, "GET", f, len(self.__hosts))
 
@@ -162,12 +268,13 @@ class Querier:
         ):
             return data
 
-        headers = await self.__get_headers_with_api_version(path)
-        headers["content-type"] = "application/json; charset=utf-8"
+        headers = await self.__get_headers_with_api_version(path, True)
+        content = get_json_codec().dumps_bytes(data)
 
         async def f(url: str) -> Response:
-            async with AsyncClient() as client:
-                return await client.post(url, json=data, headers=headers)  # type: ignore
+            return await Querier.__request(
+                "POST", url, content=content, headers=headers
+            )
 
         return await self.__send_request_helper(path, "POST", f, len(self.__hosts))
 
@@ -178,12 +285,12 @@ class Querier:
             params = {}
 
         async def f(url: str) -> Response:
-            async with AsyncClient() as client:
-                return await client.delete(  # type:ignore
-                    url,
-                    params=params,
-                    headers=await self.__get_headers_with_api_version(path),
-                )
+            return await Querier.__request(
+                "DELETE",
+                url,
+                params=params,
+                headers=await self.__get_headers_with_api_version(path),
+            )
 
         return await self.__send_request_helper(path, "DELETE", f, len(self.__hosts))
 
@@ -193,12 +300,11 @@ class Querier:
         if data is None:
             data = {}
 
-        headers = await self.__get_headers_with_api_version(path)
-        headers["content-type"] = "application/json; charset=utf-8"
+        headers = await self.__get_headers_with_api_version(path, True)
+        content = get_json_codec().dumps_bytes(data)
 
         async def f(url: str) -> Response:
-            async with AsyncClient() as client:
-                return await client.put(url, json=data, headers=headers)  # type: ignore
+            return await Querier.__request("PUT", url, content=content, headers=headers)
 
         return await self.__send_request_helper(path, "PUT", f, len(self.__hosts))
 
@@ -228,6 +334,10 @@ class Querier:
         http_function: Callable[[str], Awaitable[Response]],
         no_of_tries: int,
     ) -> Any:
+        # httpx is imported here instead of at the module level so that importing
+        # the SDK doesn't load it until the core is actually queried.
+        from httpx import ConnectTimeout, NetworkError
+
         if no_of_tries == 0:
             raise_general_exception("No SuperTokens core available to query")
 
@@ -246,7 +356,12 @@ class Querier:
             ProcessState.get_instance().add_state(
                 AllowedProcessStates.CALLING_SERVICE_IN_REQUEST_HELPER
             )
-            response = await http_function(url)
+            with get_metrics_collector().start_span(
+                CORE_REQUEST,
+                {"path": path.get_as_string_dangerous(), "method": method},
+            ) as span:
+                response = await http_function(url)
+                span.set_attribute("status", str(response.status_code))
             if ("SUPERTOKENS_ENV" in environ) and (
                 environ["SUPERTOKENS_ENV"] == "testing"
             ):
@@ -265,8 +380,8 @@ class Querier:
                 )
 
             try:
-                return response.json()
-            except JSONDecodeError:
+                return get_json_codec().loads(response.content)
+            except ValueError:
                 return response.text
 
         except (ConnectionError, NetworkError, ConnectTimeout) as e:
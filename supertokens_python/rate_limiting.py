@@ -0,0 +1,249 @@
+# Copyright (c) 2023, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from contextlib import ExitStack
+from time import monotonic
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, Union
+
+from typing_extensions import Literal
+
+from supertokens_python.exceptions import raise_general_exception
+
+if TYPE_CHECKING:
+    from supertokens_python.framework.request import BaseRequest
+
+RateLimitKey = Literal["ip", "email", "phone_number", "tenant"]
+
+
+class RateLimit:
+    """
+    A token bucket that holds `max_requests` tokens and is refilled at
+    `max_requests` tokens every `interval_seconds`. Each request takes a token.
+    """
+
+    def __init__(self, max_requests: int, interval_seconds: float):
+        if max_requests < 1 or interval_seconds <= 0:
+            raise_general_exception(
+                "max_requests must be at least 1 and interval_seconds must be positive"
+            )
+        self.max_requests = max_requests
+        self.interval_seconds = interval_seconds
+        self.refill_per_second = max_requests / interval_seconds
+
+
+# The APIs that are limited by default, by API id. These are the APIs that
+# query the core or send an email / SMS for any input, so they are the targets
+# of credential stuffing and enumeration.
+DEFAULT_RATE_LIMITS: Dict[str, Dict[RateLimitKey, RateLimit]] = {
+    # emailpassword and thirdpartyemailpassword
+    "/signin": {"ip": RateLimit(30, 60), "email": RateLimit(10, 60)},
+    "/user/password/reset/token": {"ip": RateLimit(10, 60), "email": RateLimit(3, 60)},
+    # emailpassword and passwordless
+    "/signup/email/exists": {"ip": RateLimit(30, 60)},
+    # passwordless
+    "/signinup/code": {
+        "ip": RateLimit(10, 60),
+        "email": RateLimit(3, 60),
+        "phone_number": RateLimit(3, 60),
+    },
+    "/signinup/code/resend": {"ip": RateLimit(10, 60)},
+    "/signup/phonenumber/exists": {"ip": RateLimit(30, 60)},
+}
+
+
+class RateLimiterStore(ABC):
+    """
+    Holds the token buckets. Implement this to share the limits between
+    processes, for example with redis.
+    """
+
+    @abstractmethod
+    async def consume(
+        self, buckets: List[Tuple[str, RateLimit]], user_context: Dict[str, Any]
+    ) -> float:
+        """
+        Takes a token from each of the given buckets (key and limit) if all of
+        them have one, and returns 0. Otherwise no token is taken, and the number
+        of seconds until all of them have one is returned.
+        """
+
+
+class _TokenBucket:
+    def __init__(self, tokens: float, updated_at: float):
+        self.tokens = tokens
+        self.updated_at = updated_at
+
+
+class _Shard:
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self.buckets: OrderedDict[str, _TokenBucket] = OrderedDict()
+        self.lock = threading.Lock()
+
+
+class InMemoryRateLimiterStore(RateLimiterStore):
+    """
+    Keeps the buckets of this process in memory. The keys are split between
+    `shard_count` shards with their own lock, and each shard forgets its least
+    recently used keys once it holds more than max_keys / shard_count of them.
+    A forgotten key starts again with a full bucket.
+    """
+
+    def __init__(self, max_keys: int = 100000, shard_count: int = 16):
+        shard_size = max(1, max_keys // shard_count)
+        self._shards = [_Shard(shard_size) for _ in range(shard_count)]
+
+    async def consume(
+        self, buckets: List[Tuple[str, RateLimit]], user_context: Dict[str, Any]
+    ) -> float:
+        shard_indexes = sorted({hash(key) % len(self._shards) for key, _ in buckets})
+        now = monotonic()
+        # The shard locks are always taken in the same order, so that requests
+        # checking the same shards can't deadlock
+        with ExitStack() as stack:
+            for index in shard_indexes:
+                stack.enter_context(self._shards[index].lock)
+
+            refilled = [
+                (self._get_refilled_bucket(key, rate_limit, now), rate_limit)
+                for key, rate_limit in buckets
+            ]
+            retry_after = max(
+                [
+                    (1 - bucket.tokens) / rate_limit.refill_per_second
+                    for bucket, rate_limit in refilled
+                    if bucket.tokens < 1
+                ],
+                default=0,
+            )
+            if retry_after == 0:
+                for bucket, _ in refilled:
+                    bucket.tokens -= 1
+            return retry_after
+
+    def _get_refilled_bucket(
+        self, key: str, rate_limit: RateLimit, now: float
+    ) -> _TokenBucket:
+        shard = self._shards[hash(key) % len(self._shards)]
+        bucket = shard.buckets.get(key)
+        if bucket is None:
+            bucket = _TokenBucket(rate_limit.max_requests, now)
+            shard.buckets[key] = bucket
+            if len(shard.buckets) > shard.max_size:
+                shard.buckets.popitem(last=False)
+            return bucket
+
+        shard.buckets.move_to_end(key)
+        bucket.tokens = min(
+            rate_limit.max_requests,
+            bucket.tokens + (now - bucket.updated_at) * rate_limit.refill_per_second,
+        )
+        bucket.updated_at = now
+        return bucket
+
+
+class RateLimiter:
+    """
+    Limits the requests to the APIs of the SDK before they are handled, so that
+    a limited request never reaches the core or an email / SMS service.
+
+    `limits` maps API ids (for example "/signin") to the limits of each key:
+    - "ip": the address returned by `get_client_ip`, which defaults to the
+      address of the client as seen by the server. Pass a function that reads
+      the forwarded headers you trust if the app runs behind a proxy.
+    - "email" and "phone_number": read from the query params or the JSON body
+      (including emailpassword's formFields). Requests without them are not
+      limited by these keys.
+    - "tenant": the tenant of the request.
+    """
+
+    def __init__(
+        self,
+        limits: Optional[Dict[str, Dict[RateLimitKey, RateLimit]]] = None,
+        store: Optional[RateLimiterStore] = None,
+        get_client_ip: Optional[Callable[[BaseRequest], Union[str, None]]] = None,
+    ):
+        self.limits = DEFAULT_RATE_LIMITS if limits is None else limits
+        self.store = InMemoryRateLimiterStore() if store is None else store
+        self.get_client_ip = (
+            (lambda request: request.get_client_ip())
+            if get_client_ip is None
+            else get_client_ip
+        )
+
+    async def get_key_values(
+        self,
+        keys: List[RateLimitKey],
+        tenant_id: str,
+        request: BaseRequest,
+    ) -> Dict[RateLimitKey, Union[str, None]]:
+        values: Dict[RateLimitKey, Union[str, None]] = {}
+        if "ip" in keys:
+            values["ip"] = self.get_client_ip(request)
+        if "tenant" in keys:
+            values["tenant"] = tenant_id
+        if "email" in keys or "phone_number" in keys:
+            email = request.get_query_param("email")
+            phone_number = request.get_query_param("phoneNumber")
+            if request.method().lower() == "post":
+                body: Any = await request.json()
+                if isinstance(body, dict):
+                    email = _get_str(body.get("email"), email)  # type: ignore
+                    phone_number = _get_str(body.get("phoneNumber"), phone_number)  # type: ignore
+                    form_fields: Any = body.get("formFields")  # type: ignore
+                    if isinstance(form_fields, list):
+                        for field in form_fields:  # type: ignore
+                            if isinstance(field, dict) and field.get("id") == "email":  # type: ignore
+                                email = _get_str(field.get("value"), email)  # type: ignore
+            values["email"] = None if email is None else email.strip().lower()
+            values["phone_number"] = (
+                None if phone_number is None else phone_number.replace(" ", "")
+            )
+        return values
+
+    async def check(
+        self,
+        api_id: str,
+        tenant_id: str,
+        request: BaseRequest,
+        user_context: Dict[str, Any],
+    ) -> float:
+        """
+        Returns 0 if the request can be handled, or else the number of seconds
+        after which it can be retried.
+        """
+        limits = self.limits.get(api_id)
+        if limits is None:
+            return 0
+
+        values = await self.get_key_values(list(limits.keys()), tenant_id, request)
+        buckets: List[Tuple[str, RateLimit]] = []
+        for key, rate_limit in limits.items():
+            value = values.get(key)
+            if value is None or value == "":
+                continue
+            buckets.append((api_id + "|" + key + "|" + value, rate_limit))
+        if len(buckets) == 0:
+            return 0
+        # All the buckets are consumed together, so a request limited by one of
+        # its keys doesn't use up the budget of the others
+        return await self.store.consume(buckets, user_context)
+
+
+def _get_str(value: Any, default: Union[str, None]) -> Union[str, None]:
+    return value if isinstance(value, str) else default
@@ -14,24 +14,70 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Dict, Any
-
-from httpx import AsyncClient
+import asyncio
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Dict, Tuple, Union
 
 from supertokens_python import Supertokens
+from supertokens_python.async_to_sync_wrapper import sync
 from supertokens_python.constants import (
     TELEMETRY_SUPERTOKENS_API_URL,
     TELEMETRY_SUPERTOKENS_API_VERSION,
 )
 from supertokens_python.constants import VERSION as SDKVersion
 from supertokens_python.exceptions import raise_bad_input_exception
+from supertokens_python.logger import Lazy, log_debug_message
 from supertokens_python.normalised_url_path import NormalisedURLPath
 from supertokens_python.querier import Querier
-
+from supertokens_python.utils import TTLCache, get_timestamp_ms
+
+from ..constants import (
+    ANALYTICS_DEDUPE_MAX_KEYS,
+    ANALYTICS_DEDUPE_WINDOW_MS,
+    ANALYTICS_MAX_PENDING_EVENTS,
+    ANALYTICS_TIMEOUT_SECONDS,
+    ANALYTICS_USER_COUNT_CACHE_MAX_AGE_MS,
+)
 from ..interfaces import AnalyticsResponse
 
 if TYPE_CHECKING:
     from supertokens_python.recipe.dashboard.interfaces import APIInterface, APIOptions
+    from supertokens_python.supertokens import AppInfo
+
+# (email, dashboard version) pairs whose event was sent in the dedupe window
+sent_events: TTLCache[Tuple[str, str], bool] = TTLCache(
+    ANALYTICS_DEDUPE_MAX_KEYS, ANALYTICS_DEDUPE_WINDOW_MS
+)
+# (user count, time at which it was fetched)
+cached_user_count: Union[Tuple[int, int], None] = None
+# Events being sent, by (email, dashboard version)
+pending_events: Dict[Tuple[str, str], Future[None]] = {}
+pending_events_lock = threading.Lock()
+# The events are sent from a worker thread (on its own event loop, or on the
+# background event loop if it's running), since the loop of the request may
+# stop as soon as the response is sent in wsgi mode
+_executor: Union[ThreadPoolExecutor, None] = None
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="supertokens-analytics"
+        )
+    return _executor
+
+
+# only for testing purposes
+def reset_analytics_state():
+    global cached_user_count
+    sent_events.clear()
+    cached_user_count = None
+    with pending_events_lock:
+        for event in pending_events.values():
+            event.cancel()
+        pending_events.clear()
 
 
 async def handle_analytics_post(
@@ -53,32 +99,91 @@ async def handle_analytics_post(
     if dashboard_version is None:
         raise_bad_input_exception("Missing required property 'dashboardVersion'")
 
-    telemetry_id = None
+    # The event is sent in the background, so the dashboard doesn't have to
+    # wait for the user count and the telemetry service.
+    key = (email, dashboard_version)
+    if sent_events.get(key) is not None:
+        return AnalyticsResponse()
 
-    try:
-        response = await Querier.get_instance().send_get_request(
-            NormalisedURLPath("/telemetry")
+    with pending_events_lock:
+        if key in pending_events:
+            return AnalyticsResponse()
+        if len(pending_events) >= ANALYTICS_MAX_PENDING_EVENTS:
+            log_debug_message("Dropping dashboard analytics event, too many pending")
+            return AnalyticsResponse()
+
+        event = _get_executor().submit(
+            run_analytics_event, api_options.app_info, email, dashboard_version
         )
-        if response is not None:
-            if (
-                "exists" in response
-                and response["exists"]
-                and "telemetryId" in response
-            ):
-                telemetry_id = response["telemetryId"]
-
-        number_of_users = await Supertokens.get_instance().get_user_count(
-            include_recipe_ids=None
+        pending_events[key] = event
+
+    event.add_done_callback(lambda e: on_analytics_event_done(key, e))
+
+    return AnalyticsResponse()
+
+
+def run_analytics_event(app_info: AppInfo, email: str, dashboard_version: str):
+    sync(
+        asyncio.wait_for(
+            send_analytics_event(app_info, email, dashboard_version),
+            ANALYTICS_TIMEOUT_SECONDS,
         )
+    )
 
-    except Exception as __:
-        # If either telemetry id API or user count fetch fails, no event should be sent
-        return AnalyticsResponse()
+
+def on_analytics_event_done(key: Tuple[str, str], event: Future[None]):
+    if not event.cancelled():
+        if event.exception() is None:
+            sent_events.put(key, True)
+        else:
+            # If telemetry event fails, no error should be thrown. The event is
+            # not recorded as sent, so the next call retries it.
+            log_debug_message(
+                "Sending dashboard analytics failed: %s",
+                Lazy(lambda: str(event.exception())),
+            )
+    with pending_events_lock:
+        if pending_events.get(key) is event:
+            del pending_events[key]
+
+
+async def get_user_count() -> int:
+    global cached_user_count
+    if (
+        cached_user_count is not None
+        and get_timestamp_ms() - cached_user_count[1]
+        < ANALYTICS_USER_COUNT_CACHE_MAX_AGE_MS
+    ):
+        return cached_user_count[0]
+
+    number_of_users = await Supertokens.get_instance().get_user_count(
+        include_recipe_ids=None
+    )
+    cached_user_count = (number_of_users, get_timestamp_ms())
+    return number_of_users
+
+
+async def send_analytics_event(
+    app_info: AppInfo, email: str, dashboard_version: str
+) -> None:
+    from httpx import AsyncClient
+
+    telemetry_id = None
+
+    # If either telemetry id API or user count fetch fails, no event should be sent
+    response = await Querier.get_instance().send_get_request(
+        NormalisedURLPath("/telemetry")
+    )
+    if response is not None:
+        if "exists" in response and response["exists"] and "telemetryId" in response:
+            telemetry_id = response["telemetryId"]
+
+    number_of_users = await get_user_count()
 
     apiDomain, websiteDomain, appName = (
-        api_options.app_info.api_domain,
-        api_options.app_info.website_domain,
-        api_options.app_info.app_name,
+        app_info.api_domain,
+        app_info.website_domain,
+        app_info.app_name,
     )
 
     data = {
@@ -95,15 +200,9 @@ async def handle_analytics_post(
     if telemetry_id is not None:
         data["telemetryId"] = telemetry_id
 
-    try:
-        async with AsyncClient() as client:
-            await client.post(  # type: ignore
-                url=TELEMETRY_SUPERTOKENS_API_URL,
-                json=data,
-                headers={"api-version": TELEMETRY_SUPERTOKENS_API_VERSION},
-            )
-    except Exception as __:
-        # If telemetry event fails, no error should be thrown
-        pass
-
-    return AnalyticsResponse()
+    async with AsyncClient() as client:
+        await client.post(  # type: ignore
+            url=TELEMETRY_SUPERTOKENS_API_URL,
+            json=data,
+            headers={"api-version": TELEMETRY_SUPERTOKENS_API_VERSION},
+        )
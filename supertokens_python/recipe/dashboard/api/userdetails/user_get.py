@@ -1,3 +1,4 @@
+import asyncio
 from typing import Union, Dict, Any
 
 from supertokens_python.exceptions import raise_bad_input_exception
@@ -40,21 +41,41 @@ async def handle_user_get(
     if not is_recipe_initialised(recipe_id):
         return UserGetAPIRecipeNotInitialisedError()
 
-    user_response = await get_user_for_recipe_id(user_id, recipe_id)
-    if user_response is None:
-        return UserGetAPINoUserFoundError()
-
-    user = user_response.user
-
     try:
         UserMetadataRecipe.get_instance()
+        is_metadata_recipe_initialised = True
     except Exception:
+        is_metadata_recipe_initialised = False
+
+    if not is_metadata_recipe_initialised:
+        user_response = await get_user_for_recipe_id(user_id, recipe_id)
+        if user_response is None:
+            return UserGetAPINoUserFoundError()
+
+        user = user_response.user
         user.first_name = "FEATURE_NOT_ENABLED"
         user.last_name = "FEATURE_NOT_ENABLED"
 
         return UserGetAPIOkResponse(recipe_id, user)
 
-    user_metadata = await get_user_metadata(user_id, user_context=_user_context)
+    # The metadata does not depend on the user lookup, so both are fetched
+    # concurrently. The metadata is discarded if the user does not exist.
+    metadata_task = asyncio.ensure_future(
+        get_user_metadata(user_id, user_context=_user_context)
+    )
+    try:
+        user_response = await get_user_for_recipe_id(user_id, recipe_id)
+    except BaseException:
+        metadata_task.cancel()
+        raise
+
+    if user_response is None:
+        metadata_task.cancel()
+        return UserGetAPINoUserFoundError()
+
+    user = user_response.user
+
+    user_metadata = await metadata_task
     first_name = user_metadata.metadata.get("first_name", "")
     last_name = user_metadata.metadata.get("last_name", "")
 
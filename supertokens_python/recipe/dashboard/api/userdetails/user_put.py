@@ -321,35 +321,36 @@ async def handle_user_put(
             "Required parameter 'phone' is missing or has an invalid type"
         )
 
-    user_response = await get_user_for_recipe_id(user_id, recipe_id)
-
-    if user_response is None:
-        raise Exception("Should never come here")
-
     first_name = first_name.strip()
     last_name = last_name.strip()
     email = email.strip()
     phone = phone.strip()
 
-    if first_name != "" or last_name != "":
-        is_recipe_initialized = False
+    async def update_name_in_metadata():
+        if first_name == "" and last_name == "":
+            return
 
         try:
             UserMetadataRecipe.get_instance()
-            is_recipe_initialized = True
         except Exception:
-            pass
+            return
+
+        metadata_update = {}
 
-        if is_recipe_initialized:
-            metadata_update = {}
+        if first_name != "":
+            metadata_update["first_name"] = first_name
 
-            if first_name != "":
-                metadata_update["first_name"] = first_name
+        if last_name != "":
+            metadata_update["last_name"] = last_name
 
-            if last_name != "":
-                metadata_update["last_name"] = last_name
+        await update_user_metadata(user_id, metadata_update, user_context)
+
+    user_response = await get_user_for_recipe_id(user_id, recipe_id)
+
+    if user_response is None:
+        raise Exception("Should never come here")
 
-            await update_user_metadata(user_id, metadata_update, user_context)
+    await update_name_in_metadata()
 
     if email != "":
         email_update_response = await update_email_for_recipe_id(
@@ -13,3 +13,11 @@ EMAIL_PASSSWORD_SIGNOUT = "/api/signout"
 SEARCH_TAGS_API = "/api/search/tags"
 DASHBOARD_ANALYTICS_API = "/api/analytics"
 TENANTS_LIST_API = "/api/tenants/list"
+
+# Analytics are sent at most once per email and dashboard version in this window
+ANALYTICS_DEDUPE_WINDOW_MS = 60 * 60 * 1000  # 1h
+ANALYTICS_USER_COUNT_CACHE_MAX_AGE_MS = 60 * 60 * 1000  # 1h
+ANALYTICS_TIMEOUT_SECONDS = 5
+ANALYTICS_MAX_PENDING_EVENTS = 10
+# Number of (email, dashboard version) pairs remembered for the dedupe window
+ANALYTICS_DEDUPE_MAX_KEYS = 1000
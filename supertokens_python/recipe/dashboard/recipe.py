@@ -42,6 +42,7 @@ from .api import (
     handle_validate_key_api,
     handle_list_tenants_api,
 )
+from .api.analytics import reset_analytics_state
 from .api.implementation import APIImplementation
 from .exceptions import SuperTokensDashboardError
 from .interfaces import APIInterface, APIOptions
@@ -382,4 +383,5 @@ class DashboardRecipe(RecipeModule):
             environ["SUPERTOKENS_ENV"] != "testing"
         ):
             raise_general_exception("calling testing function in non testing env")
+        reset_analytics_state()
         DashboardRecipe.__instance = None
@@ -13,6 +13,7 @@
 # under the License.
 from __future__ import annotations
 
+import asyncio
 from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Union, List
 
 if TYPE_CHECKING:
@@ -291,67 +292,75 @@ if TYPE_CHECKING:
 async def get_user_for_recipe_id(
     user_id: str, recipe_id: str
 ) -> Optional[GetUserForRecipeIdResult]:
-    user: Optional[UserWithMetadata] = None
-    recipe: Optional[str] = None
+    async def get_user_or_none(
+        get_user_func: Callable[[str], Awaitable[GetUserResult]], recipe: str
+    ) -> Optional[GetUserForRecipeIdResult]:
+        try:
+            recipe_user = await get_user_func(user_id)  # type: ignore
+        except Exception:
+            return None
+
+        if recipe_user is None:
+            return None
+
+        return GetUserForRecipeIdResult(
+            UserWithMetadata().from_dict(
+                recipe_user.__dict__, first_name="", last_name=""
+            ),
+            recipe,
+        )
 
-    async def update_user_dict(
+    async def get_user_from_either_recipe(
         get_user_func1: Callable[[str], Awaitable[GetUserResult]],
         get_user_func2: Callable[[str], Awaitable[GetUserResult]],
         recipe1: str,
         recipe2: str,
-    ):
-        nonlocal user, user_id, recipe
-
+    ) -> Optional[GetUserForRecipeIdResult]:
+        # A user id belongs to exactly one recipe, so both recipes are queried
+        # concurrently and the first one that finds the user wins. The other
+        # lookup is cancelled since its result is not needed anymore.
+        pending = {
+            asyncio.ensure_future(get_user_or_none(get_user_func1, recipe1)),
+            asyncio.ensure_future(get_user_or_none(get_user_func2, recipe2)),
+        }
         try:
-            recipe_user = await get_user_func1(user_id)  # type: ignore
-
-            if recipe_user is not None:
-                user = UserWithMetadata().from_dict(
-                    recipe_user.__dict__, first_name="", last_name=""
+            while len(pending) > 0:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
                 )
-                recipe = recipe1
-        except Exception:
-            pass
-
-        if user is None:
-            try:
-                recipe_user = await get_user_func2(user_id)
-
-                if recipe_user is not None:
-                    user = UserWithMetadata().from_dict(
-                        recipe_user.__dict__, first_name="", last_name=""
-                    )
-                    recipe = recipe2
-            except Exception:
-                pass
+                for task in done:
+                    result = task.result()
+                    if result is not None:
+                        return result
+            return None
+        finally:
+            for task in pending:
+                task.cancel()
 
     if recipe_id == EmailPasswordRecipe.recipe_id:
-        await update_user_dict(
+        return await get_user_from_either_recipe(
             ep_get_user_by_id,
             tpep_get_user_by_id,
             "emailpassword",
             "thirdpartyemailpassword",
         )
 
-    elif recipe_id == ThirdPartyRecipe.recipe_id:
-        await update_user_dict(
+    if recipe_id == ThirdPartyRecipe.recipe_id:
+        return await get_user_from_either_recipe(
             tp_get_user_by_idx,
             tpep_get_user_by_id,
             "thirdparty",
             "thirdpartyemailpassword",
         )
 
-    elif recipe_id == PasswordlessRecipe.recipe_id:
-        await update_user_dict(
+    if recipe_id == PasswordlessRecipe.recipe_id:
+        return await get_user_from_either_recipe(
             pless_get_user_by_id,
             tppless_get_user_by_id,
             "passwordless",
             "thirdpartypasswordless",
         )
 
-    if user is not None and recipe is not None:
-        return GetUserForRecipeIdResult(user, recipe)
-
     return None
 
 
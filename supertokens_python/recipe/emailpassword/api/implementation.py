@@ -16,6 +16,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Any, Dict, List, Union
 
 from supertokens_python.logger import log_debug_message
+from supertokens_python.metrics import get_metrics_collector
 from supertokens_python.recipe.emailpassword.constants import (
     FORM_FIELD_EMAIL_ID,
     FORM_FIELD_PASSWORD_ID,
@@ -40,7 +41,11 @@ from supertokens_python.recipe.emailpassword.types import (
     PasswordResetEmailTemplateVars,
     PasswordResetEmailTemplateVarsUser,
 )
-from ..utils import get_password_reset_link
+from ..utils import (
+    email_exists_cache,
+    get_email_exists_cache_key,
+    get_password_reset_link,
+)
 from supertokens_python.recipe.session.asyncio import create_new_session
 from supertokens_python.utils import find_first_occurrence_in_list
 
@@ -58,10 +63,16 @@ class APIImplementation(APIInterface):
         api_options: APIOptions,
         user_context: Dict[str, Any],
     ) -> Union[EmailExistsGetOkResult, GeneralErrorResponse]:
-        user = await api_options.recipe_implementation.get_user_by_email(
-            email, tenant_id, user_context
-        )
-        return EmailExistsGetOkResult(user is not None)
+        cache_key = get_email_exists_cache_key(tenant_id, email)
+        exists = email_exists_cache.get(cache_key)
+        get_metrics_collector().record_cache_lookup("email_exists", exists is not None)
+        if exists is None:
+            user = await api_options.recipe_implementation.get_user_by_email(
+                email, tenant_id, user_context
+            )
+            exists = user is not None
+            email_exists_cache.put(cache_key, exists)
+        return EmailExistsGetOkResult(exists)
 
     async def generate_password_reset_token_post(
         self,
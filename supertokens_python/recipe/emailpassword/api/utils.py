@@ -13,7 +13,8 @@
 # under the License.
 from __future__ import annotations
 
-from typing import Any, Dict, List, Union
+from asyncio import gather
+from typing import Any, Awaitable, Dict, List, Union
 
 from supertokens_python.exceptions import raise_bad_input_exception
 from supertokens_python.recipe.emailpassword.constants import FORM_FIELD_EMAIL_ID
@@ -25,7 +26,7 @@ from supertokens_python.recipe.emailpassword.types import (
     FormField,
     NormalisedFormField,
 )
-from supertokens_python.utils import find_first_occurrence_in_list
+from supertokens_python.recipe.emailpassword.utils import default_validators_sync
 
 
 async def validate_form_or_throw_error(
@@ -33,24 +34,53 @@ async def validate_form_or_throw_error(
     config_form_fields: List[NormalisedFormField],
     tenant_id: str,
 ):
-    validation_errors: List[ErrorFormField] = []
+    validation_errors: Dict[str, str] = {}
     if len(config_form_fields) != len(inputs):
         raise_bad_input_exception("Are you sending too many / too few formFields?")
 
+    input_values: Dict[str, Any] = {}
+    for input_field in reversed(inputs):
+        # the first input with an id wins
+        input_values[input_field.id] = input_field.value
+
+    async_fields: List[NormalisedFormField] = []
+    async_validations: List[Awaitable[Union[str, None]]] = []
     for field in config_form_fields:
-        input_field: Union[None, FormField] = find_first_occurrence_in_list(
-            lambda x: x.id == field.id, inputs
-        )
-        if input_field is None or (input_field.value == "" and not field.optional):
-            validation_errors.append(ErrorFormField(field.id, "Field is not optional"))
-        else:
-            error = await field.validate(input_field.value, tenant_id)
+        if field.id not in input_values or (
+            input_values[field.id] == "" and not field.optional
+        ):
+            validation_errors[field.id] = "Field is not optional"
+            continue
+
+        # The default validators are run directly, and the other ones are
+        # awaited together below
+        validate_sync = default_validators_sync.get(field.validate)
+        if validate_sync is not None:
+            error = validate_sync(input_values[field.id])
             if error is not None:
-                validation_errors.append(ErrorFormField(field.id, error))
+                validation_errors[field.id] = error
+        else:
+            async_fields.append(field)
+            async_validations.append(field.validate(input_values[field.id], tenant_id))
+
+    if len(async_validations) == 1:
+        async_errors = [await async_validations[0]]
+    else:
+        async_errors = await gather(*async_validations)
+    for field, error in zip(async_fields, async_errors):
+        if error is not None:
+            validation_errors[field.id] = error
 
     if len(validation_errors) != 0:
         # raise BadInputError(msg="Error in input formFields")
-        raise_form_field_exception("Error in input formFields", validation_errors)
+        raise_form_field_exception(
+            "Error in input formFields",
+            [
+                ErrorFormField(field.id, validation_errors[field.id])
+                for field in config_form_fields
+                if field.id in validation_errors
+            ],
+        )
 
 
 async def validate_form_fields_or_throw_error(
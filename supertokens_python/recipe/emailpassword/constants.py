@@ -19,3 +19,6 @@ USER_PASSWORD_RESET_TOKEN = "/user/password/reset/token"
 USER_PASSWORD_RESET = "/user/password/reset"
 SIGNUP_EMAIL_EXISTS = "/signup/email/exists"
 RESET_PASSWORD = "/reset-password"
+# The email exists API remembers its result for this long for each tenant and email
+EMAIL_EXISTS_CACHE_TTL_MS = 10000
+EMAIL_EXISTS_CACHE_MAX_SIZE = 10000
@@ -62,6 +62,7 @@ from .constants import (
 from .utils import (
     InputOverrideConfig,
     InputSignUpFeature,
+    email_exists_cache,
     validate_and_normalise_user_input,
     EmailPasswordConfig,
 )
@@ -257,6 +258,7 @@ class EmailPasswordRecipe(RecipeModule):
             environ["SUPERTOKENS_ENV"] != "testing"
         ):
             raise_general_exception("calling testing function in non testing env")
+        email_exists_cache.clear()
         EmailPasswordRecipe.__instance = None
 
     # instance functions below...............
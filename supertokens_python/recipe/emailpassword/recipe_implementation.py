@@ -16,6 +16,11 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Any, Dict, Union, Callable
 
 from supertokens_python.normalised_url_path import NormalisedURLPath
+from supertokens_python.utils import (
+    get_request_memo,
+    get_request_memo_version,
+    invalidate_request_memos,
+)
 
 from .interfaces import (
     CreateResetPasswordOkResult,
@@ -33,12 +38,19 @@ from .interfaces import (
     UpdateEmailOrPasswordPasswordPolicyViolationError,
 )
 from .types import User
-from .utils import EmailPasswordConfig
+from .utils import (
+    EmailPasswordConfig,
+    email_exists_cache,
+    get_email_exists_cache_key,
+)
 from .constants import FORM_FIELD_PASSWORD_ID
 
 if TYPE_CHECKING:
     from supertokens_python.querier import Querier
 
+USER_BY_ID_MEMO = "emailpassword.user_by_id"
+USER_BY_EMAIL_MEMO = "emailpassword.user_by_email"
+
 
 class RecipeImplementation(RecipeInterface):
     def __init__(
@@ -53,34 +65,50 @@ class RecipeImplementation(RecipeInterface):
     async def get_user_by_id(
         self, user_id: str, user_context: Dict[str, Any]
     ) -> Union[User, None]:
+        memo = get_request_memo(user_context, USER_BY_ID_MEMO)
+        if memo is not None and user_id in memo:
+            return memo[user_id]
+
+        version = get_request_memo_version()
         params = {"userId": user_id}
         response = await self.querier.send_get_request(
             NormalisedURLPath("/recipe/user"), params
         )
+        user = None
         if "status" in response and response["status"] == "OK":
-            return User(
+            user = User(
                 response["user"]["id"],
                 response["user"]["email"],
                 response["user"]["timeJoined"],
                 response["user"]["tenantIds"],
             )
-        return None
+        if memo is not None:
+            memo.put(user_id, user, version)
+        return user
 
     async def get_user_by_email(
         self, email: str, tenant_id: str, user_context: Dict[str, Any]
     ) -> Union[User, None]:
+        memo = get_request_memo(user_context, USER_BY_EMAIL_MEMO)
+        if memo is not None and (tenant_id, email) in memo:
+            return memo[(tenant_id, email)]
+
+        version = get_request_memo_version()
         params = {"email": email}
         response = await self.querier.send_get_request(
             NormalisedURLPath(f"{tenant_id}/recipe/user"), params
         )
+        user = None
         if "status" in response and response["status"] == "OK":
-            return User(
+            user = User(
                 response["user"]["id"],
                 response["user"]["email"],
                 response["user"]["timeJoined"],
                 response["user"]["tenantIds"],
             )
-        return None
+        if memo is not None:
+            memo.put((tenant_id, email), user, version)
+        return user
 
     async def create_reset_password_token(
         self, user_id: str, tenant_id: str, user_context: Dict[str, Any]
@@ -139,6 +167,8 @@ class RecipeImplementation(RecipeInterface):
             NormalisedURLPath(f"{tenant_id}/recipe/signup"), data
         )
         if "status" in response and response["status"] == "OK":
+            email_exists_cache.put(get_email_exists_cache_key(tenant_id, email), True)
+            invalidate_request_memos(USER_BY_EMAIL_MEMO, [(tenant_id, email)])
             return SignUpOkResult(
                 User(
                     response["user"]["id"],
@@ -184,6 +214,11 @@ class RecipeImplementation(RecipeInterface):
             NormalisedURLPath("/recipe/user"), data
         )
         if "status" in response and response["status"] == "OK":
+            if email is not None:
+                # The previous email of the user is not known here
+                email_exists_cache.clear()
+                invalidate_request_memos(USER_BY_ID_MEMO, [user_id])
+                invalidate_request_memos(USER_BY_EMAIL_MEMO)
             return UpdateEmailOrPasswordOkResult()
         if "status" in response and response["status"] == "EMAIL_ALREADY_EXISTS_ERROR":
             return UpdateEmailOrPasswordEmailAlreadyExistsError()
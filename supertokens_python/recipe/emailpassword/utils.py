@@ -13,8 +13,8 @@
 # under the License.
 from __future__ import annotations
 
-from re import fullmatch
-from typing import TYPE_CHECKING, Any, Callable, List, Union
+import re
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, List, Tuple, Union
 
 from supertokens_python.ingredients.emaildelivery.types import (
     EmailDeliveryConfig,
@@ -30,19 +30,38 @@ from .types import InputFormField, NormalisedFormField, EmailTemplateVars
 if TYPE_CHECKING:
     from supertokens_python.supertokens import AppInfo
 
-from supertokens_python.utils import get_filtered_list
+from supertokens_python.utils import TTLCache, get_filtered_list
 
 from .constants import (
     FORM_FIELD_EMAIL_ID,
+    EMAIL_EXISTS_CACHE_MAX_SIZE,
+    EMAIL_EXISTS_CACHE_TTL_MS,
     FORM_FIELD_PASSWORD_ID,
 )
 
+# Whether an email is used by an emailpassword user, by tenant id and
+# normalised email. It is set on sign up and cleared when an email is updated.
+# Users deleted or created by other processes are noticed once the entry expires.
+email_exists_cache: TTLCache[Tuple[str, str], bool] = TTLCache(
+    EMAIL_EXISTS_CACHE_MAX_SIZE, EMAIL_EXISTS_CACHE_TTL_MS
+)
 
-async def default_validator(_: str, __: str) -> Union[str, None]:
-    return None
 
+def get_email_exists_cache_key(tenant_id: str, email: str) -> Tuple[str, str]:
+    # The core compares emails after trimming and lowercasing them
+    return (tenant_id, email.strip().lower())
 
-async def default_password_validator(value: str, _tenant_id: str) -> Union[str, None]:
+
+# Regex from https://stackoverflow.com/a/46181/3867175
+EMAIL_PATTERN = re.compile(
+    r'^(([^<>()\[\]\\.,;:\s@"]+(\.[^<>()\[\]\\.,;:\s@"]+)*)|(".+"))@((\[[0-9]{1,3}\.[0-9]{1,3}\.[0-9]{1,'
+    r"3}\.[0-9]{1,3}\])|(([a-zA-Z\-0-9]+\.)+[a-zA-Z]{2,}))$"
+)
+ALPHABET_PATTERN = re.compile(r"[A-Za-z]")
+NUMBER_PATTERN = re.compile(r"[0-9]")
+
+
+def validate_password(value: str) -> Union[str, None]:
     # length >= 8 && < 100
     # must have a number and a character
     # as per
@@ -53,32 +72,51 @@ async def default_password_validator(value: str, _tenant_id: str) -> Union[str,
     if len(value) >= 100:
         return "Password's length must be lesser than 100 characters"
 
-    if fullmatch(r"^.*[A-Za-z]+.*$", value) is None:
+    # A search for a single character instead of matching the whole password.
+    # Passwords with a line break are still rejected, as they never matched
+    # the original ^.*[A-Za-z]+.*$ pattern
+    if "\n" in value or ALPHABET_PATTERN.search(value) is None:
         return "Password must contain at least one alphabet"
 
-    if fullmatch(r"^.*[0-9]+.*$", value) is None:
+    if NUMBER_PATTERN.search(value) is None:
         return "Password must contain at least one number"
 
     return None
 
 
-async def default_email_validator(value: Any, _tenant_id: str) -> Union[str, None]:
+def validate_email(value: Any) -> Union[str, None]:
     # We check if the email syntax is correct
     # As per https://github.com/supertokens/supertokens-auth-react/issues/5#issuecomment-709512438
-    # Regex from https://stackoverflow.com/a/46181/3867175
-    if (not isinstance(value, str)) or (
-        fullmatch(
-            r'^(([^<>()\[\]\\.,;:\s@"]+(\.[^<>()\[\]\\.,;:\s@"]+)*)|(".+"))@((\[[0-9]{1,3}\.[0-9]{1,3}\.[0-9]{1,'
-            r"3}\.[0-9]{1,3}\])|(([a-zA-Z\-0-9]+\.)+[a-zA-Z]{2,}))$",
-            value,
-        )
-        is None
-    ):
+    if (not isinstance(value, str)) or EMAIL_PATTERN.fullmatch(value) is None:
         return "Email is not valid"
 
     return None
 
 
+async def default_validator(_: str, __: str) -> Union[str, None]:
+    return None
+
+
+async def default_password_validator(value: str, _tenant_id: str) -> Union[str, None]:
+    return validate_password(value)
+
+
+async def default_email_validator(value: Any, _tenant_id: str) -> Union[str, None]:
+    return validate_email(value)
+
+
+# Synchronous versions of the default validators, so that validating a form
+# with them does not create a coroutine for each field
+default_validators_sync: Dict[
+    Callable[[Any, str], Awaitable[Union[str, None]]],
+    Callable[[Any], Union[str, None]],
+] = {
+    default_validator: lambda _: None,
+    default_password_validator: validate_password,
+    default_email_validator: validate_email,
+}
+
+
 class InputSignUpFeature:
     def __init__(self, form_fields: Union[List[InputFormField], None] = None):
         if form_fields is None:
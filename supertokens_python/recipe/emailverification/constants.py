@@ -13,3 +13,6 @@
 # under the License.
 USER_EMAIL_VERIFY_TOKEN = "/user/email/verify/token"
 USER_EMAIL_VERIFY = "/user/email/verify"
+
+# Max number of user ids for which the recipe that owns them is remembered
+USER_ID_OWNER_CACHE_SIZE = 10000
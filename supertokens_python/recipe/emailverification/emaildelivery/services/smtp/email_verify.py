@@ -20,8 +20,6 @@ from supertokens_python.recipe.emailverification.types import (
 )
 from supertokens_python.supertokens import Supertokens
 
-from .email_verify_email import html_template
-
 
 def get_email_verify_email_content(
     email_input: VerificationEmailTemplateVars,
@@ -37,6 +35,9 @@ def get_email_verify_email_content(
 
 
 def get_email_verify_email_html(app_name: str, email: str, verification_link: str):
+    # The template is large, so it is only loaded once an email is sent
+    from .email_verify_email import html_template
+
     return Template(html_template).substitute(
         appname=app_name, verificationLink=verification_link, toEmail=email
     )
@@ -33,7 +33,7 @@ from ...ingredients.emaildelivery.types import EmailDeliveryConfig
 from ...logger import log_debug_message
 from ...post_init_callbacks import PostSTInitCallbacks
 from ...types import MaybeAwaitable
-from ...utils import get_timestamp_ms
+from ...utils import LRUCache, get_timestamp_ms
 from ..session import SessionRecipe
 from ..session.claim_base_classes.boolean_claim import (
     BooleanClaim,
@@ -73,7 +73,11 @@ from supertokens_python.querier import Querier
 from supertokens_python.recipe.emailverification.utils import get_email_verify_link
 
 from .api import handle_email_verify_api, handle_generate_email_verify_token_api
-from .constants import USER_EMAIL_VERIFY, USER_EMAIL_VERIFY_TOKEN
+from .constants import (
+    USER_EMAIL_VERIFY,
+    USER_EMAIL_VERIFY_TOKEN,
+    USER_ID_OWNER_CACHE_SIZE,
+)
 from .exceptions import SuperTokensEmailVerificationError
 from .utils import MODE_TYPE, OverrideConfig, validate_and_normalise_user_input
 
@@ -129,6 +133,12 @@ class EmailVerificationRecipe(RecipeModule):
         self.get_email_for_user_id_funcs_from_other_recipes: List[
             TypeGetEmailForUserIdFunction
         ] = []
+        # user_id -> the function (of the recipe that owns the user) that
+        # resolved its email last time. A user never moves between recipes,
+        # so this only has to be dropped once the user is deleted.
+        self.user_id_owner_cache: LRUCache[
+            str, TypeGetEmailForUserIdFunction
+        ] = LRUCache(USER_ID_OWNER_CACHE_SIZE)
 
     def is_error_from_this_recipe_based_on_instance(self, err: Exception) -> bool:
         return isinstance(err, SuperTokensError) and isinstance(
@@ -264,9 +274,19 @@ class EmailVerificationRecipe(RecipeModule):
             if not isinstance(res, UnknownUserIdError):
                 return res
 
+        owner = self.user_id_owner_cache.get(user_id)
+        if owner is not None:
+            res = await owner(user_id, user_context)
+            if not isinstance(res, UnknownUserIdError):
+                return res
+            self.user_id_owner_cache.remove(user_id)
+
         for f in self.get_email_for_user_id_funcs_from_other_recipes:
+            if f is owner:
+                continue
             res = await f(user_id, user_context)
             if not isinstance(res, UnknownUserIdError):
+                self.user_id_owner_cache.put(user_id, f)
                 return res
 
         return UnknownUserIdError()
@@ -45,6 +45,7 @@ if TYPE_CHECKING:
     from .utils import MultitenancyConfig
 
 from supertokens_python.querier import NormalisedURLPath
+from supertokens_python.utils import invalidate_request_memos
 from .constants import DEFAULT_TENANT_ID
 
 
@@ -263,6 +264,9 @@ class RecipeImplementation(RecipeInterface):
         )
 
         if response["status"] == "OK":
+            # The tenant ids of the user memoised by requests are now stale. This
+            # is rare enough to drop everything requests have memoised
+            invalidate_request_memos()
             return AssociateUserToTenantOkResult(
                 was_already_associated=response["wasAlreadyAssociated"],
             )
@@ -295,6 +299,7 @@ class RecipeImplementation(RecipeInterface):
             },
         )
 
+        invalidate_request_memos()
         return DisassociateUserFromTenantOkResult(
             was_associated=response["wasAssociated"],
         )
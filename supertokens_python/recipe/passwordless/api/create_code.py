@@ -13,14 +13,13 @@
 # under the License.
 from typing import Union, Any, Dict
 
-import phonenumbers  # type: ignore
-from phonenumbers import format_number, parse  # type: ignore
 from supertokens_python.exceptions import raise_bad_input_exception
 from supertokens_python.recipe.passwordless.interfaces import APIInterface, APIOptions
 from supertokens_python.recipe.passwordless.utils import (
     ContactEmailOnlyConfig,
     ContactEmailOrPhoneConfig,
     ContactPhoneOnlyConfig,
+    parse_phone_number,
 )
 from supertokens_python.types import GeneralErrorResponse
 from supertokens_python.utils import send_200_response
@@ -101,12 +100,10 @@ async def create_code(
                 GeneralErrorResponse(validation_error).to_json()
             )
             return api_options.response
-        try:
-            phone_number_formatted: str = format_number(
-                parse(phone_number, None), phonenumbers.PhoneNumberFormat.E164
-            )  # type: ignore
+        _, phone_number_formatted = parse_phone_number(phone_number)
+        if phone_number_formatted is not None:
             phone_number = phone_number_formatted
-        except Exception:
+        else:
             phone_number = phone_number.strip()
 
     result = await api_implementation.create_code_post(
@@ -14,6 +14,7 @@
 from typing import Any, Dict, Union
 
 from supertokens_python.logger import log_debug_message
+from supertokens_python.metrics import get_metrics_collector
 from supertokens_python.recipe.passwordless.interfaces import (
     APIInterface,
     APIOptions,
@@ -40,6 +41,10 @@ from supertokens_python.recipe.passwordless.utils import (
     ContactEmailOnlyConfig,
     ContactEmailOrPhoneConfig,
     ContactPhoneOnlyConfig,
+    email_exists_cache,
+    get_email_exists_cache_key,
+    get_phone_number_exists_cache_key,
+    phone_number_exists_cache,
 )
 from supertokens_python.recipe.session.asyncio import create_new_session
 from supertokens_python.types import GeneralErrorResponse
@@ -319,10 +324,16 @@ class APIImplementation(APIInterface):
         api_options: APIOptions,
         user_context: Dict[str, Any],
     ) -> Union[EmailExistsGetOkResult, GeneralErrorResponse]:
-        response = await api_options.recipe_implementation.get_user_by_email(
-            email, tenant_id, user_context
-        )
-        return EmailExistsGetOkResult(exists=response is not None)
+        cache_key = get_email_exists_cache_key(tenant_id, email)
+        exists = email_exists_cache.get(cache_key)
+        get_metrics_collector().record_cache_lookup("email_exists", exists is not None)
+        if exists is None:
+            response = await api_options.recipe_implementation.get_user_by_email(
+                email, tenant_id, user_context
+            )
+            exists = response is not None
+            email_exists_cache.put(cache_key, exists)
+        return EmailExistsGetOkResult(exists=exists)
 
     async def phone_number_exists_get(
         self,
@@ -331,7 +342,15 @@ class APIImplementation(APIInterface):
         api_options: APIOptions,
         user_context: Dict[str, Any],
     ) -> Union[PhoneNumberExistsGetOkResult, GeneralErrorResponse]:
-        response = await api_options.recipe_implementation.get_user_by_phone_number(
-            phone_number, tenant_id, user_context
+        cache_key = get_phone_number_exists_cache_key(tenant_id, phone_number)
+        exists = phone_number_exists_cache.get(cache_key)
+        get_metrics_collector().record_cache_lookup(
+            "phone_number_exists", exists is not None
         )
-        return PhoneNumberExistsGetOkResult(exists=response is not None)
+        if exists is None:
+            response = await api_options.recipe_implementation.get_user_by_phone_number(
+                phone_number, tenant_id, user_context
+            )
+            exists = response is not None
+            phone_number_exists_cache.put(cache_key, exists)
+        return PhoneNumberExistsGetOkResult(exists=exists)
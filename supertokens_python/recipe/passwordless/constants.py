@@ -17,3 +17,9 @@ RESEND_CODE_API = "/signinup/code/resend"
 CONSUME_CODE_API = "/signinup/code/consume"
 DOES_EMAIL_EXIST_API = "/signup/email/exists"
 DOES_PHONE_NUMBER_EXIST_API = "/signup/phonenumber/exists"
+# Max number of phone numbers whose parsing result is remembered
+PHONE_NUMBER_CACHE_SIZE = 1000
+# The email and phone number exists APIs remember their result for this long
+# for each tenant and email / phone number
+EXISTS_CACHE_TTL_MS = 10000
+EXISTS_CACHE_MAX_SIZE = 10000
@@ -52,6 +52,7 @@ from .recipe_implementation import RecipeImplementation
 from .utils import (
     ContactConfig,
     OverrideConfig,
+    clear_exists_caches,
     validate_and_normalise_user_input,
 )
 from ..emailverification import EmailVerificationRecipe
@@ -288,6 +289,7 @@ class PasswordlessRecipe(RecipeModule):
             environ["SUPERTOKENS_ENV"] != "testing"
         ):
             raise_general_exception("calling testing function in non testing env")
+        clear_exists_caches()
         PasswordlessRecipe.__instance = None
 
     async def create_magic_link(
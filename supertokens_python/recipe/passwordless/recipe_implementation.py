@@ -18,6 +18,13 @@ from typing import Any, Dict, List, Union
 from supertokens_python.querier import Querier
 
 from .types import DeviceCode, DeviceType, User
+from .utils import (
+    clear_exists_caches,
+    email_exists_cache,
+    get_email_exists_cache_key,
+    get_phone_number_exists_cache_key,
+    phone_number_exists_cache,
+)
 
 from supertokens_python.normalised_url_path import NormalisedURLPath
 
@@ -142,6 +149,14 @@ class RecipeImplementation(RecipeInterface):
                 time_joined=result["user"]["timeJoined"],
                 tenant_ids=result["user"]["tenantIds"],
             )
+            if email is not None:
+                email_exists_cache.put(
+                    get_email_exists_cache_key(tenant_id, email), True
+                )
+            if phone_number is not None:
+                phone_number_exists_cache.put(
+                    get_phone_number_exists_cache_key(tenant_id, phone_number), True
+                )
             return ConsumeCodeOkResult(result["createdNewUser"], user)
         if result["status"] == "RESTART_FLOW_ERROR":
             return ConsumeCodeRestartFlowError()
@@ -245,6 +260,9 @@ class RecipeImplementation(RecipeInterface):
             NormalisedURLPath("/recipe/user"), data
         )
         if result["status"] == "OK":
+            if email is not None or phone_number is not None:
+                # The previous email / phone number of the user is not known here
+                clear_exists_caches()
             return UpdateUserOkResult()
         if result["status"] == "UNKNOWN_USER_ID_ERROR":
             return UpdateUserUnknownUserIdError()
@@ -260,6 +278,7 @@ class RecipeImplementation(RecipeInterface):
             NormalisedURLPath("/recipe/user"), data
         )
         if result["status"] == "OK":
+            clear_exists_caches()
             return DeleteUserInfoOkResult()
         if result.get("EMAIL_ALREADY_EXISTS_ERROR"):
             raise Exception("Should never come here")
@@ -275,6 +294,7 @@ class RecipeImplementation(RecipeInterface):
             NormalisedURLPath("/recipe/user"), data
         )
         if result["status"] == "OK":
+            clear_exists_caches()
             return DeleteUserInfoOkResult()
         if result.get("EMAIL_ALREADY_EXISTS_ERROR"):
             raise Exception("Should never come here")
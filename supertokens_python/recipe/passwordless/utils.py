@@ -15,7 +15,7 @@
 from __future__ import annotations
 
 from abc import ABC
-from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, Union
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, Tuple, Union
 
 from supertokens_python.ingredients.emaildelivery.types import (
     EmailDeliveryConfig,
@@ -28,8 +28,15 @@ from supertokens_python.ingredients.smsdelivery.types import (
 from supertokens_python.recipe.passwordless.types import (
     PasswordlessLoginSMSTemplateVars,
 )
+from supertokens_python.utils import LRUCache, TTLCache
 from typing_extensions import Literal
 
+from .constants import (
+    EXISTS_CACHE_MAX_SIZE,
+    EXISTS_CACHE_TTL_MS,
+    PHONE_NUMBER_CACHE_SIZE,
+)
+
 if TYPE_CHECKING:
     from .interfaces import (
         APIInterface,
@@ -38,9 +45,8 @@ if TYPE_CHECKING:
     )
     from supertokens_python import AppInfo
 
-from re import fullmatch
+import re
 
-from phonenumbers import is_valid_number, parse  # type: ignore
 from supertokens_python.recipe.passwordless.emaildelivery.services.backward_compatibility import (
     BackwardCompatibilityService,
 )
@@ -49,18 +55,84 @@ from supertokens_python.recipe.passwordless.smsdelivery.services.backward_compat
 )
 
 
-async def default_validate_phone_number(value: str, _tenant_id: str):
+# Whether an email / phone number is used by a passwordless user, by tenant id
+# and normalised email / phone number. They are set when a user is created and
+# cleared when the email or phone number of a user is updated. Users deleted or
+# created by other processes are noticed once the entry expires.
+email_exists_cache: TTLCache[Tuple[str, str], bool] = TTLCache(
+    EXISTS_CACHE_MAX_SIZE, EXISTS_CACHE_TTL_MS
+)
+phone_number_exists_cache: TTLCache[Tuple[str, str], bool] = TTLCache(
+    EXISTS_CACHE_MAX_SIZE, EXISTS_CACHE_TTL_MS
+)
+
+
+def get_email_exists_cache_key(tenant_id: str, email: str) -> Tuple[str, str]:
+    # The core compares emails after trimming and lowercasing them
+    return (tenant_id, email.strip().lower())
+
+
+def get_phone_number_exists_cache_key(
+    tenant_id: str, phone_number: str
+) -> Tuple[str, str]:
+    # The core stores phone numbers in the E.164 format, so the same number
+    # written differently maps to the same key
+    phone_number = phone_number.strip()
+    return (tenant_id, parse_phone_number(phone_number)[1] or phone_number)
+
+
+def clear_exists_caches() -> None:
+    email_exists_cache.clear()
+    phone_number_exists_cache.clear()
+
+
+# Whether a phone number is valid and its E.164 format, for recently seen numbers
+phone_numbers: LRUCache[str, Tuple[bool, Union[str, None]]] = LRUCache(
+    PHONE_NUMBER_CACHE_SIZE
+)
+
+
+def parse_phone_number(value: str) -> Tuple[bool, Union[str, None]]:
+    """
+    Returns whether the phone number is valid and its E.164 format, which is
+    None if the number can't be parsed.
+    """
+    result = phone_numbers.get(value)
+    if result is not None:
+        return result
+
+    # phonenumbers loads large metadata tables, so it is only imported once a
+    # phone number has to be parsed
+    import phonenumbers  # type: ignore
+
     try:
-        parsed_phone_number: Any = parse(value, None)
-        if not is_valid_number(parsed_phone_number):
-            return "Phone number is invalid"
+        parsed_phone_number: Any = phonenumbers.parse(value, None)  # type: ignore
+        result = (
+            bool(phonenumbers.is_valid_number(parsed_phone_number)),  # type: ignore
+            phonenumbers.format_number(  # type: ignore
+                parsed_phone_number, phonenumbers.PhoneNumberFormat.E164  # type: ignore
+            ),
+        )
     except Exception:
+        result = (False, None)
+
+    phone_numbers.put(value, result)
+    return result
+
+
+async def default_validate_phone_number(value: str, _tenant_id: str):
+    is_valid, _ = parse_phone_number(value)
+    if not is_valid:
         return "Phone number is invalid"
 
 
+EMAIL_PATTERN = re.compile(
+    r"^(([^<>()\[\]\\.,;:\s@\"]+(\.[^<>()\[\]\\.,;:\s@\"]+)*)|(\".+\"))@((\[[0-9]{1,3}\.[0-9]{1,3}\.[0-9]{1,3}\.[0-9]{1,3}\])|(([a-zA-Z\-0-9]+\.)+[a-zA-Z]{2,}))$"
+)
+
+
 async def default_validate_email(value: str, _tenant_id: str):
-    pattern = r"^(([^<>()\[\]\\.,;:\s@\"]+(\.[^<>()\[\]\\.,;:\s@\"]+)*)|(\".+\"))@((\[[0-9]{1,3}\.[0-9]{1,3}\.[0-9]{1,3}\.[0-9]{1,3}\])|(([a-zA-Z\-0-9]+\.)+[a-zA-Z]{2,}))$"
-    if fullmatch(pattern, value) is None:
+    if EMAIL_PATTERN.fullmatch(value) is None:
         return "Email is invalid"
 
 
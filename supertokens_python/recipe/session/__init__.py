@@ -50,6 +50,7 @@ def init(
     invalid_claim_status_code: Union[int, None] = None,
     use_dynamic_access_token_signing_key: Union[bool, None] = None,
     expose_access_token_to_frontend_in_cookie_based_auth: Union[bool, None] = None,
+    check_database_cache_max_age_ms: Union[int, None] = None,
 ) -> Callable[[AppInfo], RecipeModule]:
     return SessionRecipe.init(
         cookie_domain,
@@ -63,4 +64,5 @@ def init(
         invalid_claim_status_code,
         use_dynamic_access_token_signing_key,
         expose_access_token_to_frontend_in_cookie_based_auth,
+        check_database_cache_max_age_ms,
     )
@@ -44,13 +44,16 @@ def sanitize_number(n: Any) -> Union[Union[int, float], None]:
     return None
 
 
-from supertokens_python.recipe.session.jwks import get_latest_keys
+from supertokens_python.recipe.session.jwks import JWKS, get_latest_keys
 
 
 def get_info_from_access_token(
     jwt_info: ParsedJWTInfo,
     do_anti_csrf_check: bool,
+    jwks: Optional[JWKS] = None,
 ):
+    # The keys of the cores passed to init are used unless another key set is given
+    get_keys = get_latest_keys if jwks is None else jwks.get_latest_keys
     try:
         payload: Optional[Dict[str, Any]] = None
         decode_algo = (
@@ -60,7 +63,7 @@ def get_info_from_access_token(
         )
 
         if jwt_info.version >= 3:
-            matching_keys = get_latest_keys(jwt_info.kid)
+            matching_keys = get_keys(jwt_info.kid)
             payload = jwt.decode(  # type: ignore
                 jwt_info.raw_token_string,
                 matching_keys[0].key,  # type: ignore
@@ -70,7 +73,7 @@ def get_info_from_access_token(
         else:
             # It won't have kid. So we'll have to try the token against all the keys from all the jwk_clients
             # If any of them work, we'll use that payload
-            for k in get_latest_keys():
+            for k in get_keys():
                 try:
                     payload = jwt.decode(  # type: ignore
                         jwt_info.raw_token_string,
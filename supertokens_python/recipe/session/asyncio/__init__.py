@@ -12,7 +12,7 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 from __future__ import annotations
-from typing import Any, Callable, Dict, List, Optional, TypeVar, Union
+from typing import Any, Callable, Dict, Iterable, List, Optional, TypeVar, Union
 
 from supertokens_python.recipe.openid.interfaces import (
     GetOpenIdDiscoveryConfigurationResult,
@@ -41,7 +41,12 @@ from ..session_request_functions import (
     get_session_from_request,
     refresh_session_in_request,
 )
-from ..utils import get_required_claim_validators
+from ..constants import MAX_CONCURRENT_BULK_SESSION_REQUESTS
+from ..utils import (
+    build_access_token_payload_from_claims,
+    get_required_claim_validators,
+    map_with_bounded_concurrency,
+)
 
 from supertokens_python.recipe.multitenancy.constants import DEFAULT_TENANT_ID
 
@@ -104,11 +109,13 @@ async def create_new_session_without_request_response(
         + app_info.api_base_path.get_as_string_dangerous()
     )
 
-    final_access_token_payload = {**access_token_payload, "iss": issuer}
-
-    for claim in claims_added_by_other_recipes:
-        update = await claim.build(user_id, tenant_id, user_context)
-        final_access_token_payload = {**final_access_token_payload, **update}
+    final_access_token_payload = await build_access_token_payload_from_claims(
+        claims_added_by_other_recipes,
+        {**access_token_payload, "iss": issuer},
+        user_id,
+        tenant_id,
+        user_context,
+    )
 
     return await SessionRecipe.get_instance().recipe_implementation.create_new_session(
         user_id,
@@ -440,6 +447,34 @@ async def revoke_all_sessions_for_user(
     )
 
 
+async def revoke_all_sessions_for_users(
+    user_ids: Iterable[str],
+    tenant_id: Optional[str] = None,
+    user_context: Union[None, Dict[str, Any]] = None,
+) -> List[str]:
+    """
+    Revokes the sessions of every user in `user_ids`, with at most a few core
+    requests in flight. `user_ids` can be a generator, it is consumed as the
+    users are processed. Returns the handles of all the revoked sessions.
+    """
+    if user_context is None:
+        user_context = {}
+    recipe_implementation = SessionRecipe.get_instance().recipe_implementation
+
+    async def revoke(user_id: str) -> List[str]:
+        return await recipe_implementation.revoke_all_sessions_for_user(
+            user_id,
+            tenant_id or DEFAULT_TENANT_ID,
+            tenant_id is None,
+            user_context,  # type: ignore
+        )
+
+    revoked = await map_with_bounded_concurrency(
+        user_ids, revoke, MAX_CONCURRENT_BULK_SESSION_REQUESTS
+    )
+    return [handle for handles in revoked for handle in handles]
+
+
 async def get_all_session_handles_for_user(
     user_id: str,
     tenant_id: Optional[str] = None,
@@ -472,6 +507,30 @@ async def get_session_information(
     )
 
 
+async def get_session_information_bulk(
+    session_handles: Iterable[str], user_context: Union[None, Dict[str, Any]] = None
+) -> List[Union[SessionInformationResult, None]]:
+    """
+    Same as `get_session_information` for many session handles, with at most
+    a few core requests in flight. The results are in the order of
+    `session_handles`, with `None` for sessions that do not exist.
+    """
+    if user_context is None:
+        user_context = {}
+    recipe_implementation = SessionRecipe.get_instance().recipe_implementation
+
+    async def get_information(
+        session_handle: str,
+    ) -> Union[SessionInformationResult, None]:
+        return await recipe_implementation.get_session_information(
+            session_handle, user_context  # type: ignore
+        )
+
+    return await map_with_bounded_concurrency(
+        session_handles, get_information, MAX_CONCURRENT_BULK_SESSION_REQUESTS
+    )
+
+
 async def update_session_data_in_database(
     session_handle: str,
     new_session_data: Dict[str, Any],
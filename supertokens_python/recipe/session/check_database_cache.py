@@ -0,0 +1,55 @@
+# Copyright (c) 2023, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+from typing import List
+
+from supertokens_python.utils import LRUCache, get_timestamp_ms
+
+from .constants import CHECK_DATABASE_CACHE_MAX_SIZE
+
+
+class CheckDatabaseCache:
+    """
+    Lets get_session(check_database=True) skip the call to the core for a
+    session that the core said was alive less than `max_age_ms` ago.
+
+    Sessions revoked through this process are never served from the cache
+    again. Sessions revoked by other processes (or the core directly) are
+    noticed at most `max_age_ms` after they were last verified.
+    """
+
+    def __init__(self, max_age_ms: int, max_size: int = CHECK_DATABASE_CACHE_MAX_SIZE):
+        self.max_age_ms = max_age_ms
+        # session handle -> time at which the core last said it's alive
+        self._verified_at: LRUCache[str, int] = LRUCache(max_size)
+        # session handles revoked through this process
+        self._revoked: LRUCache[str, bool] = LRUCache(max_size)
+
+    def was_verified_recently(self, session_handle: str) -> bool:
+        verified_at = self._verified_at.get(session_handle)
+        if verified_at is None or self._revoked.get(session_handle) is not None:
+            return False
+        return get_timestamp_ms() - verified_at < self.max_age_ms
+
+    def mark_verified(self, session_handle: str) -> None:
+        # A verification that was in flight while the session was revoked
+        # must not put it back in the cache
+        if self._revoked.get(session_handle) is None:
+            self._verified_at.put(session_handle, get_timestamp_ms())
+
+    def mark_revoked(self, session_handles: List[str]) -> None:
+        for session_handle in session_handles:
+            self._revoked.put(session_handle, True)
+            self._verified_at.remove(session_handle)
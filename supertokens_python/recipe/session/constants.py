@@ -34,6 +34,18 @@ ACCESS_CONTROL_EXPOSE_HEADERS = "Access-Control-Expose-Headers"
 available_token_transfer_methods: List[TokenTransferMethod] = ["cookie", "header"]
 
 JWKCacheMaxAgeInMs = 60 * 1000  # 60s
+# Max number of claims (added by other recipes) that are fetched at the same
+# time while creating a new session
+MAX_CONCURRENT_CLAIM_BUILDS = 5
+# Max number of core requests in flight for the bulk session functions
+MAX_CONCURRENT_BULK_SESSION_REQUESTS = 10
+# Concurrent refreshes with the same refresh token share one core call, and a
+# refresh with a token that was just refreshed reuses its result for this long
+REFRESH_RESULT_REUSE_WINDOW_MS = 2000
+# Max number of access tokens whose front token is remembered
+FRONT_TOKEN_CACHE_SIZE = 1000
+# Max number of session handles remembered when check_database_cache_max_age_ms is set
+CHECK_DATABASE_CACHE_MAX_SIZE = 10000
 protected_props = [
     "sub",
     "iat",
@@ -25,6 +25,7 @@ from .constants import (
     ANTI_CSRF_HEADER_KEY,
     AUTH_MODE_HEADER_KEY,
     AUTHORIZATION_HEADER_KEY,
+    FRONT_TOKEN_CACHE_SIZE,
     FRONT_TOKEN_HEADER_SET_KEY,
     REFRESH_TOKEN_COOKIE_KEY,
     REFRESH_TOKEN_HEADER_KEY,
@@ -44,10 +45,15 @@ if TYPE_CHECKING:
         SessionConfig,
     )
 
-from json import dumps
 from typing import Any, Dict
 
-from supertokens_python.utils import get_header, utf_base64encode, get_timestamp_ms
+from supertokens_python.json_codec import get_json_codec
+from supertokens_python.utils import (
+    LRUCache,
+    get_header,
+    utf_base64encode,
+    get_timestamp_ms,
+)
 
 
 def build_front_token(
@@ -57,18 +63,26 @@ def build_front_token(
         access_token_payload = {}
     token_info = {"uid": user_id, "ate": at_expiry, "up": access_token_payload}
     return utf_base64encode(
-        dumps(token_info, separators=(",", ":"), sort_keys=True), urlsafe=False
+        get_json_codec().dumps(token_info, sort_keys=True), urlsafe=False
     )
 
 
-def _set_front_token_in_headers(
-    response: BaseResponse,
-    front_token: str,
-):
-    set_header(response, FRONT_TOKEN_HEADER_SET_KEY, front_token, False)
-    set_header(
-        response, ACCESS_CONTROL_EXPOSE_HEADERS, FRONT_TOKEN_HEADER_SET_KEY, True
-    )
+# Front tokens of recently seen access tokens. A front token only depends on
+# its access token, which is usually sent again with the next requests
+front_tokens: LRUCache[str, str] = LRUCache(FRONT_TOKEN_CACHE_SIZE)
+
+
+def get_front_token(
+    access_token: str,
+    user_id: str,
+    at_expiry: int,
+    access_token_payload: Optional[Dict[str, Any]] = None,
+) -> str:
+    front_token = front_tokens.get(access_token)
+    if front_token is None:
+        front_token = build_front_token(user_id, at_expiry, access_token_payload)
+        front_tokens.put(access_token, front_token)
+    return front_token
 
 
 def get_cors_allowed_headers():
@@ -330,29 +344,27 @@ def _set_access_token_in_response(
     config: SessionConfig,
     transfer_method: TokenTransferMethod,
 ):
-    _set_front_token_in_headers(res, front_token)
-    _set_token(
-        res,
-        config,
-        "access",
-        access_token,
-        # We set the expiration to 100 years, because we can't really access the expiration of the refresh token everywhere we are setting it.
-        # This should be safe to do, since this is only the validity of the cookie (set here or on the frontend) but we check the expiration of the JWT anyway.
-        # Even if the token is expired the presence of the token indicates that the user could have a valid refresh
-        # Setting them to infinity would require special case handling on the frontend and just adding 10 years seems enough.
-        get_timestamp_ms() + HUNDRED_YEARS_IN_MS,
-        transfer_method,
-    )
+    set_header(res, FRONT_TOKEN_HEADER_SET_KEY, front_token, False)
+
+    # We set the expiration to 100 years, because we can't really access the expiration of the refresh token everywhere we are setting it.
+    # This should be safe to do, since this is only the validity of the cookie (set here or on the frontend) but we check the expiration of the JWT anyway.
+    # Even if the token is expired the presence of the token indicates that the user could have a valid refresh
+    # Setting them to infinity would require special case handling on the frontend and just adding 10 years seems enough.
+    expires = get_timestamp_ms() + HUNDRED_YEARS_IN_MS
+    if transfer_method == "cookie":
+        _set_token(res, config, "access", access_token, expires, "cookie")
 
     if (
-        config.expose_access_token_to_frontend_in_cookie_based_auth
-        and transfer_method == "cookie"
+        transfer_method == "header"
+        or config.expose_access_token_to_frontend_in_cookie_based_auth
     ):
-        _set_token(
-            res,
-            config,
-            "access",
-            access_token,
-            get_timestamp_ms() + HUNDRED_YEARS_IN_MS,
-            "header",
-        )
+        log_debug_message("Setting %s token as %s", "access", "header")
+        set_header(res, ACCESS_TOKEN_HEADER_KEY, access_token, False)
+
+    # The exposed headers are added in one go, as they are known for each config
+    set_header(
+        res,
+        ACCESS_CONTROL_EXPOSE_HEADERS,
+        config.access_token_expose_headers[transfer_method],
+        True,
+    )
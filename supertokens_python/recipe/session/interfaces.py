@@ -30,7 +30,7 @@ from typing_extensions import TypedDict
 from supertokens_python.async_to_sync_wrapper import sync
 from supertokens_python.types import APIResponse, GeneralErrorResponse, MaybeAwaitable
 
-from ...utils import resolve
+from ...utils import default_user_context, resolve
 from .exceptions import ClaimValidationError
 from .utils import SessionConfig, TokenTransferMethod
 
@@ -97,6 +97,9 @@ class ReqResInfo:
     ):
         self.request = request
         self.transfer_method = transfer_method
+        # Shared by the session methods called without a user_context while
+        # handling this request, so that their core lookups are memoised together
+        self.user_context = default_user_context(request)
 
 
 _T = TypeVar("_T")
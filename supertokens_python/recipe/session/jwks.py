@@ -12,9 +12,8 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
-import requests
 from os import environ
-from typing import List, Optional
+from typing import Callable, List, Optional
 from typing_extensions import TypedDict
 
 from jwt import PyJWK, PyJWKSet
@@ -22,8 +21,8 @@ from jwt import PyJWK, PyJWKSet
 from .constants import JWKCacheMaxAgeInMs
 
 from supertokens_python.utils import RWMutex, RWLockContext, get_timestamp_ms
-from supertokens_python.querier import Querier
 from supertokens_python.logger import log_debug_message
+from supertokens_python.metrics import JWKS_REFRESH, get_metrics_collector
 
 
 class JWKSConfigType(TypedDict):
@@ -46,31 +45,6 @@ class CachedKeys:
         return get_timestamp_ms() - self.last_refresh_time < JWKSConfig["cache_max_age"]
 
 
-cached_keys: Optional[CachedKeys] = None
-mutex = RWMutex()
-
-# only for testing purposes
-def reset_jwks_cache():
-    with RWLockContext(mutex, read=False):
-        global cached_keys
-        cached_keys = None
-
-
-def get_cached_keys() -> Optional[List[PyJWK]]:
-    if cached_keys is not None:
-        # This means that we have valid JWKs for the given core path
-        # We check if we need to refresh before returning
-
-        # This means that the value in cache is not expired, in this case we return the cached value
-        # Note that this also means that the SDK will not try to query any other core (if there are multiple)
-        # if it has a valid cache entry from one of the core URLs. It will only attempt to fetch
-        # from the cores again after the entry in the cache is expired
-        if cached_keys.is_fresh():
-            return cached_keys.keys
-
-    return None
-
-
 def find_matching_keys(
     keys: Optional[List[PyJWK]], kid: Optional[str]
 ) -> Optional[List[PyJWK]]:
@@ -86,60 +60,119 @@ def find_matching_keys(
     return None
 
 
+class JWKS:
+    """
+    The keys published at a list of JWKS urls, fetched when needed and cached
+    for JWKSConfig["cache_max_age"].
+    """
+
+    def __init__(self, get_jwks_urls: Callable[[], List[str]]):
+        self.get_jwks_urls = get_jwks_urls
+        self.cached_keys: Optional[CachedKeys] = None
+        self.mutex = RWMutex()
+
+    # only for testing purposes
+    def reset(self):
+        with RWLockContext(self.mutex, read=False):
+            self.cached_keys = None
+
+    def get_cached_keys(self) -> Optional[List[PyJWK]]:
+        if self.cached_keys is not None:
+            # This means that we have valid JWKs for the given core path
+            # We check if we need to refresh before returning
+
+            # This means that the value in cache is not expired, in this case we return the cached value
+            # Note that this also means that the SDK will not try to query any other core (if there are multiple)
+            # if it has a valid cache entry from one of the core URLs. It will only attempt to fetch
+            # from the cores again after the entry in the cache is expired
+            if self.cached_keys.is_fresh():
+                return self.cached_keys.keys
+
+        return None
+
+    def get_latest_keys(self, kid: Optional[str] = None) -> List[PyJWK]:
+        if environ.get("SUPERTOKENS_ENV") == "testing":
+            log_debug_message("Called find_jwk_client")
+
+        with RWLockContext(self.mutex, read=True):
+            matching_keys = find_matching_keys(self.get_cached_keys(), kid)
+            if matching_keys is not None:
+                if environ.get("SUPERTOKENS_ENV") == "testing":
+                    log_debug_message("Returning JWKS from cache")
+                get_metrics_collector().record_cache_lookup("jwks", True)
+                return matching_keys
+            # otherwise unknown kid, will continue to reload the keys
+
+        get_metrics_collector().record_cache_lookup("jwks", False)
+
+        core_paths = self.get_jwks_urls()
+
+        if len(core_paths) == 0:
+            raise Exception(
+                "No SuperTokens core available to query. Please pass supertokens > connection_uri to the init function, or override all the functions of the recipe you are using."
+            )
+
+        # requests is only needed when the keys are fetched, so it is not
+        # imported along with the module
+        import requests
+
+        last_error: Exception = Exception("No valid JWKS found")
+
+        with RWLockContext(self.mutex, read=False):
+            # check again if the keys are in cache
+            # because another thread might have fetched the keys while this one was waiting for the lock
+            matching_keys = find_matching_keys(self.get_cached_keys(), kid)
+            if matching_keys is not None:
+                return matching_keys
+
+            for path in core_paths:
+                if environ.get("SUPERTOKENS_ENV") == "testing":
+                    log_debug_message("Attempting to fetch JWKS from path: %s", path)
+
+                cached_jwks: Optional[List[PyJWK]] = None
+                with get_metrics_collector().start_span(JWKS_REFRESH) as span:
+                    try:
+                        log_debug_message("Fetching jwk set from the configured uri")
+                        with requests.get(
+                            path, timeout=JWKSConfig["request_timeout"] / 1000
+                        ) as response:  # 5 second timeout
+                            response.raise_for_status()
+                            cached_jwks = PyJWKSet.from_dict(response.json()).keys  # type: ignore
+                        span.set_attribute("result", "ok")
+                    except Exception as e:
+                        span.set_attribute("result", "error")
+                        last_error = e
+
+                if cached_jwks is not None:  # we found a valid JWKS
+                    self.cached_keys = CachedKeys(cached_jwks)
+                    log_debug_message("Returning JWKS from fetch")
+                    matching_keys = find_matching_keys(self.get_cached_keys(), kid)
+                    if matching_keys is not None:
+                        return matching_keys
+
+                    raise Exception("No matching JWKS found")
+
+        raise last_error
+
+
+def get_core_jwks_urls() -> List[str]:
+    from supertokens_python.querier import Querier
+
+    return Querier.get_instance().get_all_core_urls_for_path("./.well-known/jwks.json")
+
+
+# The keys of the cores passed to init
+core_jwks = JWKS(get_core_jwks_urls)
+
+
+# only for testing purposes
+def reset_jwks_cache():
+    core_jwks.reset()
+
+
+def get_cached_keys() -> Optional[List[PyJWK]]:
+    return core_jwks.get_cached_keys()
+
+
 def get_latest_keys(kid: Optional[str] = None) -> List[PyJWK]:
-    global cached_keys
-
-    if environ.get("SUPERTOKENS_ENV") == "testing":
-        log_debug_message("Called find_jwk_client")
-
-    with RWLockContext(mutex, read=True):
-        matching_keys = find_matching_keys(get_cached_keys(), kid)
-        if matching_keys is not None:
-            if environ.get("SUPERTOKENS_ENV") == "testing":
-                log_debug_message("Returning JWKS from cache")
-            return matching_keys
-        # otherwise unknown kid, will continue to reload the keys
-
-    core_paths = Querier.get_instance().get_all_core_urls_for_path(
-        "./.well-known/jwks.json"
-    )
-
-    if len(core_paths) == 0:
-        raise Exception(
-            "No SuperTokens core available to query. Please pass supertokens > connection_uri to the init function, or override all the functions of the recipe you are using."
-        )
-
-    last_error: Exception = Exception("No valid JWKS found")
-
-    with RWLockContext(mutex, read=False):
-        # check again if the keys are in cache
-        # because another thread might have fetched the keys while this one was waiting for the lock
-        matching_keys = find_matching_keys(get_cached_keys(), kid)
-        if matching_keys is not None:
-            return matching_keys
-
-        for path in core_paths:
-            if environ.get("SUPERTOKENS_ENV") == "testing":
-                log_debug_message("Attempting to fetch JWKS from path: %s", path)
-
-            cached_jwks: Optional[List[PyJWK]] = None
-            try:
-                log_debug_message("Fetching jwk set from the configured uri")
-                with requests.get(
-                    path, timeout=JWKSConfig["request_timeout"] / 1000
-                ) as response:  # 5 second timeout
-                    response.raise_for_status()
-                    cached_jwks = PyJWKSet.from_dict(response.json()).keys  # type: ignore
-            except Exception as e:
-                last_error = e
-
-            if cached_jwks is not None:  # we found a valid JWKS
-                cached_keys = CachedKeys(cached_jwks)
-                log_debug_message("Returning JWKS from fetch")
-                matching_keys = find_matching_keys(get_cached_keys(), kid)
-                if matching_keys is not None:
-                    return matching_keys
-
-                raise Exception("No matching JWKS found")
-
-    raise last_error
+    return core_jwks.get_latest_keys(kid)
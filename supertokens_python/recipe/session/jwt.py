@@ -11,9 +11,10 @@
 # WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
 # License for the specific language governing permissions and limitations
 # under the License.
-from json import dumps, loads
+from json import dumps
 from typing import Any, Dict, Optional
 
+from supertokens_python.json_codec import get_json_codec
 from supertokens_python.utils import utf_base64decode, utf_base64encode
 
 # why separators is used in dumps:
@@ -69,7 +70,7 @@ def parse_jwt_without_signature_verification(jwt: str) -> ParsedJWTInfo:
     header, payload, signature = splitted_input
     # checking the header
     if header not in _allowed_headers:
-        parsed_header = loads(utf_base64decode(header, True))
+        parsed_header = get_json_codec().loads(utf_base64decode(header, True))
         header_version = parsed_header.get("version", str(LATEST_TOKEN_VERSION))
 
         try:
@@ -94,7 +95,7 @@ def parse_jwt_without_signature_verification(jwt: str) -> ParsedJWTInfo:
         header=header,
         # Ideally we would only parse this after the signature verification is done
         # We do this at the start, since we want to check if a token can be a supertokens access token or not.
-        payload=loads(utf_base64decode(payload, True)),
+        payload=get_json_codec().loads(utf_base64decode(payload, True)),
         signature=signature,
         kid=kid,
         parsed_header=parsed_header,
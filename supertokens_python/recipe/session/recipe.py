@@ -20,6 +20,7 @@ from supertokens_python.framework.response import BaseResponse
 from typing_extensions import Literal
 
 from .cookie_and_header import (
+    front_tokens,
     get_cors_allowed_headers,
 )
 from .exceptions import (
@@ -41,6 +42,7 @@ from supertokens_python.querier import Querier
 from supertokens_python.recipe.openid.recipe import OpenIdRecipe
 from supertokens_python.recipe_module import APIHandled, RecipeModule
 
+from . import session_functions
 from .constants import SESSION_REFRESH, SIGNOUT
 from .interfaces import (
     APIInterface,
@@ -89,6 +91,7 @@ class SessionRecipe(RecipeModule):
         invalid_claim_status_code: Union[int, None] = None,
         use_dynamic_access_token_signing_key: Union[bool, None] = None,
         expose_access_token_to_frontend_in_cookie_based_auth: Union[bool, None] = None,
+        check_database_cache_max_age_ms: Union[int, None] = None,
     ):
         super().__init__(recipe_id, app_info)
         self.config = validate_and_normalise_user_input(
@@ -104,6 +107,7 @@ class SessionRecipe(RecipeModule):
             invalid_claim_status_code,
             use_dynamic_access_token_signing_key,
             expose_access_token_to_frontend_in_cookie_based_auth,
+            check_database_cache_max_age_ms,
         )
         self.openid_recipe = OpenIdRecipe(
             recipe_id,
@@ -275,6 +279,7 @@ class SessionRecipe(RecipeModule):
         invalid_claim_status_code: Union[int, None] = None,
         use_dynamic_access_token_signing_key: Union[bool, None] = None,
         expose_access_token_to_frontend_in_cookie_based_auth: Union[bool, None] = None,
+        check_database_cache_max_age_ms: Union[int, None] = None,
     ):
         def func(app_info: AppInfo):
             if SessionRecipe.__instance is None:
@@ -292,6 +297,7 @@ class SessionRecipe(RecipeModule):
                     invalid_claim_status_code,
                     use_dynamic_access_token_signing_key,
                     expose_access_token_to_frontend_in_cookie_based_auth,
+                    check_database_cache_max_age_ms,
                 )
                 return SessionRecipe.__instance
             raise_general_exception(
@@ -308,12 +314,19 @@ class SessionRecipe(RecipeModule):
             "Initialisation not done. Did you forget to call the SuperTokens.init function?"
         )
 
+    @staticmethod
+    def get_instance_optional() -> Optional[SessionRecipe]:
+        return SessionRecipe.__instance
+
     @staticmethod
     def reset():
         if ("SUPERTOKENS_ENV" not in environ) or (
             environ["SUPERTOKENS_ENV"] != "testing"
         ):
             raise_general_exception("calling testing function in non testing env")
+        session_functions.refreshes_in_progress.clear()
+        session_functions.recent_refreshes.clear()
+        front_tokens.clear()
         SessionRecipe.__instance = None
 
     def add_claim_from_other_recipe(self, claim: SessionClaim[Any]):
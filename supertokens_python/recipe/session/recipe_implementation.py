@@ -16,14 +16,21 @@ from __future__ import annotations
 import json
 from typing import TYPE_CHECKING, Any, Callable, Dict, Optional
 
-from supertokens_python.logger import log_debug_message
+from supertokens_python.logger import Lazy, log_debug_message
+from supertokens_python.metrics import CLAIM_REFETCH, get_metrics_collector
 from supertokens_python.normalised_url_path import NormalisedURLPath
-from supertokens_python.utils import resolve
+from supertokens_python.utils import (
+    get_request_memo,
+    get_request_memo_version,
+    invalidate_request_memos,
+    resolve,
+)
 
 from ...types import MaybeAwaitable
 from . import session_functions
 from .access_token import validate_access_token_structure
-from .cookie_and_header import build_front_token
+from .check_database_cache import CheckDatabaseCache
+from .cookie_and_header import get_front_token
 from .exceptions import UnauthorisedError
 from .interfaces import (
     AccessTokenObj,
@@ -51,12 +58,20 @@ from supertokens_python.querier import Querier
 from supertokens_python.recipe.multitenancy.constants import DEFAULT_TENANT_ID
 
 
+SESSION_INFORMATION_MEMO = "session.session_information"
+
+
 class RecipeImplementation(RecipeInterface):  # pylint: disable=too-many-public-methods
     def __init__(self, querier: Querier, config: SessionConfig, app_info: AppInfo):
         super().__init__()
         self.querier = querier
         self.config = config
         self.app_info = app_info
+        self.check_database_cache = (
+            CheckDatabaseCache(config.check_database_cache_max_age_ms)
+            if config.check_database_cache_max_age_ms is not None
+            else None
+        )
 
     async def create_new_session(
         self,
@@ -87,8 +102,11 @@ class RecipeImplementation(RecipeInterface):  # pylint: disable=too-many-public-
             self,
             self.config,
             result.accessToken.token,
-            build_front_token(
-                result.session.userId, result.accessToken.expiry, payload
+            get_front_token(
+                result.accessToken.token,
+                result.session.userId,
+                result.accessToken.expiry,
+                payload,
             ),
             result.refreshToken,
             result.antiCsrfToken,
@@ -123,17 +141,20 @@ class RecipeImplementation(RecipeInterface):  # pylint: disable=too-many-public-
                 log_debug_message(
                     "update_claims_in_payload_if_needed refetching for %s", validator.id
                 )
-                value = await resolve(
-                    validator.claim.fetch_value(
-                        user_id,
-                        access_token_payload.get("tId", DEFAULT_TENANT_ID),
-                        user_context,
+                with get_metrics_collector().start_span(
+                    CLAIM_REFETCH, {"claim": validator.id}
+                ):
+                    value = await resolve(
+                        validator.claim.fetch_value(
+                            user_id,
+                            access_token_payload.get("tId", DEFAULT_TENANT_ID),
+                            user_context,
+                        )
                     )
-                )
                 log_debug_message(
                     "update_claims_in_payload_if_needed %s refetch result %s",
                     validator.id,
-                    json.dumps(value),
+                    Lazy(lambda: json.dumps(value)),
                 )
                 if value is not None:
                     access_token_payload = validator.claim.add_to_payload_(
@@ -257,7 +278,9 @@ class RecipeImplementation(RecipeInterface):  # pylint: disable=too-many-public-
             self,
             self.config,
             access_token_str,
-            build_front_token(response.session.userId, expiry_time, payload),
+            get_front_token(
+                access_token_str, response.session.userId, expiry_time, payload
+            ),
             None,  # refresh_token
             anti_csrf_token,
             response.session.handle,
@@ -295,6 +318,7 @@ class RecipeImplementation(RecipeInterface):  # pylint: disable=too-many-public-
         )
 
         log_debug_message("refreshSession: Success!")
+        invalidate_request_memos(SESSION_INFORMATION_MEMO, [response.session.handle])
 
         payload = parse_jwt_without_signature_verification(
             response.accessToken.token,
@@ -304,7 +328,8 @@ class RecipeImplementation(RecipeInterface):  # pylint: disable=too-many-public-
             self,
             self.config,
             response.accessToken.token,
-            build_front_token(
+            get_front_token(
+                response.accessToken.token,
                 response.session.userId,
                 response.accessToken.expiry,
                 payload,
@@ -324,7 +349,9 @@ class RecipeImplementation(RecipeInterface):  # pylint: disable=too-many-public-
     async def revoke_session(
         self, session_handle: str, user_context: Dict[str, Any]
     ) -> bool:
-        return await session_functions.revoke_session(self, session_handle)
+        revoked = await session_functions.revoke_session(self, session_handle)
+        invalidate_request_memos(SESSION_INFORMATION_MEMO, [session_handle])
+        return revoked
 
     async def revoke_all_sessions_for_user(
         self,
@@ -333,9 +360,11 @@ class RecipeImplementation(RecipeInterface):  # pylint: disable=too-many-public-
         revoke_across_all_tenants: bool,
         user_context: Dict[str, Any],
     ) -> List[str]:
-        return await session_functions.revoke_all_sessions_for_user(
+        revoked = await session_functions.revoke_all_sessions_for_user(
             self, user_id, tenant_id, revoke_across_all_tenants
         )
+        invalidate_request_memos(SESSION_INFORMATION_MEMO, revoked)
+        return revoked
 
     async def get_all_session_handles_for_user(
         self,
@@ -351,12 +380,26 @@ class RecipeImplementation(RecipeInterface):  # pylint: disable=too-many-public-
     async def revoke_multiple_sessions(
         self, session_handles: List[str], user_context: Dict[str, Any]
     ) -> List[str]:
-        return await session_functions.revoke_multiple_sessions(self, session_handles)
+        revoked = await session_functions.revoke_multiple_sessions(
+            self, session_handles
+        )
+        invalidate_request_memos(SESSION_INFORMATION_MEMO, revoked)
+        return revoked
 
     async def get_session_information(
         self, session_handle: str, user_context: Dict[str, Any]
     ) -> Union[SessionInformationResult, None]:
-        return await session_functions.get_session_information(self, session_handle)
+        memo = get_request_memo(user_context, SESSION_INFORMATION_MEMO)
+        if memo is not None and session_handle in memo:
+            return memo[session_handle]
+
+        version = get_request_memo_version()
+        session_info = await session_functions.get_session_information(
+            self, session_handle
+        )
+        if memo is not None:
+            memo.put(session_handle, session_info, version)
+        return session_info
 
     async def update_session_data_in_database(
         self,
@@ -364,9 +407,11 @@ class RecipeImplementation(RecipeInterface):  # pylint: disable=too-many-public-
         new_session_data: Dict[str, Any],
         user_context: Dict[str, Any],
     ) -> bool:
-        return await session_functions.update_session_data_in_database(
+        updated = await session_functions.update_session_data_in_database(
             self, session_handle, new_session_data
         )
+        invalidate_request_memos(SESSION_INFORMATION_MEMO, [session_handle])
+        return updated
 
     async def merge_into_access_token_payload(
         self,
@@ -386,9 +431,11 @@ class RecipeImplementation(RecipeInterface):  # pylint: disable=too-many-public-
             if new_access_token_payload[k] is None:
                 del new_access_token_payload[k]
 
-        return await session_functions.update_access_token_payload(
+        updated = await session_functions.update_access_token_payload(
             self, session_handle, new_access_token_payload
         )
+        invalidate_request_memos(SESSION_INFORMATION_MEMO, [session_handle])
+        return updated
 
     async def fetch_and_set_claim(
         self,
@@ -469,6 +516,7 @@ class RecipeImplementation(RecipeInterface):  # pylint: disable=too-many-public-
         )
         if response["status"] == "UNAUTHORISED":
             return None
+        invalidate_request_memos(SESSION_INFORMATION_MEMO, [session_handle])
         access_token_obj: Union[None, AccessTokenObj] = None
         if "accessToken" in response:
             access_token_obj = AccessTokenObj(
@@ -23,7 +23,7 @@ from .utils import TokenTransferMethod
 from .cookie_and_header import (
     clear_session_response_mutator,
     token_response_mutator,
-    build_front_token,
+    get_front_token,
     anti_csrf_response_mutator,
     access_token_mutator,
 )
@@ -42,6 +42,11 @@ _T = TypeVar("_T")
 
 
 class Session(SessionContainer):
+    def _get_default_user_context(self) -> Dict[str, Any]:
+        if self.req_res_info is not None:
+            return self.req_res_info.user_context
+        return {}
+
     async def attach_to_request_response(
         self, request: BaseRequest, transfer_method: TokenTransferMethod
     ) -> None:
@@ -77,7 +82,7 @@ class Session(SessionContainer):
 
     async def revoke_session(self, user_context: Union[Any, None] = None) -> None:
         if user_context is None:
-            user_context = {}
+            user_context = self._get_default_user_context()
 
         await self.recipe_implementation.revoke_session(
             self.session_handle, user_context
@@ -102,7 +107,7 @@ class Session(SessionContainer):
         self, user_context: Union[Dict[str, Any], None] = None
     ) -> Dict[str, Any]:
         if user_context is None:
-            user_context = {}
+            user_context = self._get_default_user_context()
         session_info = await self.recipe_implementation.get_session_information(
             self.session_handle, user_context
         )
@@ -120,7 +125,7 @@ class Session(SessionContainer):
         user_context: Union[Dict[str, Any], None] = None,
     ) -> None:
         if user_context is None:
-            user_context = {}
+            user_context = self._get_default_user_context()
         updated = await self.recipe_implementation.update_session_data_in_database(
             self.session_handle, new_session_data, user_context
         )
@@ -162,7 +167,7 @@ class Session(SessionContainer):
         self, user_context: Union[Dict[str, Any], None] = None
     ) -> int:
         if user_context is None:
-            user_context = {}
+            user_context = self._get_default_user_context()
         session_info = await self.recipe_implementation.get_session_information(
             self.session_handle, user_context
         )
@@ -176,7 +181,7 @@ class Session(SessionContainer):
 
     async def get_expiry(self, user_context: Union[Dict[str, Any], None] = None) -> int:
         if user_context is None:
-            user_context = {}
+            user_context = self._get_default_user_context()
         session_info = await self.recipe_implementation.get_session_information(
             self.session_handle, user_context
         )
@@ -194,7 +199,7 @@ class Session(SessionContainer):
         user_context: Union[Dict[str, Any], None] = None,
     ) -> None:
         if user_context is None:
-            user_context = {}
+            user_context = self._get_default_user_context()
 
         validate_claim_res = await self.recipe_implementation.validate_claims(
             self.get_user_id(user_context),
@@ -221,7 +226,7 @@ class Session(SessionContainer):
         self, claim: SessionClaim[Any], user_context: Union[Dict[str, Any], None] = None
     ) -> None:
         if user_context is None:
-            user_context = {}
+            user_context = self._get_default_user_context()
 
         update = await claim.build(
             self.get_user_id(), self.get_tenant_id(), user_context
@@ -235,7 +240,7 @@ class Session(SessionContainer):
         user_context: Union[Dict[str, Any], None] = None,
     ) -> None:
         if user_context is None:
-            user_context = {}
+            user_context = self._get_default_user_context()
 
         update = claim.add_to_payload_({}, value, user_context)
         return await self.merge_into_access_token_payload(update, user_context)
@@ -244,7 +249,7 @@ class Session(SessionContainer):
         self, claim: SessionClaim[_T], user_context: Union[Dict[str, Any], None] = None
     ) -> Union[_T, None]:
         if user_context is None:
-            user_context = {}
+            user_context = self._get_default_user_context()
 
         return claim.get_value_from_payload(
             self.get_access_token_payload(user_context), user_context
@@ -254,7 +259,7 @@ class Session(SessionContainer):
         self, claim: SessionClaim[Any], user_context: Union[Dict[str, Any], None] = None
     ) -> None:
         if user_context is None:
-            user_context = {}
+            user_context = self._get_default_user_context()
 
         update = claim.remove_from_payload_by_merge_({}, user_context)
         return await self.merge_into_access_token_payload(update, user_context)
@@ -265,7 +270,7 @@ class Session(SessionContainer):
         user_context: Union[Dict[str, Any], None] = None,
     ) -> None:
         if user_context is None:
-            user_context = {}
+            user_context = self._get_default_user_context()
 
         new_access_token_payload = {**self.get_access_token_payload(user_context)}
         for k in protected_props:
@@ -304,8 +309,11 @@ class Session(SessionContainer):
             )
             self.user_data_in_access_token = payload
             self.access_token = response.access_token.token
-            self.front_token = build_front_token(
-                self.get_user_id(), response.access_token.expiry, payload
+            self.front_token = get_front_token(
+                self.access_token,
+                self.get_user_id(),
+                response.access_token.expiry,
+                payload,
             )
             self.access_token_updated = True
             if self.req_res_info is not None:
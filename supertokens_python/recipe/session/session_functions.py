@@ -13,22 +13,28 @@
 # under the License.
 from __future__ import annotations
 
+import asyncio
+import threading
 import time
-from typing import TYPE_CHECKING, Any, Dict, List, Union, Optional
+from concurrent.futures import Future
+from hashlib import sha256
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple, Union, Optional
 
 from supertokens_python.recipe.session.interfaces import SessionInformationResult
 
 from .access_token import get_info_from_access_token
-from .constants import JWKCacheMaxAgeInMs
+from .constants import JWKCacheMaxAgeInMs, REFRESH_RESULT_REUSE_WINDOW_MS
 from .jwt import ParsedJWTInfo
 
 if TYPE_CHECKING:
     from .recipe_implementation import RecipeImplementation
 
 from supertokens_python.logger import log_debug_message
+from supertokens_python.metrics import ACCESS_TOKEN_VERIFICATION, get_metrics_collector
 from supertokens_python.normalised_url_path import NormalisedURLPath
 from supertokens_python.process_state import AllowedProcessStates, ProcessState
 from supertokens_python.recipe.session.interfaces import TokenInfo
+from supertokens_python.utils import LRUCache, get_timestamp_ms
 
 from .exceptions import (
     TryRefreshTokenError,
@@ -156,10 +162,13 @@ async def get_session(
     access_token_info: Optional[Dict[str, Any]] = None
 
     try:
-        access_token_info = get_info_from_access_token(
-            parsed_access_token,
-            config.anti_csrf == "VIA_TOKEN" and do_anti_csrf_check,
-        )
+        with get_metrics_collector().start_span(
+            ACCESS_TOKEN_VERIFICATION, {"version": str(parsed_access_token.version)}
+        ):
+            access_token_info = get_info_from_access_token(
+                parsed_access_token,
+                config.anti_csrf == "VIA_TOKEN" and do_anti_csrf_check,
+            )
 
     except Exception as e:
         if not isinstance(e, TryRefreshTokenError):
@@ -249,9 +258,18 @@ async def get_session(
                 "Please either use VIA_TOKEN, NONE or call with doAntiCsrfCheck false"
             )
 
+    check_database_cache = recipe_implementation.check_database_cache
     if (
         access_token_info is not None
-        and not always_check_core
+        and (
+            not always_check_core
+            or (
+                check_database_cache is not None
+                and check_database_cache.was_verified_recently(
+                    access_token_info["sessionHandle"]
+                )
+            )
+        )
         and access_token_info["parentRefreshTokenHash1"] is None
     ):
         return GetSessionAPIResponse(
@@ -282,6 +300,8 @@ async def get_session(
     )
     if response["status"] == "OK":
         response.pop("status", None)
+        if always_check_core and check_database_cache is not None:
+            check_database_cache.mark_verified(response["session"]["handle"])
         return GetSessionAPIResponse(
             GetSessionAPIResponseSession(
                 response["session"]["handle"],
@@ -320,11 +340,105 @@ async def get_session(
     raise_try_refresh_token_exception(response["message"])
 
 
+# hash of the refresh token and anti csrf inputs -> the refresh in progress. It
+# is a concurrent future so that calls running on other threads' event loops
+# (e.g. Flask or Django handling requests with sync) can wait for it too.
+refreshes_in_progress: Dict[str, Future[CreateOrRefreshAPIResponse]] = {}
+refreshes_in_progress_lock = threading.Lock()
+# hash of the refresh token and anti csrf inputs -> (time, result) of the last
+# successful refresh
+recent_refreshes: LRUCache[str, Tuple[int, CreateOrRefreshAPIResponse]] = LRUCache(1000)
+
+
 async def refresh_session(
     recipe_implementation: RecipeImplementation,
     refresh_token: str,
     anti_csrf_token: Union[str, None],
     disable_anti_csrf: bool,
+) -> CreateOrRefreshAPIResponse:
+    # A page that fires many requests with an expired access token refreshes
+    # the session once per request. Sending all of them to the core would
+    # rotate the refresh token several times, and the core would then see the
+    # old one being reused and report token theft. So refreshes with the same
+    # inputs share one core call, and its result for a short while after.
+    key = sha256(
+        f"{refresh_token};{anti_csrf_token};{disable_anti_csrf}".encode()
+    ).hexdigest()
+
+    while True:
+        recent_refresh = recent_refreshes.get(key)
+        if (
+            recent_refresh is not None
+            and get_timestamp_ms() - recent_refresh[0] < REFRESH_RESULT_REUSE_WINDOW_MS
+        ):
+            log_debug_message("refreshSession: Reusing the result of a recent refresh")
+            return recent_refresh[1]
+
+        with refreshes_in_progress_lock:
+            in_progress = refreshes_in_progress.get(key)
+            is_refreshing = in_progress is None
+            if in_progress is None:
+                in_progress = Future()
+                refreshes_in_progress[key] = in_progress
+
+        if is_refreshing:
+            return await _share_refresh_session(
+                key,
+                in_progress,
+                recipe_implementation,
+                refresh_token,
+                anti_csrf_token,
+                disable_anti_csrf,
+            )
+
+        log_debug_message("refreshSession: Waiting for a refresh in progress")
+        try:
+            return await asyncio.shield(asyncio.wrap_future(in_progress))
+        except asyncio.CancelledError:
+            if not in_progress.cancelled():
+                raise
+            # The call that was refreshing was cancelled, so this one tries again
+
+
+async def _share_refresh_session(
+    key: str,
+    in_progress: Future[CreateOrRefreshAPIResponse],
+    recipe_implementation: RecipeImplementation,
+    refresh_token: str,
+    anti_csrf_token: Union[str, None],
+    disable_anti_csrf: bool,
+) -> CreateOrRefreshAPIResponse:
+    def remove_in_progress():
+        with refreshes_in_progress_lock:
+            if refreshes_in_progress.get(key) is in_progress:
+                del refreshes_in_progress[key]
+
+    try:
+        response = await _refresh_session(
+            recipe_implementation, refresh_token, anti_csrf_token, disable_anti_csrf
+        )
+    except asyncio.CancelledError:
+        remove_in_progress()
+        in_progress.cancel()
+        raise
+    except Exception as e:
+        remove_in_progress()
+        in_progress.set_exception(e)
+        raise
+
+    # Stored before the refresh is removed from refreshes_in_progress, so that
+    # a call coming in between finds one or the other
+    recent_refreshes.put(key, (get_timestamp_ms(), response))
+    remove_in_progress()
+    in_progress.set_result(response)
+    return response
+
+
+async def _refresh_session(
+    recipe_implementation: RecipeImplementation,
+    refresh_token: str,
+    anti_csrf_token: Union[str, None],
+    disable_anti_csrf: bool,
 ) -> CreateOrRefreshAPIResponse:
     data = {
         "refreshToken": refresh_token,
@@ -397,6 +511,10 @@ async def revoke_all_sessions_for_user(
         NormalisedURLPath(f"{tenant_id}/recipe/session/remove"),
         {"userId": user_id, "revokeAcrossAllTenants": revoke_across_all_tenants},
     )
+    if recipe_implementation.check_database_cache is not None:
+        recipe_implementation.check_database_cache.mark_revoked(
+            response["sessionHandlesRevoked"]
+        )
     return response["sessionHandlesRevoked"]
 
 
@@ -423,6 +541,8 @@ async def revoke_session(
         NormalisedURLPath("/recipe/session/remove"),
         {"sessionHandles": [session_handle]},
     )
+    if recipe_implementation.check_database_cache is not None:
+        recipe_implementation.check_database_cache.mark_revoked([session_handle])
     return len(response["sessionHandlesRevoked"]) == 1
 
 
@@ -432,6 +552,8 @@ async def revoke_multiple_sessions(
     response = await recipe_implementation.querier.send_post_request(
         NormalisedURLPath("/recipe/session/remove"), {"sessionHandles": session_handles}
     )
+    if recipe_implementation.check_database_cache is not None:
+        recipe_implementation.check_database_cache.mark_revoked(session_handles)
     return response["sessionHandlesRevoked"]
 
 
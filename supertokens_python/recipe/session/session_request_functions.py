@@ -49,6 +49,7 @@ from supertokens_python.recipe.session.jwt import (
 from supertokens_python.recipe.session.utils import (
     SessionConfig,
     TokenTransferMethod,
+    build_access_token_payload_from_claims,
     get_required_claim_validators,
 )
 from supertokens_python.types import MaybeAwaitable
@@ -238,11 +239,13 @@ async def create_new_session_in_request(
         + app_info.api_base_path.get_as_string_dangerous()
     )
 
-    final_access_token_payload = {**access_token_payload, "iss": issuer}
-
-    for claim in claims_added_by_other_recipes:
-        update = await claim.build(user_id, tenant_id, user_context)
-        final_access_token_payload = {**final_access_token_payload, **update}
+    final_access_token_payload = await build_access_token_payload_from_claims(
+        claims_added_by_other_recipes,
+        {**access_token_payload, "iss": issuer},
+        user_id,
+        tenant_id,
+        user_context,
+    )
 
     log_debug_message("createNewSession: Access token payload built")
 
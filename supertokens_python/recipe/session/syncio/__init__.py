@@ -12,7 +12,7 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 from __future__ import annotations
-from typing import Any, Dict, List, Union, Callable, Optional, TypeVar
+from typing import Any, Dict, Iterable, List, Union, Callable, Optional, TypeVar
 
 from supertokens_python.async_to_sync_wrapper import sync
 from supertokens_python.recipe.openid.interfaces import (
@@ -197,6 +197,18 @@ def revoke_all_sessions_for_user(
     return sync(async_revoke_all_sessions_for_user(user_id, tenant_id, user_context))
 
 
+def revoke_all_sessions_for_users(
+    user_ids: Iterable[str],
+    tenant_id: Optional[str] = None,
+    user_context: Union[None, Dict[str, Any]] = None,
+) -> List[str]:
+    from supertokens_python.recipe.session.asyncio import (
+        revoke_all_sessions_for_users as async_revoke_all_sessions_for_users,
+    )
+
+    return sync(async_revoke_all_sessions_for_users(user_ids, tenant_id, user_context))
+
+
 def get_all_session_handles_for_user(
     user_id: str,
     tenant_id: Optional[str] = None,
@@ -231,6 +243,16 @@ def get_session_information(
     return sync(async_get_session_information(session_handle, user_context))
 
 
+def get_session_information_bulk(
+    session_handles: Iterable[str], user_context: Union[None, Dict[str, Any]] = None
+) -> List[Union[SessionInformationResult, None]]:
+    from supertokens_python.recipe.session.asyncio import (
+        get_session_information_bulk as async_get_session_information_bulk,
+    )
+
+    return sync(async_get_session_information_bulk(session_handles, user_context))
+
+
 def update_session_data_in_database(
     session_handle: str,
     new_session_data: Dict[str, Any],
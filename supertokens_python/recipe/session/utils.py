@@ -13,8 +13,20 @@
 # under the License.
 from __future__ import annotations
 
+import asyncio
 import json
-from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, List, Optional, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    TypeVar,
+    Union,
+)
 from urllib.parse import urlparse
 
 from typing_extensions import Literal
@@ -30,7 +42,13 @@ from supertokens_python.utils import (
 )
 
 from ...types import MaybeAwaitable
-from .constants import AUTH_MODE_HEADER_KEY, SESSION_REFRESH
+from .constants import (
+    ACCESS_TOKEN_HEADER_KEY,
+    AUTH_MODE_HEADER_KEY,
+    FRONT_TOKEN_HEADER_SET_KEY,
+    MAX_CONCURRENT_CLAIM_BUILDS,
+    SESSION_REFRESH,
+)
 from .cookie_and_header import clear_session_from_all_token_transfer_methods
 from .exceptions import ClaimValidationError
 
@@ -44,12 +62,16 @@ if TYPE_CHECKING:
     from .interfaces import (
         APIInterface,
         RecipeInterface,
+        SessionClaim,
         SessionContainer,
         SessionClaimValidator,
     )
     from .recipe import SessionRecipe
 
-from supertokens_python.logger import log_debug_message
+from supertokens_python.logger import Lazy, log_debug_message
+
+_T = TypeVar("_T")
+_R = TypeVar("_R")
 
 
 def normalise_session_scope(session_scope: str) -> str:
@@ -337,6 +359,7 @@ class SessionConfig:
         invalid_claim_status_code: int,
         use_dynamic_access_token_signing_key: bool,
         expose_access_token_to_frontend_in_cookie_based_auth: bool,
+        check_database_cache_max_age_ms: Union[int, None],
     ):
         self.session_expired_status_code = session_expired_status_code
         self.invalid_claim_status_code = invalid_claim_status_code
@@ -344,6 +367,18 @@ class SessionConfig:
         self.expose_access_token_to_frontend_in_cookie_based_auth = (
             expose_access_token_to_frontend_in_cookie_based_auth
         )
+        self.check_database_cache_max_age_ms = check_database_cache_max_age_ms
+        # The value added to Access-Control-Expose-Headers when the access token
+        # is set in a response, for each token transfer method
+        self.access_token_expose_headers: Dict[TokenTransferMethod, str] = {
+            "cookie": FRONT_TOKEN_HEADER_SET_KEY
+            + (
+                "," + ACCESS_TOKEN_HEADER_KEY
+                if expose_access_token_to_frontend_in_cookie_based_auth
+                else ""
+            ),
+            "header": FRONT_TOKEN_HEADER_SET_KEY + "," + ACCESS_TOKEN_HEADER_KEY,
+        }
 
         self.refresh_token_path = refresh_token_path
         self.cookie_domain = cookie_domain
@@ -376,6 +411,7 @@ def validate_and_normalise_user_input(
     invalid_claim_status_code: Union[int, None] = None,
     use_dynamic_access_token_signing_key: Union[bool, None] = None,
     expose_access_token_to_frontend_in_cookie_based_auth: Union[bool, None] = None,
+    check_database_cache_max_age_ms: Union[int, None] = None,
 ):
     if anti_csrf not in {"VIA_TOKEN", "VIA_CUSTOM_HEADER", "NONE", None}:
         raise ValueError(
@@ -391,17 +427,14 @@ def validate_and_normalise_user_input(
     cookie_domain = (
         normalise_session_scope(cookie_domain) if cookie_domain is not None else None
     )
-    top_level_api_domain = app_info.top_level_api_domain
-    top_level_website_domain = app_info.top_level_website_domain
-
     api_domain_scheme = get_url_scheme(app_info.api_domain.get_as_string_dangerous())
     website_domain_scheme = get_url_scheme(
         app_info.website_domain.get_as_string_dangerous()
     )
     if cookie_same_site is not None:
         cookie_same_site = normalise_same_site(cookie_same_site)
-    elif (top_level_api_domain != top_level_website_domain) or (
-        api_domain_scheme != website_domain_scheme
+    elif (api_domain_scheme != website_domain_scheme) or (
+        app_info.top_level_api_domain != app_info.top_level_website_domain
     ):
         cookie_same_site = "none"
     else:
@@ -445,6 +478,14 @@ def validate_and_normalise_user_input(
     if expose_access_token_to_frontend_in_cookie_based_auth is None:
         expose_access_token_to_frontend_in_cookie_based_auth = False
 
+    if (
+        check_database_cache_max_age_ms is not None
+        and check_database_cache_max_age_ms < 0
+    ):
+        raise ValueError(
+            "check_database_cache_max_age_ms must be a non-negative number"
+        )
+
     return SessionConfig(
         app_info.api_base_path.append(NormalisedURLPath(SESSION_REFRESH)),
         cookie_domain,
@@ -460,9 +501,62 @@ def validate_and_normalise_user_input(
         invalid_claim_status_code,
         use_dynamic_access_token_signing_key,
         expose_access_token_to_frontend_in_cookie_based_auth,
+        check_database_cache_max_age_ms,
     )
 
 
+async def build_access_token_payload_from_claims(
+    claims: List[SessionClaim[Any]],
+    access_token_payload: Dict[str, Any],
+    user_id: str,
+    tenant_id: str,
+    user_context: Dict[str, Any],
+) -> Dict[str, Any]:
+    # The claims are fetched concurrently (most of them query the core), but
+    # merged in the order in which they were added, so a later claim still
+    # overwrites the keys of an earlier one.
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_CLAIM_BUILDS)
+
+    async def build(claim: SessionClaim[Any]) -> Dict[str, Any]:
+        async with semaphore:
+            return await claim.build(user_id, tenant_id, user_context)
+
+    updates = await asyncio.gather(*[build(claim) for claim in claims])
+
+    final_access_token_payload = {**access_token_payload}
+    for update in updates:
+        final_access_token_payload.update(update)
+    return final_access_token_payload
+
+
+async def map_with_bounded_concurrency(
+    items: Iterable[_T],
+    func: Callable[[_T], Awaitable[_R]],
+    max_concurrency: int,
+) -> List[_R]:
+    # A fixed number of workers pull items one at a time, so `items` can be a
+    # generator over any number of items without creating a coroutine for
+    # each of them upfront. The results are returned in the order of `items`.
+    if max_concurrency < 1:
+        raise_general_exception("max_concurrency must be at least 1")
+
+    results: Dict[int, _R] = {}
+    iterator = enumerate(items)
+
+    async def worker():
+        for i, item in iterator:
+            results[i] = await func(item)
+
+    workers = [asyncio.ensure_future(worker()) for _ in range(max_concurrency)]
+    try:
+        await asyncio.gather(*workers)
+    except BaseException:
+        for w in workers:
+            w.cancel()
+        raise
+    return [results[i] for i in range(len(results))]
+
+
 async def get_required_claim_validators(
     session: SessionContainer,
     override_global_claim_validators: Optional[
@@ -510,7 +604,7 @@ async def validate_claims_in_payload(
         log_debug_message(
             "validate_claims_in_payload %s validate res %s",
             validator.id,
-            json.dumps(claim_validation_res.__dict__),
+            Lazy(lambda: json.dumps(claim_validation_res.__dict__)),
         )
         if not claim_validation_res.is_valid:
             validation_errors.append(
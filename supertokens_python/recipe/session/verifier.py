@@ -0,0 +1,154 @@
+# Copyright (c) 2023, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional, Union
+
+from supertokens_python.async_to_sync_wrapper import sync
+from supertokens_python.exceptions import raise_general_exception
+from supertokens_python.logger import log_debug_message
+from supertokens_python.normalised_url_domain import NormalisedURLDomain
+from supertokens_python.normalised_url_path import NormalisedURLPath
+
+from .access_token import get_info_from_access_token, validate_access_token_structure
+from .exceptions import (
+    UnauthorisedError,
+    raise_invalid_claims_exception,
+    raise_try_refresh_token_exception,
+)
+from .interfaces import SessionClaimValidator
+from .jwks import JWKS
+from .jwt import ParsedJWTInfo, parse_jwt_without_signature_verification
+from .utils import validate_claims_in_payload
+
+
+class VerifiedSession:
+    def __init__(
+        self,
+        user_id: str,
+        session_handle: str,
+        tenant_id: str,
+        access_token_payload: Dict[str, Any],
+        expiry_time: int,
+    ):
+        self.user_id = user_id
+        self.session_handle = session_handle
+        self.tenant_id = tenant_id
+        self.access_token_payload = access_token_payload
+        self.expiry_time = expiry_time
+
+
+class SessionVerifier:
+    """
+    Verifies access tokens against the keys published by the core, without
+    calling supertokens_python.init.
+
+    Only the signature, expiry and the given claim validators are checked. The
+    core is never queried for the session itself, so a revoked session stays
+    valid until its access token expires (like get_session with
+    check_database=False), and the anti-csrf check is left to the caller.
+    """
+
+    def __init__(
+        self,
+        connection_uri: Union[str, None] = None,
+        jwks_url: Union[str, None] = None,
+        use_dynamic_access_token_signing_key: bool = True,
+    ):
+        if (connection_uri is None) == (jwks_url is None):
+            raise_general_exception(
+                "Please pass exactly one of connection_uri or jwks_url"
+            )
+
+        if jwks_url is not None:
+            jwks_urls = [jwks_url]
+        else:
+            assert connection_uri is not None
+            jwks_path = NormalisedURLPath("/.well-known/jwks.json")
+            jwks_urls = [
+                NormalisedURLDomain(h.strip()).get_as_string_dangerous()
+                + NormalisedURLPath(h.strip())
+                .append(jwks_path)
+                .get_as_string_dangerous()
+                for h in connection_uri.split(";")
+                if h.strip() != ""
+            ]
+
+        self.jwks = JWKS(lambda: jwks_urls)
+        self.use_dynamic_access_token_signing_key = use_dynamic_access_token_signing_key
+
+    async def verify(
+        self,
+        access_token: str,
+        claim_validators: Optional[List[SessionClaimValidator]] = None,
+        user_context: Optional[Dict[str, Any]] = None,
+    ) -> VerifiedSession:
+        if user_context is None:
+            user_context = {}
+
+        parsed_access_token: Optional[ParsedJWTInfo] = None
+        try:
+            parsed_access_token = parse_jwt_without_signature_verification(access_token)
+            validate_access_token_structure(
+                parsed_access_token.payload, parsed_access_token.version
+            )
+        except Exception as _:
+            log_debug_message(
+                "SessionVerifier: UNAUTHORISED because the accessToken couldn't be parsed or had an invalid structure"
+            )
+            raise UnauthorisedError("Token parsing failed", clear_tokens=False)
+
+        access_token_info = get_info_from_access_token(
+            parsed_access_token, False, self.jwks
+        )
+
+        if parsed_access_token.version >= 3:
+            token_use_dynamic_key = (
+                parsed_access_token.kid.startswith("d-")
+                if parsed_access_token.kid is not None
+                else False
+            )
+
+            if token_use_dynamic_key != self.use_dynamic_access_token_signing_key:
+                log_debug_message(
+                    "SessionVerifier: Returning TRY_REFRESH_TOKEN because the access token doesn't match use_dynamic_access_token_signing_key"
+                )
+
+                raise_try_refresh_token_exception(
+                    "The access token doesn't match the useDynamicAccessTokenSigningKey setting"
+                )
+
+        access_token_payload: Dict[str, Any] = access_token_info["userData"]
+        if claim_validators:
+            validation_errors = await validate_claims_in_payload(
+                claim_validators, access_token_payload, user_context
+            )
+            if len(validation_errors) > 0:
+                raise_invalid_claims_exception("INVALID_CLAIMS", validation_errors)
+
+        return VerifiedSession(
+            access_token_info["userId"],
+            access_token_info["sessionHandle"],
+            access_token_info["tenantId"],
+            access_token_payload,
+            access_token_info["expiryTime"],
+        )
+
+    def sync_verify(
+        self,
+        access_token: str,
+        claim_validators: Optional[List[SessionClaimValidator]] = None,
+        user_context: Optional[Dict[str, Any]] = None,
+    ) -> VerifiedSession:
+        return sync(self.verify(access_token, claim_validators, user_context))
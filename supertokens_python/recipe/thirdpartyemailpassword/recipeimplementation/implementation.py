@@ -19,6 +19,7 @@ import supertokens_python.recipe.emailpassword.interfaces as EPInterfaces
 from supertokens_python.recipe.thirdparty.provider import ProviderInput, Provider
 from supertokens_python.recipe.thirdparty.types import RawUserInfoFromProvider
 from supertokens_python.recipe.emailpassword.utils import EmailPasswordConfig
+from supertokens_python.utils import LRUCache
 
 if TYPE_CHECKING:
     from supertokens_python.querier import Querier
@@ -55,6 +56,8 @@ from .third_party_recipe_implementation import (
     RecipeImplementation as DerivedThirdPartyImplementation,
 )
 
+USER_ID_RECIPE_CACHE_SIZE = 10000
+
 
 class RecipeImplementation(RecipeInterface):
     def __init__(
@@ -65,6 +68,10 @@ class RecipeImplementation(RecipeInterface):
         get_emailpassword_config: Callable[[], EmailPasswordConfig],
     ):
         super().__init__()
+        # user_id -> "emailpassword" / "thirdparty"
+        self.user_id_recipe_cache: LRUCache[str, str] = LRUCache(
+            USER_ID_RECIPE_CACHE_SIZE
+        )
         emailpassword_implementation = EmailPasswordImplementation(
             emailpassword_querier, get_emailpassword_config
         )
@@ -122,24 +129,51 @@ class RecipeImplementation(RecipeInterface):
 
     async def get_user_by_id(
         self, user_id: str, user_context: Dict[str, Any]
+    ) -> Union[User, None]:
+        # Probe the recipe that owned this user id last time first, so that
+        # third party users don't cost an extra emailpassword lookup.
+        if self.user_id_recipe_cache.get(user_id) == "thirdparty":
+            user = await self._get_thirdparty_user_by_id(user_id, user_context)
+            if user is not None:
+                return user
+            user = await self._get_emailpassword_user_by_id(user_id, user_context)
+        else:
+            user = await self._get_emailpassword_user_by_id(user_id, user_context)
+            if user is not None:
+                return user
+            user = await self._get_thirdparty_user_by_id(user_id, user_context)
+
+        if user is None:
+            self.user_id_recipe_cache.remove(user_id)
+        return user
+
+    async def _get_emailpassword_user_by_id(
+        self, user_id: str, user_context: Dict[str, Any]
     ) -> Union[User, None]:
         ep_user = await self.ep_get_user_by_id(user_id, user_context)
+        if ep_user is None:
+            return None
 
-        if ep_user is not None:
-            return User(
-                user_id=ep_user.user_id,
-                email=ep_user.email,
-                time_joined=ep_user.time_joined,
-                tenant_ids=ep_user.tenant_ids,
-                third_party_info=None,
-            )
+        self.user_id_recipe_cache.put(user_id, "emailpassword")
+        return User(
+            user_id=ep_user.user_id,
+            email=ep_user.email,
+            time_joined=ep_user.time_joined,
+            tenant_ids=ep_user.tenant_ids,
+            third_party_info=None,
+        )
 
+    async def _get_thirdparty_user_by_id(
+        self, user_id: str, user_context: Dict[str, Any]
+    ) -> Union[User, None]:
         if self.tp_get_user_by_id is None:
             return None
 
         tp_user = await self.tp_get_user_by_id(user_id, user_context)
         if tp_user is None:
             return None
+
+        self.user_id_recipe_cache.put(user_id, "thirdparty")
         return User(
             user_id=tp_user.user_id,
             email=tp_user.email,
@@ -228,6 +262,7 @@ class RecipeImplementation(RecipeInterface):
             tenant_id,
             user_context,
         )
+        self.user_id_recipe_cache.put(result.user.user_id, "thirdparty")
         return ThirdPartySignInUpOkResult(
             User(
                 result.user.user_id,
@@ -258,6 +293,7 @@ class RecipeImplementation(RecipeInterface):
             tenant_id,
             user_context,
         )
+        self.user_id_recipe_cache.put(result.user.user_id, "thirdparty")
         return ThirdPartyManuallyCreateOrUpdateUserOkResult(
             User(
                 result.user.user_id,
@@ -288,6 +324,7 @@ class RecipeImplementation(RecipeInterface):
     ) -> Union[EmailPasswordSignInOkResult, EmailPasswordSignInWrongCredentialsError]:
         result = await self.ep_sign_in(email, password, tenant_id, user_context)
         if isinstance(result, EPInterfaces.SignInOkResult):
+            self.user_id_recipe_cache.put(result.user.user_id, "emailpassword")
             return EmailPasswordSignInOkResult(
                 User(
                     result.user.user_id,
@@ -304,6 +341,7 @@ class RecipeImplementation(RecipeInterface):
     ) -> Union[EmailPasswordSignUpOkResult, EmailPasswordSignUpEmailAlreadyExistsError]:
         result = await self.ep_sign_up(email, password, tenant_id, user_context)
         if isinstance(result, EPInterfaces.SignUpOkResult):
+            self.user_id_recipe_cache.put(result.user.user_id, "emailpassword")
             return EmailPasswordSignUpOkResult(
                 User(
                     result.user.user_id,
@@ -14,15 +14,27 @@
 
 from __future__ import annotations
 
+import asyncio
+from math import ceil
 from os import environ
 from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Set, Union
 
 from typing_extensions import Literal
 
-from supertokens_python.logger import get_maybe_none_as_str, log_debug_message
+from supertokens_python.logger import Lazy, get_maybe_none_as_str, log_debug_message
 
-from .constants import FDI_KEY_HEADER, RID_KEY_HEADER, USER_COUNT, USER_DELETE, USERS
+from .constants import (
+    FDI_KEY_HEADER,
+    RID_KEY_HEADER,
+    SYNC_QUERIER_MAX_WORKERS,
+    USER_COUNT,
+    USER_DELETE,
+    USERS,
+)
 from .exceptions import SuperTokensError
+from .metrics import MIDDLEWARE_DISPATCH, RATE_LIMITED, get_metrics_collector
+from .json_codec import JSONCodec, JSONCodecName, set_json_codec
+from .rate_limiting import RateLimiter
 from .interfaces import (
     CreateUserIdMappingOkResult,
     DeleteUserIdMappingOkResult,
@@ -41,6 +53,7 @@ from .types import ThirdPartyInfo, User, UsersResponse
 from .utils import (
     get_rid_from_header,
     get_top_level_domain_for_same_site_resolution,
+    invalidate_request_memos,
     is_version_gte,
     normalise_http_method,
     send_non_200_response_with_message,
@@ -59,10 +72,16 @@ from .exceptions import BadInputError, GeneralError, raise_general_exception
 
 class SupertokensConfig:
     def __init__(
-        self, connection_uri: str, api_key: Union[str, None] = None
+        self,
+        connection_uri: str,
+        api_key: Union[str, None] = None,
+        wsgi_core_request_threads: int = SYNC_QUERIER_MAX_WORKERS,
     ):  # We keep this = None here because this is directly used by the user.
         self.connection_uri = connection_uri
         self.api_key = api_key
+        # In wsgi mode, the number of core requests that can be in flight at once
+        # across all the threads of the process
+        self.wsgi_core_request_threads = wsgi_core_request_threads
 
 
 class Host:
@@ -105,12 +124,8 @@ class AppInfo:
         self.api_gateway_path = NormalisedURLPath(api_gateway_path)
         self.api_domain = NormalisedURLDomain(api_domain)
         self.website_domain = NormalisedURLDomain(website_domain)
-        self.top_level_api_domain = get_top_level_domain_for_same_site_resolution(
-            self.api_domain.get_as_string_dangerous()
-        )
-        self.top_level_website_domain = get_top_level_domain_for_same_site_resolution(
-            self.website_domain.get_as_string_dangerous()
-        )
+        self._top_level_api_domain: Union[str, None] = None
+        self._top_level_website_domain: Union[str, None] = None
         self.api_base_path = self.api_gateway_path.append(
             NormalisedURLPath(api_base_path)
         )
@@ -124,6 +139,25 @@ class AppInfo:
         self.framework = framework
         self.mode = mode
 
+    @property
+    def top_level_api_domain(self) -> str:
+        # Resolved on first use since it needs the public suffix list
+        if self._top_level_api_domain is None:
+            self._top_level_api_domain = get_top_level_domain_for_same_site_resolution(
+                self.api_domain.get_as_string_dangerous()
+            )
+        return self._top_level_api_domain
+
+    @property
+    def top_level_website_domain(self) -> str:
+        if self._top_level_website_domain is None:
+            self._top_level_website_domain = (
+                get_top_level_domain_for_same_site_resolution(
+                    self.website_domain.get_as_string_dangerous()
+                )
+            )
+        return self._top_level_website_domain
+
     def toJSON(self):
         def defaultImpl(o: Any):
             if isinstance(o, (NormalisedURLDomain, NormalisedURLPath)):
@@ -150,6 +184,8 @@ class Supertokens:
         recipe_list: List[Callable[[AppInfo], RecipeModule]],
         mode: Union[Literal["asgi", "wsgi"], None],
         telemetry: Union[bool, None],
+        json_codec: Union[JSONCodecName, JSONCodec, None] = None,
+        rate_limiter: Union[RateLimiter, None] = None,
     ):
         if not isinstance(app_info, InputAppInfo):  # type: ignore
             raise ValueError("app_info must be an instance of InputAppInfo")
@@ -169,7 +205,7 @@ class Supertokens:
         log_debug_message(
             "Started SuperTokens with debug logging (supertokens.init called)"
         )
-        log_debug_message("app_info: %s", self.app_info.toJSON())
+        log_debug_message("app_info: %s", Lazy(self.app_info.toJSON))
         log_debug_message("framework: %s", framework)
         hosts = list(
             map(
@@ -179,7 +215,16 @@ class Supertokens:
                 filter(lambda x: x != "", supertokens_config.connection_uri.split(";")),
             )
         )
-        Querier.init(hosts, supertokens_config.api_key)
+        if supertokens_config.wsgi_core_request_threads < 1:
+            raise_general_exception("wsgi_core_request_threads must be at least 1")
+        Querier.init(
+            hosts,
+            supertokens_config.api_key,
+            self.app_info.mode,
+            supertokens_config.wsgi_core_request_threads,
+        )
+        set_json_codec(json_codec)
+        self.rate_limiter = rate_limiter
 
         if len(recipe_list) == 0:
             raise_general_exception(
@@ -217,10 +262,19 @@ class Supertokens:
         recipe_list: List[Callable[[AppInfo], RecipeModule]],
         mode: Union[Literal["asgi", "wsgi"], None],
         telemetry: Union[bool, None],
+        json_codec: Union[JSONCodecName, JSONCodec, None] = None,
+        rate_limiter: Union[RateLimiter, None] = None,
     ):
         if Supertokens.__instance is None:
             Supertokens.__instance = Supertokens(
-                app_info, framework, supertokens_config, recipe_list, mode, telemetry
+                app_info,
+                framework,
+                supertokens_config,
+                recipe_list,
+                mode,
+                telemetry,
+                json_codec,
+                rate_limiter,
             )
             PostSTInitCallbacks.run_post_init_callbacks()
 
@@ -231,6 +285,7 @@ class Supertokens:
         ):
             raise_general_exception("calling testing function in non testing env")
         Querier.reset()
+        set_json_codec(None)
         Supertokens.__instance = None
 
     @staticmethod
@@ -252,6 +307,22 @@ class Supertokens:
 
         return list(headers_set)
 
+    async def warm_up(self) -> None:  # pylint: disable=no-self-use
+        """
+        Negotiates the CDI version with the core and, if the session recipe is
+        initialised, fetches the JWKS used to verify access tokens. Calling this
+        before accepting traffic keeps these out of the first requests.
+        """
+        await Querier.get_instance(None).get_api_version()
+
+        from supertokens_python.recipe.session.recipe import SessionRecipe
+
+        if SessionRecipe.get_instance_optional() is not None:
+            from supertokens_python.recipe.session.jwks import get_latest_keys
+
+            # get_latest_keys is blocking, so it's run in the default executor
+            await asyncio.get_event_loop().run_in_executor(None, get_latest_keys)
+
     async def get_user_count(  # pylint: disable=no-self-use
         self,
         include_recipe_ids: Union[None, List[str]],
@@ -282,6 +353,26 @@ class Supertokens:
                 NormalisedURLPath(USER_DELETE), {"userId": user_id}
             )
 
+            from supertokens_python.recipe.emailverification.recipe import (
+                EmailVerificationRecipe,
+            )
+
+            ev_recipe = EmailVerificationRecipe.get_instance_optional()
+            if ev_recipe is not None:
+                ev_recipe.user_id_owner_cache.remove(user_id)
+
+            # The email or phone number of the deleted user is not known here
+            from supertokens_python.recipe.emailpassword.utils import (
+                email_exists_cache,
+            )
+            from supertokens_python.recipe.passwordless.utils import (
+                clear_exists_caches,
+            )
+
+            email_exists_cache.clear()
+            clear_exists_caches()
+            invalidate_request_memos()
+
             return None
         raise_general_exception("Please upgrade the SuperTokens core to >= 3.7.0")
 
@@ -492,12 +583,13 @@ class Supertokens:
         if not path.startswith(Supertokens.get_instance().app_info.api_base_path):
             log_debug_message(
                 "middleware: Not handling because request path did not start with api base path. Request path: %s",
-                path.get_as_string_dangerous(),
+                Lazy(path.get_as_string_dangerous),
             )
             return None
         request_rid = get_rid_from_header(request)
         log_debug_message(
-            "middleware: requestRID is: %s", get_maybe_none_as_str(request_rid)
+            "middleware: requestRID is: %s",
+            Lazy(lambda: get_maybe_none_as_str(request_rid)),
         )
         if request_rid is not None and request_rid == "anti-csrf":
             # see
@@ -542,7 +634,7 @@ class Supertokens:
         if matched_recipe is not None and api_and_tenant_id is None:
             log_debug_message(
                 "middleware: Not handling because recipe doesn't handle request path or method. Request path: %s, request method: %s",
-                path.get_as_string_dangerous(),
+                Lazy(path.get_as_string_dangerous),
                 method,
             )
         if api_and_tenant_id is not None and matched_recipe is not None:
@@ -550,15 +642,41 @@ class Supertokens:
                 "middleware: Request being handled by recipe. ID is: %s",
                 api_and_tenant_id.api_id,
             )
-            api_resp = await matched_recipe.handle_api_request(
-                api_and_tenant_id.api_id,
-                api_and_tenant_id.tenant_id,
-                request,
-                path,
-                method,
-                response,
-                user_context,
-            )
+            rate_limiter = Supertokens.get_instance().rate_limiter
+            if rate_limiter is not None:
+                retry_after = await rate_limiter.check(
+                    api_and_tenant_id.api_id,
+                    api_and_tenant_id.tenant_id,
+                    request,
+                    user_context,
+                )
+                if retry_after > 0:
+                    log_debug_message(
+                        "middleware: Not handling because the request is rate limited"
+                    )
+                    get_metrics_collector().increment(
+                        RATE_LIMITED, {"api_id": api_and_tenant_id.api_id}
+                    )
+                    response.set_header("Retry-After", str(ceil(retry_after)))
+                    return send_non_200_response_with_message(
+                        "Too many requests, please try again later", 429, response
+                    )
+            with get_metrics_collector().start_span(
+                MIDDLEWARE_DISPATCH,
+                {
+                    "recipe_id": matched_recipe.get_recipe_id(),
+                    "api_id": api_and_tenant_id.api_id,
+                },
+            ):
+                api_resp = await matched_recipe.handle_api_request(
+                    api_and_tenant_id.api_id,
+                    api_and_tenant_id.tenant_id,
+                    request,
+                    path,
+                    method,
+                    response,
+                    user_context,
+                )
             if api_resp is None:
                 log_debug_message("middleware: Not handled because API returned None")
             else:
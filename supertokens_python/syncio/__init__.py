@@ -11,7 +11,7 @@
 # WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
 # License for the specific language governing permissions and limitations
 # under the License.
-from typing import Dict, List, Optional, Union
+from typing import IO, Any, Callable, Dict, List, Optional, Union
 
 from supertokens_python import Supertokens
 from supertokens_python.async_to_sync_wrapper import sync
@@ -25,7 +25,13 @@ from supertokens_python.interfaces import (
     UserIdMappingAlreadyExistsError,
     UserIDTypes,
 )
-from supertokens_python.types import UsersResponse
+from supertokens_python.types import MaybeAwaitable, UsersResponse
+from supertokens_python.user_export import (
+    ExportFormat,
+    ExportUsersResult,
+    UserExportCheckpoint,
+)
+from supertokens_python.user_export import export_users as _export_users
 
 
 def get_users_oldest_first(
@@ -69,6 +75,10 @@ def delete_user(user_id: str) -> None:
     return sync(Supertokens.get_instance().delete_user(user_id))
 
 
+def warm_up() -> None:
+    return sync(Supertokens.get_instance().warm_up())
+
+
 def create_user_id_mapping(
     supertokens_user_id: str,
     external_user_id: str,
@@ -110,3 +120,37 @@ def update_or_delete_user_id_mapping_info(
             user_id, user_id_type, external_user_id_info
         )
     )
+
+
+def export_users(
+    tenant_id: str,
+    output: IO[str],
+    export_format: ExportFormat = "ndjson",
+    page_size: int = 100,
+    max_concurrency: int = 10,
+    pagination_token: Union[str, None] = None,
+    include_recipe_ids: Union[None, List[str]] = None,
+    include_metadata: bool = True,
+    include_roles: bool = True,
+    include_sessions: bool = True,
+    on_checkpoint: Union[
+        Callable[[UserExportCheckpoint], MaybeAwaitable[None]], None
+    ] = None,
+    user_context: Union[Dict[str, Any], None] = None,
+) -> ExportUsersResult:
+    return sync(
+        _export_users(
+            tenant_id,
+            output,
+            export_format,
+            page_size,
+            max_concurrency,
+            pagination_token,
+            include_recipe_ids,
+            include_metadata,
+            include_roles,
+            include_sessions,
+            on_checkpoint,
+            user_context,
+        )
+    )
@@ -0,0 +1,263 @@
+# Copyright (c) 2023, VRAI Labs and/or its affiliates. All rights reserved.
+#
+# This software is licensed under the Apache License, Version 2.0 (the
+# "License") as published by the Apache Software Foundation.
+#
+# You may not use this file except in compliance with the License. You may
+# obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import asyncio
+import csv
+import json
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    TypeVar,
+    Union,
+)
+
+from typing_extensions import Literal
+
+from .exceptions import GeneralError, raise_general_exception
+from .logger import log_debug_message
+from .supertokens import Supertokens
+from .types import MaybeAwaitable, User
+from .utils import resolve
+
+if TYPE_CHECKING:
+    from .recipe.session.interfaces import RecipeInterface as SessionRecipeInterface
+    from .recipe.usermetadata.interfaces import (
+        RecipeInterface as UserMetadataRecipeInterface,
+    )
+    from .recipe.userroles.interfaces import RecipeInterface as UserRolesRecipeInterface
+
+_T = TypeVar("_T")
+
+ExportFormat = Literal["ndjson", "csv"]
+
+CSV_COLUMNS = [
+    "recipeId",
+    "id",
+    "timeJoined",
+    "email",
+    "phoneNumber",
+    "thirdPartyId",
+    "thirdPartyUserId",
+    "tenantIds",
+    "metadata",
+    "roles",
+    "sessionHandles",
+]
+
+
+class ExportedUser:
+    def __init__(
+        self,
+        user: User,
+        metadata: Optional[Dict[str, Any]],
+        roles: Optional[List[str]],
+        session_handles: Optional[List[str]],
+    ):
+        self.user = user
+        self.metadata = metadata
+        self.roles = roles
+        self.session_handles = session_handles
+
+    def to_json(self) -> Dict[str, Any]:
+        res = self.user.to_json()
+        if self.metadata is not None:
+            res["metadata"] = self.metadata
+        if self.roles is not None:
+            res["roles"] = self.roles
+        if self.session_handles is not None:
+            res["sessionHandles"] = self.session_handles
+        return res
+
+    def to_csv_row(self) -> List[str]:
+        def optional_json(value: Any) -> str:
+            return "" if value is None else json.dumps(value)
+
+        tp_info = self.user.third_party_info
+        return [
+            self.user.recipe_id,
+            self.user.user_id,
+            str(self.user.time_joined),
+            self.user.email or "",
+            self.user.phone_number or "",
+            "" if tp_info is None else tp_info.id,
+            "" if tp_info is None else tp_info.user_id,
+            json.dumps(self.user.tenant_ids),
+            optional_json(self.metadata),
+            optional_json(self.roles),
+            optional_json(self.session_handles),
+        ]
+
+
+class UserExportCheckpoint:
+    def __init__(self, pagination_token: Union[str, None], users_exported: int):
+        # pagination_token is the token to pass back to export_users in order to
+        # resume the export. It is None once the last page has been written.
+        self.pagination_token = pagination_token
+        self.users_exported = users_exported
+
+
+class ExportUsersResult:
+    def __init__(self, users_exported: int, pages_exported: int):
+        self.users_exported = users_exported
+        self.pages_exported = pages_exported
+
+
+def _get_metadata_recipe_implementation() -> Optional[UserMetadataRecipeInterface]:
+    from .recipe.usermetadata.recipe import UserMetadataRecipe
+
+    try:
+        return UserMetadataRecipe.get_instance().recipe_implementation
+    except GeneralError:
+        return None
+
+
+def _get_user_roles_recipe_implementation() -> Optional[UserRolesRecipeInterface]:
+    from .recipe.userroles.recipe import UserRolesRecipe
+
+    try:
+        return UserRolesRecipe.get_instance().recipe_implementation
+    except GeneralError:
+        return None
+
+
+def _get_session_recipe_implementation() -> Optional[SessionRecipeInterface]:
+    from .recipe.session.recipe import SessionRecipe
+
+    try:
+        return SessionRecipe.get_instance().recipe_implementation
+    except GeneralError:
+        return None
+
+
+async def export_users(
+    tenant_id: str,
+    output: IO[str],
+    export_format: ExportFormat = "ndjson",
+    page_size: int = 100,
+    max_concurrency: int = 10,
+    pagination_token: Union[str, None] = None,
+    include_recipe_ids: Union[None, List[str]] = None,
+    include_metadata: bool = True,
+    include_roles: bool = True,
+    include_sessions: bool = True,
+    on_checkpoint: Union[
+        Callable[[UserExportCheckpoint], MaybeAwaitable[None]], None
+    ] = None,
+    user_context: Union[Dict[str, Any], None] = None,
+) -> ExportUsersResult:
+    """
+    Streams all users of a tenant (oldest first) to `output`, one page at a time.
+
+    Each user is enriched with its metadata, roles and session handles for the
+    recipes that are initialised, with at most `max_concurrency` core calls in
+    flight. After every page is written, `on_checkpoint` is called with the
+    pagination token to pass back as `pagination_token` to resume the export.
+    The CSV header is only written when an export is started from the beginning.
+    """
+    if export_format not in ("ndjson", "csv"):
+        raise_general_exception("export_format must be either 'ndjson' or 'csv'")
+    if max_concurrency < 1:
+        raise_general_exception("max_concurrency must be at least 1")
+    if user_context is None:
+        user_context = {}
+
+    metadata_impl = _get_metadata_recipe_implementation() if include_metadata else None
+    roles_impl = _get_user_roles_recipe_implementation() if include_roles else None
+    session_impl = _get_session_recipe_implementation() if include_sessions else None
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def bounded(fetch: Callable[[], Awaitable[_T]]) -> _T:
+        async with semaphore:
+            return await fetch()
+
+    async def get_metadata(user_id: str) -> Optional[Dict[str, Any]]:
+        if metadata_impl is None:
+            return None
+        res = await bounded(
+            lambda: metadata_impl.get_user_metadata(user_id, user_context)  # type: ignore
+        )
+        return res.metadata
+
+    async def get_roles(user_id: str) -> Optional[List[str]]:
+        if roles_impl is None:
+            return None
+        res = await bounded(
+            lambda: roles_impl.get_roles_for_user(user_id, tenant_id, user_context)  # type: ignore
+        )
+        return res.roles
+
+    async def get_session_handles(user_id: str) -> Optional[List[str]]:
+        if session_impl is None:
+            return None
+        return await bounded(
+            lambda: session_impl.get_all_session_handles_for_user(  # type: ignore
+                user_id, tenant_id, False, user_context
+            )
+        )
+
+    async def enrich(user: User) -> ExportedUser:
+        metadata, roles, session_handles = await asyncio.gather(
+            get_metadata(user.user_id),
+            get_roles(user.user_id),
+            get_session_handles(user.user_id),
+        )
+        return ExportedUser(user, metadata, roles, session_handles)
+
+    csv_writer = csv.writer(output) if export_format == "csv" else None
+    if csv_writer is not None and pagination_token is None:
+        csv_writer.writerow(CSV_COLUMNS)
+
+    users_exported = 0
+    pages_exported = 0
+    while True:
+        users_response = await Supertokens.get_instance().get_users(
+            tenant_id,
+            "ASC",
+            page_size,
+            pagination_token,
+            include_recipe_ids,
+        )
+        exported_users = await asyncio.gather(
+            *[enrich(user) for user in users_response.users]
+        )
+
+        for exported_user in exported_users:
+            if csv_writer is not None:
+                csv_writer.writerow(exported_user.to_csv_row())
+            else:
+                output.write(json.dumps(exported_user.to_json()) + "\n")
+        output.flush()
+
+        users_exported += len(exported_users)
+        pages_exported += 1
+        pagination_token = users_response.next_pagination_token
+        log_debug_message("export_users: exported %d users so far", users_exported)
+
+        if on_checkpoint is not None:
+            await resolve(
+                on_checkpoint(UserExportCheckpoint(pagination_token, users_exported))
+            )
+
+        if pagination_token is None:
+            break
+
+    return ExportUsersResult(users_exported, pages_exported)
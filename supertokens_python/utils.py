@@ -18,6 +18,8 @@ import asyncio
 import json
 import threading
 import warnings
+from collections import OrderedDict
+from itertools import count
 from base64 import urlsafe_b64decode, urlsafe_b64encode, b64encode, b64decode
 from math import floor
 from re import fullmatch
@@ -29,39 +31,64 @@ from typing import (
     Callable,
     Coroutine,
     Dict,
+    Generic,
+    Iterable,
     List,
+    Tuple,
     TypeVar,
     Union,
     Optional,
 )
 from urllib.parse import urlparse
 
-from httpx import HTTPStatusError, Response
-from tldextract import extract  # type: ignore
-
 from supertokens_python.async_to_sync_wrapper import check_event_loop
-from supertokens_python.framework.django.framework import DjangoFramework
-from supertokens_python.framework.fastapi.framework import FastapiFramework
-from supertokens_python.framework.flask.framework import FlaskFramework
 from supertokens_python.framework.request import BaseRequest
 from supertokens_python.framework.response import BaseResponse
-from supertokens_python.logger import log_debug_message
+from supertokens_python.logger import Lazy, log_debug_message
 
-from .constants import ERROR_MESSAGE_KEY, RID_KEY_HEADER
+from .constants import (
+    ERROR_MESSAGE_KEY,
+    REQUEST_MEMO_MAX_TRACKED_WRITES,
+    RID_KEY_HEADER,
+    TOP_LEVEL_DOMAIN_CACHE_SIZE,
+)
 from .exceptions import raise_general_exception
+from .metrics import get_metrics_collector
 from .types import MaybeAwaitable
 
 _T = TypeVar("_T")
+_K = TypeVar("_K")
 
 if TYPE_CHECKING:
-    pass
+    from supertokens_python.framework.types import Framework
+
+
+class _LazyFrameworks(Dict[str, "Framework"]):
+    # Framework adapters are only imported when a request of that framework has
+    # to be wrapped, so deployments don't pay for the frameworks they don't use.
+    def __missing__(self, key: str) -> Framework:
+        if key == "fastapi":
+            from supertokens_python.framework.fastapi.framework import (
+                FastapiFramework,
+            )
+
+            framework: Framework = FastapiFramework()
+        elif key == "flask":
+            from supertokens_python.framework.flask.framework import FlaskFramework
+
+            framework = FlaskFramework()
+        elif key == "django":
+            from supertokens_python.framework.django.framework import DjangoFramework
+
+            framework = DjangoFramework()
+        else:
+            raise KeyError(key)
+
+        self[key] = framework
+        return framework
 
 
-FRAMEWORKS = {
-    "fastapi": FastapiFramework(),
-    "flask": FlaskFramework(),
-    "django": DjangoFramework(),
-}
+FRAMEWORKS: Dict[str, Framework] = _LazyFrameworks()
 
 
 def is_an_ip_address(ip_address: str) -> bool:
@@ -228,16 +255,18 @@ def deprecated_warn(msg: str):
 def handle_httpx_client_exceptions(
     e: Exception, input_: Union[Dict[str, Any], None] = None
 ):
+    from httpx import HTTPStatusError, Response
+
     if isinstance(e, HTTPStatusError) and isinstance(e.response, Response):  # type: ignore
         res = e.response  # type: ignore
         log_debug_message("Error status: %s", res.status_code)  # type: ignore
-        log_debug_message("Error response: %s", res.json())
+        log_debug_message("Error response: %s", Lazy(res.json))
     else:
         log_debug_message("Error: %s", str(e))
 
     if input_ is not None:
         log_debug_message("Logging the input:")
-        log_debug_message("%s", json.dumps(input_))
+        log_debug_message("%s", Lazy(lambda: json.dumps(input_)))
 
 
 def humanize_time(ms: int) -> str:
@@ -283,6 +312,108 @@ def default_user_context(request: BaseRequest) -> Dict[str, Any]:
     return set_request_in_user_context_if_not_defined({}, request)
 
 
+_request_memo_lock = threading.Lock()
+_request_memo_clock = count(1)
+# (namespace, key) -> when it was last written. A None key stands for the whole
+# namespace and a None namespace for all of them.
+_request_memo_writes: OrderedDict[Tuple[Union[str, None], Any], int] = OrderedDict()
+# When the most recent write that is no longer in _request_memo_writes was made
+_request_memo_forgotten_writes = 0
+
+
+def _get_last_request_memo_write(namespace: str, key: Any) -> int:
+    with _request_memo_lock:
+        return max(
+            _request_memo_forgotten_writes,
+            _request_memo_writes.get((None, None), 0),
+            _request_memo_writes.get((namespace, None), 0),
+            _request_memo_writes.get((namespace, key), 0),
+        )
+
+
+def get_request_memo_version() -> int:
+    """
+    To be called before fetching a value that is then put in a RequestMemo. Writes
+    made after this are not missed even if they finish before the fetch does.
+    """
+    with _request_memo_lock:
+        return next(_request_memo_clock)
+
+
+class RequestMemo:
+    """
+    Values fetched from the core while handling one request, see get_request_memo.
+    A value is dropped once its key is written through the SDK.
+    """
+
+    def __init__(self, namespace: str):
+        self.namespace = namespace
+        self._entries: Dict[Any, Tuple[int, Any]] = {}
+
+    def __contains__(self, key: Any) -> bool:
+        entry = self._entries.get(key)
+        if entry is None:
+            return False
+        if _get_last_request_memo_write(self.namespace, key) >= entry[0]:
+            self._entries.pop(key, None)
+            return False
+        return True
+
+    def __getitem__(self, key: Any) -> Any:
+        return self._entries[key][1]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def put(self, key: Any, value: Any, version: int) -> None:
+        self._entries[key] = (version, value)
+
+
+def get_request_memo(
+    user_context: Dict[str, Any], namespace: str
+) -> Union[RequestMemo, None]:
+    """
+    Returns a RequestMemo that lives as long as the given user_context (i.e. one
+    request) and can be used to memoise core lookups made while handling it.
+    Returns None if `_default` has been set to something other than a dict, in
+    which case nothing should be memoised.
+    """
+    if "_default" not in user_context:
+        user_context["_default"] = {}
+
+    default = user_context["_default"]
+    if not isinstance(default, dict):
+        return None
+
+    memos: Dict[str, RequestMemo] = default.setdefault("memo", {})  # type: ignore
+    memo = memos.get(namespace)
+    if memo is None:
+        memo = RequestMemo(namespace)
+        memos[namespace] = memo
+    return memo
+
+
+def invalidate_request_memos(
+    namespace: Union[str, None] = None, keys: Union[Iterable[Any], None] = None
+) -> None:
+    """
+    To be called after a write made through the SDK, whichever user_context it
+    was made with. Drops the given keys of the namespace from the memo of every
+    request, the whole namespace if keys is None, or everything if namespace is
+    None too.
+    """
+    global _request_memo_forgotten_writes
+    written = [(namespace, None)] if keys is None else [(namespace, k) for k in keys]
+    with _request_memo_lock:
+        version = next(_request_memo_clock)
+        for write in written:
+            _request_memo_writes[write] = version
+            _request_memo_writes.move_to_end(write)
+        while len(_request_memo_writes) > REQUEST_MEMO_MAX_TRACKED_WRITES:
+            _, forgotten = _request_memo_writes.popitem(last=False)
+            _request_memo_forgotten_writes = forgotten
+
+
 async def resolve(obj: MaybeAwaitable[_T]) -> _T:
     """Returns value or value of awaitable object passed"""
     if isinstance(obj, Awaitable):
@@ -290,6 +421,34 @@ async def resolve(obj: MaybeAwaitable[_T]) -> _T:
     return obj  # type: ignore
 
 
+_tld_extractor: Any = None
+_tld_extractor_lock = threading.Lock()
+
+
+def _get_tld_extractor() -> Any:
+    global _tld_extractor
+    if _tld_extractor is not None:
+        return _tld_extractor
+
+    with _tld_extractor_lock:
+        if _tld_extractor is None:
+            from tldextract import TLDExtract  # type: ignore
+
+            # Only the public suffix list snapshot bundled with tldextract is used,
+            # so resolving a domain never fetches the list over the network or
+            # touches the disk cache. The snapshot is parsed once, on the first
+            # lookup, and the same extractor is shared by all threads.
+            extractor = TLDExtract(
+                cache_dir=False,  # type: ignore
+                suffix_list_urls=(),  # type: ignore
+                fallback_to_snapshot=True,
+                include_psl_private_domains=True,
+            )
+            extractor("example.com")
+            _tld_extractor = extractor
+    return _tld_extractor
+
+
 def get_top_level_domain_for_same_site_resolution(url: str) -> str:
     url_obj = urlparse(url)
     hostname = url_obj.hostname
@@ -297,15 +456,25 @@ def get_top_level_domain_for_same_site_resolution(url: str) -> str:
     if hostname is None:
         raise Exception("Should not come here")
 
+    top_level_domain = top_level_domains.get(hostname)
+    get_metrics_collector().record_cache_lookup(
+        "top_level_domain", top_level_domain is not None
+    )
+    if top_level_domain is not None:
+        return top_level_domain
+
     if hostname.startswith("localhost") or is_an_ip_address(hostname):
-        return "localhost"
-    parsed_url: Any = extract(hostname, include_psl_private_domains=True)
-    if parsed_url.domain == "":  # type: ignore
-        raise Exception(
-            "Please make sure that the apiDomain and websiteDomain have correct values"
-        )
+        top_level_domain = "localhost"
+    else:
+        parsed_url: Any = _get_tld_extractor()(hostname)
+        if parsed_url.domain == "":  # type: ignore
+            raise Exception(
+                "Please make sure that the apiDomain and websiteDomain have correct values"
+            )
+        top_level_domain = parsed_url.domain + "." + parsed_url.suffix  # type: ignore
 
-    return parsed_url.domain + "." + parsed_url.suffix  # type: ignore
+    top_level_domains.put(hostname, top_level_domain)
+    return top_level_domain
 
 
 class RWMutex:
@@ -360,3 +529,79 @@ class RWLockContext:
 
         if exc_type is not None:
             raise exc_type(exc_value).with_traceback(traceback)
+
+
+class LRUCache(Generic[_K, _T]):
+    """
+    A thread safe cache that holds at most `max_size` entries, evicting the
+    least recently used one when full.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._entries: OrderedDict[_K, _T] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: _K) -> Optional[_T]:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def put(self, key: _K, value: _T) -> None:
+        if self.max_size <= 0:
+            return
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def remove(self, key: _K) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class TTLCache(Generic[_K, _T]):
+    """
+    An LRUCache whose entries are only returned for `ttl_ms` after they were
+    put.
+    """
+
+    def __init__(self, max_size: int, ttl_ms: int):
+        self.ttl_ms = ttl_ms
+        self._entries: LRUCache[_K, Tuple[int, _T]] = LRUCache(max_size)
+
+    def get(self, key: _K) -> Optional[_T]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if get_timestamp_ms() - entry[0] >= self.ttl_ms:
+            self._entries.remove(key)
+            return None
+        return entry[1]
+
+    def put(self, key: _K, value: _T) -> None:
+        self._entries.put(key, (get_timestamp_ms(), value))
+
+    def remove(self, key: _K) -> None:
+        self._entries.remove(key)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Results of get_top_level_domain_for_same_site_resolution by hostname, shared by
+# everything that resolves the top level domain of an api or website domain
+top_level_domains: LRUCache[str, str] = LRUCache(TOP_LEVEL_DOMAIN_CACHE_SIZE)
@@ -13,17 +13,26 @@
 # under the License.
 
 import json
+import threading
 from urllib.parse import urlencode
 from datetime import datetime
 from inspect import isawaitable
 from base64 import b64encode
-from typing import Any, Dict, Union
+from typing import Any, Dict, List, Union
+from unittest.mock import patch
 
 from django.http import HttpRequest, HttpResponse, JsonResponse
 from django.test import RequestFactory, TestCase
 
-from supertokens_python import InputAppInfo, SupertokensConfig, init
+from supertokens_python import InputAppInfo, Supertokens, SupertokensConfig, init
+from supertokens_python.async_to_sync_wrapper import (
+    start_background_event_loop,
+    stop_background_event_loop,
+)
 from supertokens_python.framework.django import middleware
+from supertokens_python.framework.django.django_request import (
+    DjangoRequest as SuperTokensDjangoRequest,
+)
 from supertokens_python.framework.django.django_response import (
     DjangoResponse as SuperTokensDjangoWrapper,
 )
@@ -1000,3 +1009,45 @@ def test_remove_header_works():
     assert st_response.get_header("foo") == "bar"
     st_response.remove_header("foo")
     assert st_response.get_header("foo") is None
+
+
+@pytest.mark.asyncio
+async def test_request_json_is_parsed():
+    factory = RequestFactory()
+    request = SuperTokensDjangoRequest(
+        factory.post(
+            "/auth/signin",
+            json.dumps({"formFields": [{"id": "email", "value": "a@b.com"}]}),
+            content_type="application/json",
+        )
+    )
+    assert await request.json() == {"formFields": [{"id": "email", "value": "a@b.com"}]}
+
+    request = SuperTokensDjangoRequest(
+        factory.post("/auth/signin", "not json", content_type="application/json")
+    )
+    assert await request.json() == {}
+
+
+def test_sync_middleware_uses_background_event_loop():
+    reset(stop_core=False)
+    init(**{**get_st_init_args([session.init()]), "framework": "django", "mode": "wsgi"})  # type: ignore
+    threads: List[str] = []
+
+    async def st_middleware(*_: Any):
+        threads.append(threading.current_thread().name)
+        return None
+
+    def view(_: HttpRequest):
+        return HttpResponse("ok")
+
+    start_background_event_loop()
+    try:
+        with patch.object(Supertokens, "middleware", st_middleware):
+            response = middleware(view)(RequestFactory().get("/hello"))
+    finally:
+        stop_background_event_loop()
+        reset(stop_core=False)
+
+    assert response.content == b"ok"
+    assert threads == ["supertokens-event-loop"]
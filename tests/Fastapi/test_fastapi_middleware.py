@@ -0,0 +1,111 @@
+from typing import Any, List
+from unittest.mock import MagicMock
+
+from fastapi import BackgroundTasks, Depends, FastAPI
+from fastapi.requests import Request
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+from pytest import fixture
+
+from supertokens_python import init
+from supertokens_python.framework import BaseResponse
+from supertokens_python.framework.fastapi import get_middleware
+from supertokens_python.recipe import session
+from supertokens_python.recipe.session import SessionContainer
+from supertokens_python.recipe.session.exceptions import raise_unauthorised_exception
+from tests.utils import get_st_init_args, reset
+
+
+def setup_function(_: Any) -> None:
+    reset(stop_core=False)
+
+
+def teardown_function(_: Any) -> None:
+    reset(stop_core=False)
+
+
+background_tasks_run: List[str] = []
+
+
+def attach_session(request: Request):
+    def set_header(response: BaseResponse):
+        response.set_header("st-test-header", "yes")
+
+    def set_cookie(response: BaseResponse):
+        response.set_cookie("sTest", "value", 10**15)
+
+    session_container = MagicMock(spec=SessionContainer)
+    session_container.response_mutators = [set_header, set_cookie]
+    request.state.supertokens = session_container
+
+
+def unauthorised():
+    raise_unauthorised_exception("unauthorised")
+
+
+@fixture(name="client")
+def client_fixture() -> TestClient:
+    init(**get_st_init_args([session.init()]))  # type: ignore
+    app = FastAPI()
+    app.add_middleware(get_middleware())
+
+    @app.get("/plain")
+    async def plain(background_tasks: BackgroundTasks):  # type: ignore
+        background_tasks.add_task(background_tasks_run.append, "plain")
+        return {"ok": True}
+
+    @app.get("/stream")
+    async def stream():  # type: ignore
+        async def chunks():
+            for i in range(3):
+                yield f"chunk{i};"
+
+        return StreamingResponse(chunks())
+
+    @app.get("/with-session", dependencies=[Depends(attach_session)])
+    async def with_session():  # type: ignore
+        return {"ok": True}
+
+    @app.get("/unauthorised", dependencies=[Depends(unauthorised)])
+    async def unauthorised_route():  # type: ignore
+        return {}
+
+    @app.post("/auth/custom")
+    async def custom():  # type: ignore
+        return {"custom": True}
+
+    return TestClient(app)
+
+
+def test_requests_not_handled_by_supertokens_reach_the_app(client: TestClient):
+    background_tasks_run.clear()
+
+    response = client.get("/plain")
+    assert response.json() == {"ok": True}
+    assert "st-test-header" not in response.headers
+    assert background_tasks_run == ["plain"]
+
+    assert client.get("/stream").text == "chunk0;chunk1;chunk2;"
+
+    # under the api base path, but not an API of any recipe
+    assert client.post("/auth/custom").json() == {"custom": True}
+
+
+def test_supertokens_apis_are_handled(client: TestClient):
+    response = client.post("/auth/signout")
+    assert response.status_code == 200
+    assert response.json() == {"status": "OK"}
+
+
+def test_session_changes_are_applied_to_app_responses(client: TestClient):
+    response = client.get("/with-session")
+    assert response.json() == {"ok": True}
+    assert response.headers["st-test-header"] == "yes"
+    assert response.cookies["sTest"] == "value"
+    assert response.headers["content-type"] == "application/json"
+
+
+def test_supertokens_errors_raised_by_the_app_are_handled(client: TestClient):
+    response = client.get("/unauthorised")
+    assert response.status_code == 401
+    assert response.json() == {"message": "unauthorised"}
@@ -0,0 +1,115 @@
+import asyncio
+import threading
+from typing import Any, Dict, List
+from unittest.mock import patch
+
+import httpx
+from pytest import mark
+
+from supertokens_python import Supertokens, init
+from supertokens_python.querier import Querier
+from supertokens_python.recipe import dashboard
+from supertokens_python.recipe.dashboard.api import analytics
+from supertokens_python.recipe.dashboard.api.analytics import handle_analytics_post
+from tests.utils import MagicMock, get_st_init_args, reset
+
+pytestmark = mark.asyncio
+
+
+def setup_function(_: Any) -> None:
+    reset(stop_core=False)
+
+
+def teardown_function(_: Any) -> None:
+    reset(stop_core=False)
+
+
+def get_api_options(body: Dict[str, Any]) -> Any:
+    async def json():
+        return body
+
+    api_options = MagicMock()
+    api_options.request.json = json
+    api_options.app_info = Supertokens.get_instance().app_info
+    return api_options
+
+
+async def wait_for_pending_events():
+    while analytics.pending_events:
+        await asyncio.sleep(0.01)
+
+
+async def test_analytics_are_sent_in_background_once_per_window():
+    init(**{**get_st_init_args([dashboard.init()]), "telemetry": True})  # type: ignore
+    core_calls: List[str] = []
+    events: List[Dict[str, Any]] = []
+    core_responded = threading.Event()
+
+    async def send_get_request(_: Querier, path: Any, *__: Any):
+        core_responded.wait(1)
+        core_calls.append(path.get_as_string_dangerous())
+        return {"exists": True, "telemetryId": "telemetry-id"}
+
+    async def get_user_count(*_: Any, **__: Any):
+        core_calls.append("user count")
+        return 10
+
+    async def post(_: httpx.AsyncClient, url: str, json: Dict[str, Any], **__: Any):
+        events.append(json)
+
+    body = {"email": "admin@example.com", "dashboardVersion": "1.0"}
+    with patch.object(Querier, "send_get_request", send_get_request), patch.object(
+        Supertokens, "get_user_count", get_user_count
+    ), patch.object(httpx.AsyncClient, "post", post):
+        # returns before the core has answered
+        await asyncio.wait_for(handle_analytics_post(None, "public", get_api_options(body), {}), 1)  # type: ignore
+        assert events == []
+
+        # not sent twice while pending
+        await handle_analytics_post(None, "public", get_api_options(body), {})  # type: ignore
+        assert len(analytics.pending_events) == 1
+
+        core_responded.set()
+        await wait_for_pending_events()
+        assert len(events) == 1
+        assert events[0]["numberOfUsers"] == 10
+        assert events[0]["telemetryId"] == "telemetry-id"
+
+        # deduplicated within the window
+        await handle_analytics_post(None, "public", get_api_options(body), {})  # type: ignore
+        assert len(analytics.pending_events) == 0
+
+        # the user count is cached for a new dashboard version
+        body = {**body, "dashboardVersion": "1.1"}
+        await handle_analytics_post(None, "public", get_api_options(body), {})  # type: ignore
+        await wait_for_pending_events()
+
+    assert len(events) == 2
+    assert core_calls == ["/telemetry", "user count", "/telemetry"]
+
+
+async def test_failed_analytics_event_is_retried():
+    init(**{**get_st_init_args([dashboard.init()]), "telemetry": True})  # type: ignore
+    attempts: List[str] = []
+
+    async def send_get_request(*_: Any):
+        attempts.append("telemetry")
+        if len(attempts) == 1:
+            raise Exception("core is down")
+        return {"exists": False}
+
+    async def get_user_count(*_: Any, **__: Any):
+        return 10
+
+    async def post(*_: Any, **__: Any):
+        pass
+
+    body = {"email": "admin@example.com", "dashboardVersion": "1.0"}
+    with patch.object(Querier, "send_get_request", send_get_request), patch.object(
+        Supertokens, "get_user_count", get_user_count
+    ), patch.object(httpx.AsyncClient, "post", post):
+        for _ in range(3):
+            await handle_analytics_post(None, "public", get_api_options(body), {})  # type: ignore
+            await wait_for_pending_events()
+
+    assert attempts == ["telemetry", "telemetry"]
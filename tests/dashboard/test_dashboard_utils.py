@@ -0,0 +1,120 @@
+import asyncio
+from typing import Any, Dict, List
+from unittest.mock import MagicMock, patch
+
+from pytest import mark, raises
+
+from supertokens_python.recipe.dashboard import utils
+from supertokens_python.recipe.dashboard.api.userdetails import (
+    user_put,
+    user_sessions_get,
+)
+from supertokens_python.recipe.dashboard.utils import get_user_for_recipe_id
+from supertokens_python.recipe.emailpassword.types import User
+from supertokens_python.recipe.session.interfaces import SessionInformationResult
+
+pytestmark = mark.asyncio
+
+
+async def test_get_user_for_recipe_id_returns_first_success_and_cancels_other():
+    slow_lookup_cancelled = asyncio.Event()
+
+    async def slow_get_user_by_id(_: str):
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            slow_lookup_cancelled.set()
+            raise
+
+    async def fast_get_user_by_id(user_id: str):
+        return User(user_id, "a@b.com", 1, ["public"])
+
+    with patch.object(utils, "ep_get_user_by_id", slow_get_user_by_id), patch.object(
+        utils, "tpep_get_user_by_id", fast_get_user_by_id
+    ):
+        result = await asyncio.wait_for(
+            get_user_for_recipe_id("user1", "emailpassword"), 1
+        )
+        await asyncio.wait_for(slow_lookup_cancelled.wait(), 1)
+
+    assert result is not None
+    assert result.recipe == "thirdpartyemailpassword"
+    assert result.user.user_id == "user1"
+
+
+async def test_get_user_for_recipe_id_ignores_failed_lookups():
+    async def failing_get_user_by_id(_: str):
+        raise Exception("recipe not initialised")
+
+    async def missing_get_user_by_id(_: str):
+        return None
+
+    with patch.object(
+        utils, "pless_get_user_by_id", failing_get_user_by_id
+    ), patch.object(utils, "tppless_get_user_by_id", missing_get_user_by_id):
+        result = await get_user_for_recipe_id("user1", "passwordless")
+
+    assert result is None
+
+
+async def test_user_put_does_not_update_metadata_of_unknown_user():
+    metadata_updates: List[str] = []
+
+    async def get_user_for_recipe_id(*_: Any):
+        return None
+
+    async def update_user_metadata(user_id: str, *_: Any):
+        metadata_updates.append(user_id)
+
+    async def json() -> Dict[str, Any]:
+        return {
+            "userId": "unknown",
+            "recipeId": "emailpassword",
+            "firstName": "first",
+            "lastName": "",
+            "email": "",
+            "phone": "",
+        }
+
+    api_options = MagicMock()
+    api_options.request.json = json
+
+    with patch.object(
+        user_put, "get_user_for_recipe_id", get_user_for_recipe_id
+    ), patch.object(user_put, "update_user_metadata", update_user_metadata), patch(
+        "supertokens_python.recipe.usermetadata.UserMetadataRecipe.get_instance"
+    ):
+        with raises(Exception, match="Should never come here"):
+            await user_put.handle_user_put(MagicMock(), "public", api_options, {})
+
+    assert metadata_updates == []
+
+
+async def test_sessions_get_skips_sessions_that_fail_to_load():
+    async def get_all_session_handles_for_user(*_: Any):
+        return ["handle1", "handle2", "handle3"]
+
+    async def get_session_information(session_handle: str, *_: Any):
+        if session_handle == "handle2":
+            raise Exception("core error")
+        if session_handle == "handle3":
+            return None
+        return SessionInformationResult(
+            session_handle, "user1", {}, 2000, {}, 1000, "public"
+        )
+
+    api_options = MagicMock()
+    api_options.request.get_query_param.return_value = "user1"
+
+    with patch.object(
+        user_sessions_get,
+        "get_all_session_handles_for_user",
+        get_all_session_handles_for_user,
+    ), patch.object(
+        user_sessions_get, "get_session_information", get_session_information
+    ):
+        response = await user_sessions_get.handle_sessions_get(
+            MagicMock(), "public", api_options, {}
+        )
+
+    assert [s["sessionHandle"] for s in response.sessions] == ["handle1"]
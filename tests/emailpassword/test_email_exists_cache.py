@@ -0,0 +1,137 @@
+from typing import Any, Dict, List
+from unittest.mock import patch
+
+from pytest import fixture, mark
+
+from supertokens_python import Supertokens, init
+from supertokens_python.metrics import InMemoryMetricsCollector, set_metrics_collector
+from supertokens_python.normalised_url_path import NormalisedURLPath
+from supertokens_python.querier import Querier
+from supertokens_python.recipe import emailpassword, passwordless
+from supertokens_python.recipe.emailpassword.api.implementation import (
+    APIImplementation,
+)
+from supertokens_python.recipe.emailpassword.recipe_implementation import (
+    RecipeImplementation,
+)
+from supertokens_python.recipe.emailpassword.utils import email_exists_cache
+from supertokens_python.recipe.passwordless.utils import phone_number_exists_cache
+from tests.utils import get_st_init_args, reset
+
+pytestmark = mark.asyncio
+
+USER = {"id": "user1", "email": "john@example.com", "timeJoined": 1, "tenantIds": []}
+
+
+class FakeQuerier:
+    def __init__(self):
+        self.emails: List[str] = []
+        self.lookups = 0
+
+    async def send_get_request(self, _: NormalisedURLPath, params: Dict[str, Any]):
+        self.lookups += 1
+        if params["email"].lower() in self.emails:
+            return {"status": "OK", "user": USER}
+        return {"status": "UNKNOWN_EMAIL_ERROR"}
+
+    async def send_post_request(self, _: NormalisedURLPath, data: Dict[str, Any]):
+        self.emails.append(data["email"].lower())
+        return {"status": "OK", "user": USER}
+
+    async def send_put_request(self, _: NormalisedURLPath, data: Dict[str, Any]):
+        return {"status": "OK"}
+
+
+class APIOptions:
+    def __init__(self, recipe_implementation: RecipeImplementation):
+        self.recipe_implementation = recipe_implementation
+
+
+@fixture(name="collector")
+def collector_fixture():
+    email_exists_cache.clear()
+    collector = InMemoryMetricsCollector()
+    set_metrics_collector(collector)
+    yield collector
+    set_metrics_collector(None)
+    email_exists_cache.clear()
+
+
+async def test_email_exists_is_cached_and_updated_on_sign_up(
+    collector: InMemoryMetricsCollector,
+):
+    querier = FakeQuerier()
+    recipe_implementation = RecipeImplementation(querier, lambda: None)  # type: ignore
+    api_options = APIOptions(recipe_implementation)
+    api = APIImplementation()
+
+    async def email_exists(email: str, tenant_id: str = "public") -> bool:
+        result = await api.email_exists_get(email, tenant_id, api_options, {})  # type: ignore
+        return result.exists  # type: ignore
+
+    assert await email_exists("john@example.com") is False
+    assert await email_exists(" John@example.com") is False
+    assert querier.lookups == 1
+
+    await recipe_implementation.sign_up("john@example.com", "password1", "public", {})
+    assert await email_exists("john@example.com") is True
+    assert querier.lookups == 1
+
+    # other tenants are not affected by the sign up
+    await email_exists("john@example.com", "tenant1")
+    assert querier.lookups == 2
+
+    await recipe_implementation.update_email_or_password(
+        "user1", "jane@example.com", None, False, "public", {}
+    )
+    assert await email_exists("john@example.com") is True
+    assert querier.lookups == 3
+
+    assert collector.get_cache_hit_ratio("email_exists") == 2 / 5
+
+
+async def test_cached_email_exists_results_expire(collector: InMemoryMetricsCollector):
+    querier = FakeQuerier()
+    api_options = APIOptions(RecipeImplementation(querier, lambda: None))  # type: ignore
+    api = APIImplementation()
+
+    await api.email_exists_get("john@example.com", "public", api_options, {})  # type: ignore
+    email_exists_cache.ttl_ms = 0
+    try:
+        await api.email_exists_get("john@example.com", "public", api_options, {})  # type: ignore
+    finally:
+        email_exists_cache.ttl_ms = 10000
+
+    assert querier.lookups == 2
+
+
+async def test_deleting_a_user_clears_the_exists_caches(
+    collector: InMemoryMetricsCollector,
+):
+    reset(stop_core=False)
+    init(
+        **get_st_init_args(  # type: ignore
+            [
+                emailpassword.init(),
+                passwordless.init(
+                    contact_config=passwordless.ContactPhoneOnlyConfig(),
+                    flow_type="USER_INPUT_CODE",
+                ),
+            ]
+        )
+    )
+    Querier.api_version = "3.0"
+    email_exists_cache.put(("public", "john@example.com"), True)
+    phone_number_exists_cache.put(("public", "+16502530000"), True)
+
+    async def send_post_request(*_: Any):
+        return {"status": "OK"}
+
+    try:
+        with patch.object(Querier, "send_post_request", send_post_request):
+            await Supertokens.get_instance().delete_user("user1")
+
+        assert email_exists_cache.get(("public", "john@example.com")) is None
+        assert phone_number_exists_cache.get(("public", "+16502530000")) is None
+    finally:
+        reset(stop_core=False)
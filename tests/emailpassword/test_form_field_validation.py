@@ -0,0 +1,94 @@
+import asyncio
+from typing import List, Union
+
+from pytest import mark, raises
+
+from supertokens_python.recipe.emailpassword.api.utils import (
+    validate_form_or_throw_error,
+)
+from supertokens_python.recipe.emailpassword.exceptions import FieldError
+from supertokens_python.recipe.emailpassword.types import FormField, InputFormField
+from supertokens_python.recipe.emailpassword.utils import (
+    default_email_validator,
+    default_password_validator,
+    normalise_sign_up_form_fields,
+)
+
+pytestmark = mark.asyncio
+
+
+async def get_errors(form_fields: List[InputFormField], inputs: List[FormField]):
+    try:
+        await validate_form_or_throw_error(
+            inputs, normalise_sign_up_form_fields(form_fields), "public"
+        )
+    except FieldError as e:
+        return e.get_json_form_fields()
+    return []
+
+
+async def test_default_validators():
+    assert await default_email_validator("john@example.com", "public") is None
+    assert await default_email_validator("john@example", "public") is not None
+    assert await default_email_validator(123, "public") is not None
+    assert await default_password_validator("validPass123", "public") is None
+    assert await default_password_validator("validPass", "public") == (
+        "Password must contain at least one number"
+    )
+    assert await default_password_validator("12345678", "public") == (
+        "Password must contain at least one alphabet"
+    )
+    assert await default_password_validator("validPass\n123", "public") == (
+        "Password must contain at least one alphabet"
+    )
+
+
+async def test_errors_are_in_config_order():
+    errors = await get_errors(
+        [InputFormField("name")],
+        [
+            FormField("password", "short"),
+            FormField("email", "not-an-email"),
+            FormField("name", ""),
+        ],
+    )
+
+    assert [e["id"] for e in errors] == ["name", "password", "email"]
+    assert errors[0]["error"] == "Field is not optional"
+
+
+async def test_custom_validators_run_concurrently():
+    started: List[str] = []
+    both_started = asyncio.Event()
+
+    def create_validator(error: Union[str, None]):
+        async def validate(value: str, _: str) -> Union[str, None]:
+            started.append(value)
+            if len(started) == 2:
+                both_started.set()
+            await asyncio.wait_for(both_started.wait(), 1)
+            return error
+
+        return validate
+
+    errors = await get_errors(
+        [
+            InputFormField("first", create_validator(None)),
+            InputFormField("second", create_validator("Invalid")),
+        ],
+        [
+            FormField("email", "john@example.com"),
+            FormField("password", "validPass123"),
+            FormField("first", "a"),
+            FormField("second", "b"),
+        ],
+    )
+
+    assert sorted(started) == ["a", "b"]
+    assert errors == [{"id": "second", "error": "Invalid"}]
+
+
+async def test_wrong_number_of_fields():
+    with raises(Exception) as e:
+        await get_errors([], [FormField("email", "john@example.com")])
+    assert "too many / too few formFields" in str(e.value)
@@ -0,0 +1,55 @@
+from typing import Any
+from unittest.mock import patch
+
+import phonenumbers  # type: ignore
+from pytest import mark
+
+from supertokens_python.recipe.passwordless import utils
+from supertokens_python.recipe.passwordless.utils import (
+    default_validate_phone_number,
+    get_phone_number_exists_cache_key,
+    parse_phone_number,
+)
+
+
+def setup_function(_: Any) -> None:
+    utils.phone_numbers.clear()
+
+
+def test_parse_phone_number():
+    assert parse_phone_number("+1 650-253-0000") == (True, "+16502530000")
+    assert parse_phone_number("+91 1234") == (False, "+911234")
+    assert parse_phone_number("not a number") == (False, None)
+
+
+def test_parsed_phone_numbers_are_cached():
+    with patch.object(phonenumbers, "parse", wraps=phonenumbers.parse) as parse:  # type: ignore
+        for _ in range(3):
+            assert parse_phone_number("+1 650-253-0000") == (True, "+16502530000")
+            assert parse_phone_number("not a number") == (False, None)
+
+    assert parse.call_count == 2
+
+
+@mark.asyncio
+async def test_default_validate_phone_number():
+    assert await default_validate_phone_number("+16502530000", "public") is None
+    assert (
+        await default_validate_phone_number("+91 1234", "public")
+        == "Phone number is invalid"
+    )
+
+
+def test_phone_number_exists_cache_key_uses_the_e164_format():
+    assert get_phone_number_exists_cache_key("public", " +1 650-253-0000") == (
+        "public",
+        "+16502530000",
+    )
+    assert get_phone_number_exists_cache_key("public", "+16502530000") == (
+        "public",
+        "+16502530000",
+    )
+    assert get_phone_number_exists_cache_key("public", " not a number ") == (
+        "public",
+        "not a number",
+    )
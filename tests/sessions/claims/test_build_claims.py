@@ -0,0 +1,41 @@
+import asyncio
+from typing import Any, Dict, List
+
+from pytest import mark
+
+from supertokens_python.recipe.session.claims import PrimitiveClaim, SessionClaim
+from supertokens_python.recipe.session.utils import (
+    build_access_token_payload_from_claims,
+)
+
+pytestmark = mark.asyncio
+
+
+async def test_claims_are_built_concurrently_and_merged_in_order(timestamp: int):
+    in_flight: List[str] = []
+    max_in_flight = 0
+
+    def slow_claim(key: str, value: str) -> SessionClaim[Any]:
+        async def fetch_value(_: str, __: str, ___: Dict[str, Any]):
+            nonlocal max_in_flight
+            in_flight.append(key)
+            max_in_flight = max(max_in_flight, len(in_flight))
+            await asyncio.sleep(0.01)
+            in_flight.remove(key)
+            return value
+
+        claim: SessionClaim[Any] = PrimitiveClaim(key, fetch_value)
+        return claim
+
+    claims = [slow_claim("a", "1"), slow_claim("b", "2"), slow_claim("a", "3")]
+
+    payload = await build_access_token_payload_from_claims(
+        claims, {"iss": "issuer", "a": "0"}, "user_id", "public", {}
+    )
+
+    assert max_in_flight == 3
+    assert payload == {
+        "iss": "issuer",
+        "a": {"v": "3", "t": timestamp},
+        "b": {"v": "2", "t": timestamp},
+    }
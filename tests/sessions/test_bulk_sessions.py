@@ -0,0 +1,97 @@
+import asyncio
+from typing import Any, Dict, List
+
+from pytest import mark, raises
+
+from supertokens_python import init
+from supertokens_python.recipe import session
+from supertokens_python.recipe.session.asyncio import (
+    get_session_information_bulk,
+    revoke_all_sessions_for_users,
+)
+from supertokens_python.recipe.session.constants import (
+    MAX_CONCURRENT_BULK_SESSION_REQUESTS,
+)
+from supertokens_python.recipe.session.recipe import SessionRecipe
+from supertokens_python.recipe.session.utils import map_with_bounded_concurrency
+from tests.utils import get_st_init_args, reset
+
+pytestmark = mark.asyncio
+
+
+def setup_function(_: Any) -> None:
+    reset(stop_core=False)
+
+
+def teardown_function(_: Any) -> None:
+    reset(stop_core=False)
+
+
+class ConcurrencyTracker:
+    def __init__(self):
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def track(self):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.001)
+        self.in_flight -= 1
+
+
+async def test_get_session_information_bulk_is_bounded_and_ordered():
+    init(**get_st_init_args([session.init()]))  # type: ignore
+    tracker = ConcurrencyTracker()
+
+    async def get_session_information(session_handle: str, _: Dict[str, Any]):
+        await tracker.track()
+        return None if session_handle == "handle3" else session_handle
+
+    SessionRecipe.get_instance().recipe_implementation.get_session_information = get_session_information  # type: ignore
+
+    handles = ["handle" + str(i) for i in range(50)]
+    result = await get_session_information_bulk(handles)
+
+    assert result == [None if h == "handle3" else h for h in handles]
+    assert tracker.max_in_flight == MAX_CONCURRENT_BULK_SESSION_REQUESTS
+
+
+async def test_revoke_all_sessions_for_users_consumes_a_generator():
+    init(**get_st_init_args([session.init()]))  # type: ignore
+    tracker = ConcurrencyTracker()
+    revoked_for: List[str] = []
+
+    async def revoke_all_sessions_for_user(
+        user_id: str, tenant_id: str, revoke_across_all_tenants: bool, _: Any
+    ):
+        assert tenant_id == "public" and revoke_across_all_tenants
+        await tracker.track()
+        revoked_for.append(user_id)
+        return [user_id + "-a", user_id + "-b"]
+
+    SessionRecipe.get_instance().recipe_implementation.revoke_all_sessions_for_user = revoke_all_sessions_for_user  # type: ignore
+
+    result = await revoke_all_sessions_for_users("user" + str(i) for i in range(30))
+
+    assert len(revoked_for) == 30
+    assert result[:4] == ["user0-a", "user0-b", "user1-a", "user1-b"]
+    assert len(result) == 60
+    assert tracker.max_in_flight == MAX_CONCURRENT_BULK_SESSION_REQUESTS
+
+
+async def test_map_with_bounded_concurrency_stops_on_error():
+    started: List[int] = []
+
+    async def func(i: int):
+        started.append(i)
+        await asyncio.sleep(0.001)
+        if i == 2:
+            raise ValueError()
+        return i
+
+    with raises(ValueError):
+        await map_with_bounded_concurrency(range(100), func, 3)
+    await asyncio.sleep(0.01)
+
+    assert len(started) < 10
+    assert await map_with_bounded_concurrency([], func, 3) == []
@@ -0,0 +1,100 @@
+from typing import Any, Dict, List
+from unittest.mock import patch
+
+from pytest import mark, raises
+
+from supertokens_python import init
+from supertokens_python.recipe import session
+from supertokens_python.recipe.session import session_functions
+from supertokens_python.recipe.session.check_database_cache import (
+    CheckDatabaseCache,
+)
+from tests.utils import MagicMock, get_st_init_args, reset
+
+pytestmark = mark.asyncio
+
+
+def test_cache_expires_and_ignores_revoked_sessions():
+    cache = CheckDatabaseCache(max_age_ms=1000)
+    with patch(
+        "supertokens_python.recipe.session.check_database_cache.get_timestamp_ms",
+        return_value=0,
+    ) as now:
+        cache.mark_verified("handle")
+        assert cache.was_verified_recently("handle")
+
+        now.return_value = 1000
+        assert not cache.was_verified_recently("handle")
+
+        cache.mark_verified("handle")
+        cache.mark_revoked(["handle"])
+        assert not cache.was_verified_recently("handle")
+
+        # a verification that was in flight while revoking
+        cache.mark_verified("handle")
+        assert not cache.was_verified_recently("handle")
+
+
+async def test_get_session_with_check_database_uses_cache():
+    verify_calls: List[Dict[str, Any]] = []
+
+    async def send_post_request(path: Any, data: Dict[str, Any]):
+        if path.get_as_string_dangerous() == "/recipe/session/remove":
+            return {"sessionHandlesRevoked": data["sessionHandles"]}
+        verify_calls.append(data)
+        return {
+            "status": "OK",
+            "session": {
+                "handle": "handle",
+                "userId": "user",
+                "userDataInJWT": {},
+                "tenantId": "public",
+            },
+        }
+
+    recipe_implementation = MagicMock()
+    recipe_implementation.config.anti_csrf = "NONE"
+    recipe_implementation.config.use_dynamic_access_token_signing_key = True
+    recipe_implementation.check_database_cache = CheckDatabaseCache(60000)
+    recipe_implementation.querier.send_post_request = send_post_request
+
+    parsed_access_token = MagicMock()
+    parsed_access_token.version = 3
+    parsed_access_token.kid = "d-1"
+    access_token_info = {
+        "sessionHandle": "handle",
+        "userId": "user",
+        "userData": {},
+        "expiryTime": 1,
+        "tenantId": "public",
+        "parentRefreshTokenHash1": None,
+        "antiCsrfToken": None,
+    }
+
+    async def get_session():
+        return await session_functions.get_session(
+            recipe_implementation, parsed_access_token, None, False, True
+        )
+
+    with patch.object(
+        session_functions,
+        "get_info_from_access_token",
+        return_value=access_token_info,
+    ):
+        await get_session()
+        await get_session()
+        assert len(verify_calls) == 1
+
+        await session_functions.revoke_session(recipe_implementation, "handle")
+        await get_session()
+        assert len(verify_calls) == 2
+
+
+def test_max_age_must_not_be_negative():
+    reset(stop_core=False)
+    init(**get_st_init_args([session.init(check_database_cache_max_age_ms=0)]))  # type: ignore
+
+    reset(stop_core=False)
+    with raises(ValueError, match="must be a non-negative number"):
+        init(**get_st_init_args([session.init(check_database_cache_max_age_ms=-1)]))  # type: ignore
+    reset(stop_core=False)
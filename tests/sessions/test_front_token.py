@@ -0,0 +1,77 @@
+from typing import Any
+from unittest.mock import patch
+
+from fastapi.responses import Response
+from pytest import mark
+
+from supertokens_python import init
+from supertokens_python.framework.fastapi.fastapi_response import FastApiResponse
+from supertokens_python.recipe import session
+from supertokens_python.recipe.session import cookie_and_header
+from supertokens_python.recipe.session.cookie_and_header import (
+    access_token_mutator,
+    build_front_token,
+    get_front_token,
+)
+from supertokens_python.recipe.session.recipe import SessionRecipe
+from tests.utils import get_st_init_args, reset
+
+
+def setup_function(_: Any) -> None:
+    reset(stop_core=False)
+
+
+def teardown_function(_: Any) -> None:
+    reset(stop_core=False)
+
+
+def test_front_token_is_built_once_per_access_token():
+    payload = {"sub": "user1", "role": "admin"}
+
+    with patch.object(
+        cookie_and_header, "build_front_token", wraps=build_front_token
+    ) as build:
+        front_token = get_front_token("access-token-1", "user1", 1000, payload)
+        assert get_front_token("access-token-1", "user1", 1000, payload) == front_token
+        get_front_token("access-token-2", "user1", 1000, payload)
+
+    assert front_token == build_front_token("user1", 1000, payload)
+    assert build.call_count == 2
+
+
+@mark.parametrize(
+    "transfer_method,expose_access_token,expose_headers,access_token_header",
+    [
+        ("cookie", False, "rid,front-token", None),
+        ("cookie", True, "rid,front-token,st-access-token", "token"),
+        ("header", False, "rid,front-token,st-access-token", "token"),
+    ],
+)
+def test_access_token_response_headers(
+    transfer_method: Any,
+    expose_access_token: bool,
+    expose_headers: str,
+    access_token_header: Any,
+):
+    init(
+        **get_st_init_args(
+            [
+                session.init(
+                    expose_access_token_to_frontend_in_cookie_based_auth=expose_access_token
+                )
+            ]
+        )
+    )
+    response = FastApiResponse(Response())
+    response.set_header("Access-Control-Expose-Headers", "rid")
+
+    access_token_mutator(
+        "token", "front", SessionRecipe.get_instance().config, transfer_method
+    )(response)
+
+    assert response.get_header("front-token") == "front"
+    assert response.get_header("st-access-token") == access_token_header
+    assert response.get_header("Access-Control-Expose-Headers") == expose_headers
+    assert ("sAccessToken" in response.response.headers.get("set-cookie", "")) == (
+        transfer_method == "cookie"
+    )
@@ -0,0 +1,156 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from threading import Barrier
+from typing import Any, Dict, List
+from unittest.mock import patch
+
+from pytest import mark, raises
+
+from supertokens_python.recipe.session import session_functions
+from supertokens_python.recipe.session.exceptions import TokenTheftError
+from tests.utils import MagicMock
+
+pytestmark = mark.asyncio
+
+
+def setup_function(_: Any) -> None:
+    session_functions.refreshes_in_progress.clear()
+    session_functions.recent_refreshes.clear()
+
+
+def get_recipe_implementation(
+    calls: List[Dict[str, Any]], status: str = "OK", delay: float = 0.01
+):
+    async def send_post_request(_: Any, data: Dict[str, Any]):
+        calls.append(data)
+        await asyncio.sleep(delay)
+        session = {
+            "handle": "handle",
+            "userId": "user",
+            "userDataInJWT": {},
+            "tenantId": "public",
+        }
+        token = {"token": "token" + str(len(calls)), "expiry": 1, "createdTime": 1}
+        return {
+            "status": status,
+            "session": session,
+            "accessToken": token,
+            "refreshToken": token,
+        }
+
+    recipe_implementation = MagicMock()
+    recipe_implementation.config.anti_csrf = "NONE"
+    recipe_implementation.querier.send_post_request = send_post_request
+    return recipe_implementation
+
+
+async def test_concurrent_refreshes_share_one_core_call():
+    calls: List[Dict[str, Any]] = []
+    recipe_implementation = get_recipe_implementation(calls)
+
+    responses = await asyncio.gather(
+        *[
+            session_functions.refresh_session(
+                recipe_implementation, "refresh-token", None, False
+            )
+            for _ in range(5)
+        ]
+    )
+
+    assert len(calls) == 1
+    assert {r.accessToken.token for r in responses} == {"token1"}
+
+    # reused for a short while after the refresh finished
+    response = await session_functions.refresh_session(
+        recipe_implementation, "refresh-token", None, False
+    )
+    assert response.accessToken.token == "token1"
+    assert len(calls) == 1
+
+    # but not once the window is over
+    with patch.object(session_functions, "REFRESH_RESULT_REUSE_WINDOW_MS", 0):
+        response = await session_functions.refresh_session(
+            recipe_implementation, "refresh-token", None, False
+        )
+    assert response.accessToken.token == "token2"
+
+    await session_functions.refresh_session(
+        recipe_implementation, "other-refresh-token", None, False
+    )
+    assert len(calls) == 3
+
+
+async def test_failed_refresh_is_shared_but_not_reused():
+    calls: List[Dict[str, Any]] = []
+    recipe_implementation = get_recipe_implementation(calls, "TOKEN_THEFT_DETECTED")
+
+    results = await asyncio.gather(
+        *[
+            session_functions.refresh_session(
+                recipe_implementation, "refresh-token", None, False
+            )
+            for _ in range(2)
+        ],
+        return_exceptions=True,
+    )
+    assert len(calls) == 1
+    assert all(isinstance(r, TokenTheftError) for r in results)
+
+    with raises(TokenTheftError):
+        await session_functions.refresh_session(
+            recipe_implementation, "refresh-token", None, False
+        )
+    assert len(calls) == 2
+
+
+async def test_refreshes_on_other_threads_event_loops_share_one_core_call():
+    calls: List[Dict[str, Any]] = []
+    recipe_implementation = get_recipe_implementation(calls, delay=0.2)
+    thread_count = 4
+    barrier = Barrier(thread_count)
+
+    def refresh_on_own_event_loop():
+        # like sync() does for each Flask or Django request
+        loop = asyncio.new_event_loop()
+        try:
+            barrier.wait()
+            return loop.run_until_complete(
+                session_functions.refresh_session(
+                    recipe_implementation, "refresh-token", None, False
+                )
+            )
+        finally:
+            loop.close()
+
+    with ThreadPoolExecutor(thread_count) as executor:
+        futures = [
+            executor.submit(refresh_on_own_event_loop) for _ in range(thread_count)
+        ]
+        responses = [f.result() for f in futures]
+
+    assert len(calls) == 1
+    assert {r.accessToken.token for r in responses} == {"token1"}
+    assert session_functions.refreshes_in_progress == {}
+
+
+async def test_waiting_refreshes_retry_if_the_refreshing_call_is_cancelled():
+    calls: List[Dict[str, Any]] = []
+    recipe_implementation = get_recipe_implementation(calls, delay=0.05)
+
+    refreshing = asyncio.ensure_future(
+        session_functions.refresh_session(
+            recipe_implementation, "refresh-token", None, False
+        )
+    )
+    await asyncio.sleep(0)
+    waiting = asyncio.ensure_future(
+        session_functions.refresh_session(
+            recipe_implementation, "refresh-token", None, False
+        )
+    )
+    await asyncio.sleep(0)
+    refreshing.cancel()
+
+    response = await waiting
+    assert response.accessToken.token == "token2"
+    assert len(calls) == 2
@@ -0,0 +1,197 @@
+from typing import Any, Dict, List
+from unittest.mock import patch
+
+from fastapi import Request
+from pytest import mark
+
+from supertokens_python import Supertokens, init
+from supertokens_python.framework.fastapi.fastapi_request import FastApiRequest
+from supertokens_python.querier import Querier
+from supertokens_python.recipe import session
+from supertokens_python.recipe.session import session_functions
+from supertokens_python.recipe.session.asyncio import (
+    update_session_data_in_database,
+)
+from supertokens_python.recipe.session.interfaces import (
+    ReqResInfo,
+    SessionInformationResult,
+)
+from supertokens_python.recipe.session.recipe import SessionRecipe
+from supertokens_python.recipe.session.session_class import Session
+from supertokens_python import utils
+from supertokens_python.utils import (
+    get_request_memo,
+    get_request_memo_version,
+    invalidate_request_memos,
+)
+from tests.utils import get_st_init_args, reset
+
+pytestmark = mark.asyncio
+
+
+def setup_function(_: Any) -> None:
+    reset(stop_core=False)
+    init(**get_st_init_args([session.init()]))  # type: ignore
+
+
+def teardown_function(_: Any) -> None:
+    reset(stop_core=False)
+
+
+class FakeCore:
+    def __init__(self):
+        self.lookups: List[str] = []
+        self.data: Dict[str, Any] = {"n": 0}
+
+    async def get_session_information(self, _: Any, session_handle: str):
+        self.lookups.append(session_handle)
+        return SessionInformationResult(
+            session_handle, "user1", dict(self.data), 2000, {}, 1000, "public"
+        )
+
+    async def update_session_data_in_database(
+        self, _: Any, __: str, new_session_data: Dict[str, Any]
+    ):
+        self.data = new_session_data
+        return True
+
+    def patch(self):
+        return patch.multiple(
+            session_functions,
+            get_session_information=self.get_session_information,
+            update_session_data_in_database=self.update_session_data_in_database,
+        )
+
+
+async def test_session_information_is_memoised_per_user_context():
+    core = FakeCore()
+    recipe_implementation = SessionRecipe.get_instance().recipe_implementation
+    user_context: Dict[str, Any] = {}
+
+    with core.patch():
+        await recipe_implementation.get_session_information("handle1", user_context)
+        await recipe_implementation.get_session_information("handle1", user_context)
+        await recipe_implementation.get_session_information("handle2", user_context)
+        await recipe_implementation.get_session_information("handle1", {})
+
+    assert core.lookups == ["handle1", "handle2", "handle1"]
+
+
+async def test_writes_invalidate_the_memoised_session_information():
+    core = FakeCore()
+    recipe_implementation = SessionRecipe.get_instance().recipe_implementation
+    user_context: Dict[str, Any] = {}
+
+    with core.patch():
+        await recipe_implementation.get_session_information("handle1", user_context)
+        await recipe_implementation.update_session_data_in_database(
+            "handle1", {"n": 1}, user_context
+        )
+        info = await recipe_implementation.get_session_information(
+            "handle1", user_context
+        )
+
+    assert info is not None
+    assert info.session_data_in_database == {"n": 1}
+    assert core.lookups == ["handle1", "handle1"]
+
+
+def create_session_for_request() -> Session:
+    recipe = SessionRecipe.get_instance()
+    request = FastApiRequest(Request({"type": "http", "headers": []}))
+    return Session(
+        recipe.recipe_implementation,
+        recipe.config,
+        "access-token",
+        "front-token",
+        None,
+        None,
+        "handle1",
+        "user1",
+        {},
+        ReqResInfo(request, "header"),
+        False,
+        "public",
+    )
+
+
+async def test_session_methods_share_the_memo_of_their_request():
+    core = FakeCore()
+    s = create_session_for_request()
+
+    with core.patch():
+        assert await s.get_time_created() == 1000
+        assert await s.get_expiry() == 2000
+        assert await s.get_session_data_from_database() == {"n": 0}
+
+    assert core.lookups == ["handle1"]
+
+
+async def test_writes_through_another_user_context_are_seen_by_the_session():
+    core = FakeCore()
+    s = create_session_for_request()
+
+    with core.patch():
+        assert await s.get_session_data_from_database() == {"n": 0}
+        await update_session_data_in_database("handle1", {"n": 1})
+        assert await s.get_session_data_from_database() == {"n": 1}
+        assert await s.get_expiry() == 2000
+
+    assert core.lookups == ["handle1", "handle1"]
+
+
+async def test_deleting_a_user_invalidates_the_memoised_users():
+    user_context: Dict[str, Any] = {}
+    memo = get_request_memo(user_context, "emailpassword.user_by_id")
+    assert memo is not None
+    memo.put("user1", "user", get_request_memo_version())
+    Querier.api_version = "3.0"
+
+    async def send_post_request(*_: Any):
+        return {"status": "OK"}
+
+    with patch.object(Querier, "send_post_request", send_post_request):
+        await Supertokens.get_instance().delete_user("user1")
+
+    assert "user1" not in memo
+
+
+async def test_writes_only_invalidate_the_written_session():
+    core = FakeCore()
+    recipe_implementation = SessionRecipe.get_instance().recipe_implementation
+    user_context: Dict[str, Any] = {}
+
+    with core.patch():
+        await recipe_implementation.get_session_information("handle1", user_context)
+        await recipe_implementation.get_session_information("handle2", user_context)
+        await recipe_implementation.update_session_data_in_database(
+            "handle2", {"n": 1}, {}
+        )
+        await recipe_implementation.get_session_information("handle1", user_context)
+        await recipe_implementation.get_session_information("handle2", user_context)
+
+    assert core.lookups == ["handle1", "handle2", "handle2"]
+
+
+def test_writes_made_during_a_lookup_are_not_missed():
+    memo = get_request_memo({}, "namespace")
+    assert memo is not None
+
+    version = get_request_memo_version()
+    invalidate_request_memos("namespace", ["key"])
+    memo.put("key", "value fetched before the write", version)
+
+    assert "key" not in memo
+
+
+def test_forgotten_writes_invalidate_older_values():
+    memo = get_request_memo({}, "namespace")
+    assert memo is not None
+    memo.put("key", "value", get_request_memo_version())
+
+    with patch.object(utils, "REQUEST_MEMO_MAX_TRACKED_WRITES", 2):
+        invalidate_request_memos("namespace", ["other1", "other2", "other3"])
+    memo.put("newer", "value", get_request_memo_version())
+
+    assert "key" not in memo
+    assert "newer" in memo
@@ -0,0 +1,139 @@
+import json
+from time import time
+from typing import Any, Dict, List, Optional
+from unittest.mock import MagicMock, patch
+
+import jwt
+from cryptography.hazmat.primitives.asymmetric import rsa
+from jwt.algorithms import RSAAlgorithm
+from pytest import fixture, mark, raises
+
+from supertokens_python.exceptions import GeneralError
+from supertokens_python.recipe.session.claims import BooleanClaim
+from supertokens_python.recipe.session.exceptions import (
+    InvalidClaimsError,
+    TryRefreshTokenError,
+    UnauthorisedError,
+)
+from supertokens_python.recipe.session.verifier import SessionVerifier
+
+pytestmark = mark.asyncio
+
+KEY_ID = "d-test"
+JWKS_URL = "http://localhost:3567/.well-known/jwks.json"
+
+IsAdminClaim = BooleanClaim("st-is-admin", fetch_value=lambda _, __, ___: True)  # type: ignore
+
+private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+
+def create_access_token(
+    payload: Optional[Dict[str, Any]] = None, expires_in: int = 3600
+) -> str:
+    now = int(time())
+    return jwt.encode(  # type: ignore
+        {
+            **(payload or {}),
+            "sub": "user1",
+            "iat": now,
+            "exp": now + expires_in,
+            "sessionHandle": "handle1",
+            "refreshTokenHash1": "hash",
+            "parentRefreshTokenHash1": None,
+            "antiCsrfToken": None,
+            "tId": "public",
+        },
+        private_key,  # type: ignore
+        algorithm="RS256",
+        headers={"kid": KEY_ID, "version": "4"},
+    )
+
+
+@fixture(name="fetched_urls")
+def mock_jwks_endpoint():
+    jwk = json.loads(RSAAlgorithm.to_jwk(private_key.public_key()))
+    fetched_urls: List[str] = []
+
+    def get(url: str, **_: Any):
+        fetched_urls.append(url)
+        response = MagicMock()
+        response.__enter__.return_value = response
+        response.json.return_value = {"keys": [{**jwk, "kid": KEY_ID, "alg": "RS256"}]}
+        return response
+
+    with patch("requests.get", get):
+        yield fetched_urls
+
+
+async def test_verify_valid_token(fetched_urls: List[str]):
+    verifier = SessionVerifier(jwks_url=JWKS_URL)
+
+    session = await verifier.verify(create_access_token({"role": "admin"}))
+    await verifier.verify(create_access_token())
+
+    assert session.user_id == "user1"
+    assert session.session_handle == "handle1"
+    assert session.tenant_id == "public"
+    assert session.access_token_payload["role"] == "admin"
+    assert session.expiry_time > time() * 1000
+    assert fetched_urls == [JWKS_URL]
+
+
+async def test_verify_tries_all_connection_uris():
+    verifier = SessionVerifier(
+        connection_uri="http://localhost:1;http://localhost:3567/"
+    )
+
+    with patch("requests.get", side_effect=ConnectionError) as failing_get:
+        with raises(TryRefreshTokenError):
+            await verifier.verify(create_access_token())
+
+    assert [c.args[0] for c in failing_get.call_args_list] == [
+        "http://localhost:1/.well-known/jwks.json",
+        JWKS_URL,
+    ]
+
+
+async def test_verify_rejects_invalid_tokens(fetched_urls: List[str]):
+    verifier = SessionVerifier(jwks_url=JWKS_URL)
+
+    with raises(UnauthorisedError):
+        await verifier.verify("not-a-jwt")
+
+    with raises(TryRefreshTokenError):
+        await verifier.verify(create_access_token(expires_in=-10))
+
+    with raises(TryRefreshTokenError):
+        await SessionVerifier(
+            jwks_url=JWKS_URL, use_dynamic_access_token_signing_key=False
+        ).verify(create_access_token())
+
+
+async def test_verify_checks_claim_validators(fetched_urls: List[str]):
+    verifier = SessionVerifier(jwks_url=JWKS_URL)
+    now_ms = int(time() * 1000)
+
+    session = await verifier.verify(
+        create_access_token({"st-is-admin": {"v": True, "t": now_ms}}),
+        [IsAdminClaim.validators.is_true(None)],
+    )
+    assert session.user_id == "user1"
+
+    with raises(InvalidClaimsError) as e:
+        await verifier.verify(
+            create_access_token({"st-is-admin": {"v": False, "t": now_ms}}),
+            [IsAdminClaim.validators.is_true(None)],
+        )
+    assert e.value.payload[0].id == "st-is-admin"
+
+
+def test_sync_verify(fetched_urls: List[str]):
+    verifier = SessionVerifier(jwks_url=JWKS_URL)
+    assert verifier.sync_verify(create_access_token()).user_id == "user1"
+
+
+def test_needs_exactly_one_url():
+    with raises(GeneralError):
+        SessionVerifier()
+    with raises(GeneralError):
+        SessionVerifier("http://localhost:3567", JWKS_URL)
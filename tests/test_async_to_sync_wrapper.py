@@ -0,0 +1,103 @@
+import asyncio
+import threading
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from contextvars import ContextVar
+from typing import Any, List
+
+from pytest import raises
+
+from supertokens_python import async_to_sync_wrapper
+from supertokens_python.async_to_sync_wrapper import (
+    start_background_event_loop,
+    stop_background_event_loop,
+    sync,
+)
+
+request_id: ContextVar[str] = ContextVar("request_id")
+
+
+def setup_function(_: Any) -> None:
+    start_background_event_loop()
+
+
+def teardown_function(_: Any) -> None:
+    stop_background_event_loop()
+
+
+def test_calls_from_all_threads_share_one_event_loop():
+    loops: List[asyncio.AbstractEventLoop] = []
+
+    async def get_loop():
+        loops.append(asyncio.get_event_loop())
+        return request_id.get()
+
+    def call(i: int):
+        request_id.set(str(i))
+        assert sync(get_loop()) == str(i)
+
+    threads = [threading.Thread(target=call, args=(i,)) for i in range(5)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(loops) == 5
+    assert len(set(loops)) == 1
+
+
+def test_exceptions_are_raised_in_calling_thread():
+    async def fail():
+        raise ValueError("failed")
+
+    with raises(ValueError):
+        sync(fail())
+
+
+def test_coroutine_is_cancelled_after_timeout():
+    cancelled = threading.Event()
+
+    async def slow():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    with raises(FutureTimeoutError):
+        sync(slow(), timeout=0.01)
+
+    assert cancelled.wait(1)
+
+
+def test_calls_from_the_background_event_loop_raise():
+    async def get_value():
+        return 1
+
+    async def call_sync():
+        sync(get_value())
+
+    with raises(Exception, match="cannot be called from the background event loop"):
+        sync(call_sync())
+
+
+def test_stop_cancels_pending_tasks():
+    started = threading.Event()
+    cleaned_up: List[bool] = []
+
+    async def slow():
+        started.set()
+        try:
+            await asyncio.sleep(10)
+        finally:
+            cleaned_up.append(True)
+
+    background_event_loop = async_to_sync_wrapper._background_event_loop  # type: ignore # pylint: disable=protected-access
+    assert background_event_loop is not None
+    future = background_event_loop.submit(slow())
+    assert started.wait(1)
+
+    stop_background_event_loop()
+
+    assert cleaned_up == [True]
+    assert future.cancelled()
+    assert background_event_loop.loop.is_closed()
@@ -0,0 +1,80 @@
+import json
+import subprocess
+import sys
+from typing import List
+
+# Generous upper bound for the cumulative import time of supertokens_python.
+# It only exists to catch a heavy dependency being imported eagerly again.
+IMPORT_TIME_BUDGET_US = 1_000_000
+
+LAZY_MODULES = [
+    "tldextract",
+    "phonenumbers",
+    "supertokens_python.framework.fastapi",
+    "supertokens_python.framework.flask",
+    "supertokens_python.framework.django",
+    "supertokens_python.recipe.emailpassword.emaildelivery.services.smtp.password_reset_email",
+    "supertokens_python.recipe.emailverification.emaildelivery.services.smtp.email_verify_email",
+    "supertokens_python.recipe.passwordless.emaildelivery.services.smtp.pless_login_email",
+]
+
+
+def run_python(code: str, *args: str) -> subprocess.CompletedProcess:  # type: ignore
+    return subprocess.run(
+        [sys.executable, *args, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def get_loaded_modules(code: str, modules: List[str]) -> List[str]:
+    result = run_python(
+        code
+        + "\nimport sys, json"
+        + f"\nprint(json.dumps([m for m in {modules!r} if m in sys.modules]))"
+    )
+    return json.loads(result.stdout.splitlines()[-1])
+
+
+def test_import_time_is_within_budget():
+    result = run_python("import supertokens_python", "-X", "importtime")
+
+    cumulative_us = None
+    for line in result.stderr.splitlines():
+        parts = [p.strip() for p in line.split("|")]
+        if len(parts) == 3 and parts[2] == "supertokens_python":
+            cumulative_us = int(parts[1])
+
+    assert cumulative_us is not None
+    assert cumulative_us < IMPORT_TIME_BUDGET_US
+
+
+def test_importing_the_sdk_does_not_load_http_client():
+    assert get_loaded_modules("import supertokens_python", ["httpx"]) == []
+
+
+def test_heavy_modules_are_not_imported_eagerly():
+    code = "\n".join(
+        [
+            "import supertokens_python",
+            "from supertokens_python.recipe import emailpassword, emailverification, passwordless, session",
+        ]
+    )
+    assert get_loaded_modules(code, LAZY_MODULES) == []
+
+
+def test_init_does_not_load_public_suffix_list_if_not_needed():
+    code = "\n".join(
+        [
+            "from supertokens_python import init, InputAppInfo, SupertokensConfig",
+            "from supertokens_python.recipe import session",
+            "init(",
+            "    app_info=InputAppInfo('ST', 'https://api.example.com', 'https://example.com'),",
+            "    framework='fastapi',",
+            "    supertokens_config=SupertokensConfig('http://localhost:3567'),",
+            "    recipe_list=[session.init(cookie_same_site='lax')],",
+            ")",
+        ]
+    )
+    assert get_loaded_modules(code, ["tldextract"]) == []
@@ -0,0 +1,111 @@
+import json
+from typing import Any, List, Union
+from unittest.mock import patch
+
+import httpx
+from fastapi.responses import Response
+from pytest import importorskip, mark, raises
+
+from supertokens_python import init
+from supertokens_python.framework.fastapi.fastapi_response import FastApiResponse
+from supertokens_python.json_codec import (
+    JSONCodec,
+    OrjsonCodec,
+    get_json_codec,
+    set_json_codec,
+)
+from supertokens_python.normalised_url_path import NormalisedURLPath
+from supertokens_python.querier import Querier
+from supertokens_python.recipe import session
+from supertokens_python.recipe.session.cookie_and_header import build_front_token
+from supertokens_python.utils import utf_base64decode
+from tests.utils import get_st_init_args, reset
+
+DATA = {"b": [1, 2.5, None, True], "a": {"é": "/ü"}}
+
+
+def setup_function(_: Any) -> None:
+    reset(stop_core=False)
+
+
+def teardown_function(_: Any) -> None:
+    reset(stop_core=False)
+
+
+class CountingCodec(JSONCodec):
+    def __init__(self):
+        self.calls: List[str] = []
+
+    def dumps(self, obj: Any, sort_keys: bool = False) -> str:
+        self.calls.append("dumps")
+        return super().dumps(obj, sort_keys)
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        self.calls.append("loads")
+        return super().loads(data)
+
+
+def test_codec_is_chosen_at_init():
+    importorskip("orjson")
+    assert type(get_json_codec()) is JSONCodec  # pylint: disable=unidiomatic-typecheck
+
+    init(**get_st_init_args([session.init()]), json_codec="orjson")  # type: ignore
+    assert isinstance(get_json_codec(), OrjsonCodec)
+
+    reset(stop_core=False)
+    assert get_json_codec().name == "stdlib"
+
+    with raises(ValueError):
+        set_json_codec("simplejson")  # type: ignore
+
+
+def test_orjson_encodes_like_stdlib():
+    importorskip("orjson")
+    stdlib, orjson_codec = JSONCodec(), OrjsonCodec()
+
+    for sort_keys in (False, True):
+        assert stdlib.dumps_bytes(DATA, sort_keys) == orjson_codec.dumps_bytes(
+            DATA, sort_keys
+        )
+        assert stdlib.dumps(DATA, sort_keys) == orjson_codec.dumps(DATA, sort_keys)
+    assert orjson_codec.loads(stdlib.dumps_bytes(DATA)) == DATA
+
+    front_token = build_front_token("user", 1, DATA)
+    set_json_codec(orjson_codec)
+    assert build_front_token("user", 1, DATA) == front_token
+    assert json.loads(utf_base64decode(front_token, False))["up"] == DATA
+
+
+def test_responses_use_the_codec():
+    codec = CountingCodec()
+    set_json_codec(codec)
+
+    response = FastApiResponse(Response())
+    response.set_json_content(DATA)
+
+    assert codec.calls == ["dumps"]
+    assert json.loads(response.response.body) == DATA
+
+
+@mark.asyncio
+async def test_core_requests_use_the_codec():
+    init(**get_st_init_args([session.init()]), json_codec=CountingCodec())  # type: ignore
+    Querier.api_version = "3.0"
+    sent: List[bytes] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent.append(request.content)
+        return httpx.Response(200, json={"status": "OK", "data": DATA})
+
+    real_async_client = httpx.AsyncClient
+    with patch(
+        "httpx.AsyncClient",
+        lambda: real_async_client(transport=httpx.MockTransport(handler)),
+    ):
+        result = await Querier.get_instance().send_post_request(
+            NormalisedURLPath("/recipe/test"), DATA
+        )
+
+    assert sent == [JSONCodec().dumps_bytes(DATA)]
+    assert result == {"status": "OK", "data": DATA}
+    assert get_json_codec().calls == ["dumps", "loads"]  # type: ignore
@@ -1,10 +1,23 @@
 import json
+import logging
 from datetime import datetime as real_datetime
+from typing import List
 from unittest import TestCase
 from unittest.mock import MagicMock, patch
 
+from httpx import HTTPStatusError, Request, Response
+
 from supertokens_python.constants import VERSION
-from supertokens_python.logger import log_debug_message, streamFormatter
+from supertokens_python.logger import (
+    NAMESPACE,
+    Lazy,
+    disable_queue_logging,
+    enable_queue_logging,
+    log_debug_message,
+    streamFormatter,
+    streamHandler,
+)
+from supertokens_python.utils import handle_httpx_client_exceptions
 
 
 class LoggerTests(TestCase):
@@ -22,7 +35,7 @@ class LoggerTests(TestCase):
             "t": "2000-01-01T00:00Z",
             "sdkVer": VERSION,
             "message": "API replied with status 200",
-            "file": "../tests/test_logger.py:16",
+            "file": "../tests/test_logger.py:29",
         }
 
     @staticmethod
@@ -31,3 +44,69 @@ class LoggerTests(TestCase):
             streamFormatter._fmt  # pylint: disable=protected-access
             == "{name} {message}\n"
         )
+
+    @staticmethod
+    def test_lazy_arguments_are_not_evaluated_if_debug_is_disabled():
+        logger = logging.getLogger(NAMESPACE)
+        level = logger.level
+        logger.setLevel(logging.INFO)
+        try:
+            thunk = MagicMock(return_value="value")
+            log_debug_message("lazy %s", Lazy(thunk))
+            thunk.assert_not_called()
+        finally:
+            logger.setLevel(level)
+
+    def test_lazy_arguments_are_evaluated_if_debug_is_enabled(self):
+        with self.assertLogs(level="DEBUG") as captured:
+            log_debug_message("lazy %s %s", Lazy(lambda: "value"), 1)
+
+        out = json.loads(captured.records[0].getMessage())
+        assert out["message"] == "lazy value 1"
+
+    def test_callable_arguments_are_not_called(self):
+        class Recipe:
+            def __repr__(self) -> str:
+                return "Recipe"
+
+        with self.assertLogs(level="DEBUG") as captured:
+            log_debug_message("recipe %r", Recipe)
+
+        out = json.loads(captured.records[0].getMessage())
+        assert out["message"] == "recipe " + repr(Recipe)
+
+    def test_error_response_body_is_logged(self):
+        request = Request("POST", "http://localhost:3567/recipe/session")
+        response = Response(400, json={"message": "bad input"}, request=request)
+        error = HTTPStatusError("error", request=request, response=response)
+
+        with self.assertLogs(level="DEBUG") as captured:
+            handle_httpx_client_exceptions(error)
+
+        messages = [json.loads(r.getMessage())["message"] for r in captured.records]
+        assert messages == [
+            "Error status: 400",
+            "Error response: {'message': 'bad input'}",
+        ]
+
+    @staticmethod
+    def test_queue_logging_writes_records_from_listener_thread():
+        logger = logging.getLogger(NAMESPACE)
+        level = logger.level
+        logger.setLevel(logging.DEBUG)
+        emitted: List[logging.LogRecord] = []
+
+        try:
+            with patch.object(
+                streamHandler, "emit", side_effect=emitted.append
+            ) as emit_mock:
+                enable_queue_logging()
+                log_debug_message("queued %s", Lazy(lambda: "message"))
+                disable_queue_logging()
+
+            emit_mock.assert_called_once()
+            assert emitted[0].msg == "queued message"
+            assert emitted[0].args is None
+            assert streamHandler in logger.handlers
+        finally:
+            logger.setLevel(level)
@@ -0,0 +1,126 @@
+from typing import Any, Dict
+from unittest.mock import patch
+
+import httpx
+from pytest import fixture, mark, raises
+
+from supertokens_python import init
+from supertokens_python.ingredients.emaildelivery import EmailDeliveryIngredient
+from supertokens_python.ingredients.emaildelivery.types import (
+    EmailDeliveryConfigWithService,
+    EmailDeliveryInterface,
+)
+from supertokens_python.metrics import (
+    CACHE_LOOKUP,
+    CORE_REQUEST,
+    DELIVERY,
+    InMemoryMetricsCollector,
+    NoOpMetricsCollector,
+    get_metrics_collector,
+    set_metrics_collector,
+)
+from supertokens_python.normalised_url_path import NormalisedURLPath
+from supertokens_python.querier import Querier
+from supertokens_python.recipe import session
+from tests.utils import get_st_init_args, reset
+
+
+def setup_function(_: Any) -> None:
+    reset(stop_core=False)
+
+
+def teardown_function(_: Any) -> None:
+    set_metrics_collector(None)
+    reset(stop_core=False)
+
+
+@fixture(name="collector")
+def collector_fixture() -> InMemoryMetricsCollector:
+    collector = InMemoryMetricsCollector()
+    set_metrics_collector(collector)
+    return collector
+
+
+def test_default_collector_is_no_op():
+    assert isinstance(get_metrics_collector(), NoOpMetricsCollector)
+    with get_metrics_collector().start_span("test") as span:
+        span.set_attribute("status", "200")
+
+
+def test_in_memory_histogram_and_counters():
+    collector = InMemoryMetricsCollector(bucket_boundaries_ms=[10, 100])
+    collector.record_duration("op", 5, {"path": "/a"})
+    collector.record_duration("op", 50, {"path": "/a"})
+    collector.record_duration("op", 500, {"path": "/b"})
+    collector.record_cache_lookup("jwks", True)
+    collector.record_cache_lookup("jwks", True)
+    collector.record_cache_lookup("jwks", False)
+
+    all_paths = collector.get_histogram("op")
+    assert all_paths.count == 3
+    assert all_paths.bucket_counts == [1, 1, 1]
+    assert all_paths.min == 5
+    assert all_paths.max == 500
+    assert all_paths.percentile(50) == 100
+    assert all_paths.percentile(100) == 500
+
+    path_a = collector.get_histogram("op", {"path": "/a"})
+    assert path_a.count == 2
+    assert path_a.mean == 27.5
+
+    assert collector.get_counter(CACHE_LOOKUP, {"cache": "jwks"}) == 3
+    assert collector.get_cache_hit_ratio("jwks") == 2 / 3
+    assert collector.get_cache_hit_ratio("unknown") is None
+
+
+def test_span_records_error(collector: InMemoryMetricsCollector):
+    with raises(ValueError):
+        with collector.start_span("op", {"path": "/a"}):
+            raise ValueError()
+
+    assert collector.get_histogram("op", {"error": "ValueError"}).count == 1
+
+
+@mark.asyncio
+async def test_core_requests_are_timed_by_path_and_status(
+    collector: InMemoryMetricsCollector,
+):
+    init(**get_st_init_args([session.init()]))  # type: ignore
+    Querier.api_version = "3.0"
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/recipe/test":
+            return httpx.Response(200, json={"status": "OK"})
+        return httpx.Response(404, text="not found")
+
+    real_async_client = httpx.AsyncClient
+    with patch(
+        "httpx.AsyncClient",
+        lambda: real_async_client(transport=httpx.MockTransport(handler)),
+    ):
+        querier = Querier.get_instance()
+        await querier.send_get_request(NormalisedURLPath("/recipe/test"))
+        await querier.send_get_request(NormalisedURLPath("/recipe/test"))
+        with raises(Exception):
+            await querier.send_get_request(NormalisedURLPath("/recipe/missing"))
+
+    ok = collector.get_histogram(
+        CORE_REQUEST, {"path": "/recipe/test", "method": "GET", "status": "200"}
+    )
+    assert ok.count == 2
+    assert collector.get_histogram(CORE_REQUEST, {"status": "404"}).count == 1
+    assert collector.get_cache_hit_ratio("api_version") == 1
+
+
+@mark.asyncio
+async def test_delivery_is_timed(collector: InMemoryMetricsCollector):
+    class Service(EmailDeliveryInterface[Dict[str, Any]]):
+        async def send_email(
+            self, template_vars: Dict[str, Any], user_context: Dict[str, Any]
+        ) -> None:
+            pass
+
+    ingredient = EmailDeliveryIngredient(EmailDeliveryConfigWithService(Service()))
+    await ingredient.ingredient_interface_impl.send_email({}, {})
+
+    assert collector.get_histogram(DELIVERY, {"channel": "email"}).count == 1
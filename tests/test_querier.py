@@ -0,0 +1,212 @@
+import asyncio
+import time
+from typing import Any, List
+from unittest.mock import patch
+
+import httpx
+from pytest import mark, raises
+
+from supertokens_python import SupertokensConfig, init
+from supertokens_python.exceptions import GeneralError
+from supertokens_python.async_to_sync_wrapper import (
+    start_background_event_loop,
+    stop_background_event_loop,
+)
+from supertokens_python.asyncio import warm_up
+from supertokens_python.normalised_url_path import NormalisedURLPath
+from supertokens_python.querier import Querier
+from supertokens_python.recipe import session
+from tests.utils import get_st_init_args, reset
+
+pytestmark = mark.asyncio
+
+
+def setup_function(_: Any) -> None:
+    reset(stop_core=False)
+
+
+def teardown_function(_: Any) -> None:
+    reset(stop_core=False)
+
+
+def mock_core(requests: List[httpx.Request]):
+    async def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.url.path == "/apiversion":
+            await asyncio.sleep(0.01)
+            return httpx.Response(200, json={"versions": ["3.0"]})
+        return httpx.Response(200, json={"status": "OK"})
+
+    real_async_client = httpx.AsyncClient
+    return patch(
+        "httpx.AsyncClient",
+        lambda: real_async_client(transport=httpx.MockTransport(handler)),
+    )
+
+
+async def test_concurrent_callers_share_one_api_version_request():
+    init(**get_st_init_args([session.init()]))  # type: ignore
+    requests: List[httpx.Request] = []
+
+    with mock_core(requests):
+        querier = Querier.get_instance()
+        versions = await asyncio.gather(*[querier.get_api_version() for _ in range(10)])
+
+    assert versions == ["3.0"] * 10
+    assert [r.url.path for r in requests] == ["/apiversion"]
+
+
+async def test_headers_are_sent_with_every_request():
+    init(**get_st_init_args([session.init()]))  # type: ignore
+    requests: List[httpx.Request] = []
+
+    with mock_core(requests):
+        querier = Querier.get_instance("session")
+        await querier.send_get_request(NormalisedURLPath("/recipe/test"))
+        await querier.send_post_request(NormalisedURLPath("/recipe/test"), {"a": 1})
+        await Querier.get_instance().send_get_request(NormalisedURLPath("/test"))
+
+    get_request, post_request, request_without_rid = requests[1:]
+    assert get_request.headers["cdi-version"] == "3.0"
+    assert get_request.headers["rid"] == "session"
+    assert "content-type" not in get_request.headers
+    assert post_request.headers["rid"] == "session"
+    assert post_request.headers["content-type"] == "application/json; charset=utf-8"
+    assert request_without_rid.headers["cdi-version"] == "3.0"
+    assert "rid" not in request_without_rid.headers
+
+
+async def test_warm_up_fetches_api_version_and_jwks():
+    init(**get_st_init_args([session.init()]))  # type: ignore
+    requests: List[httpx.Request] = []
+
+    with mock_core(requests), patch(
+        "supertokens_python.recipe.session.jwks.get_latest_keys"
+    ) as get_latest_keys:
+        await warm_up()
+
+    assert Querier.api_version == "3.0"
+    get_latest_keys.assert_called_once_with()
+
+
+async def test_wsgi_mode_uses_one_pooled_sync_client():
+    init(**{**get_st_init_args([session.init()]), "mode": "wsgi"})  # type: ignore
+    Querier.api_version = "3.0"
+    requests: List[httpx.Request] = []
+    clients: List[httpx.Client] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json={"status": "OK"})
+
+    real_client = httpx.Client
+
+    def create_client():
+        clients.append(real_client(transport=httpx.MockTransport(handler)))
+        return clients[-1]
+
+    with patch("httpx.Client", create_client), patch(
+        "httpx.AsyncClient", side_effect=Exception("should not be used")
+    ):
+        querier = Querier.get_instance()
+        await querier.send_get_request(NormalisedURLPath("/recipe/test"))
+        await querier.send_post_request(NormalisedURLPath("/recipe/test"), {"a": 1})
+
+    assert len(requests) == 2
+    assert len(clients) == 1
+    assert requests[1].headers["content-type"] == "application/json; charset=utf-8"
+
+
+async def test_wsgi_mode_core_requests_do_not_block_the_loop():
+    init(**{**get_st_init_args([session.init()]), "mode": "wsgi"})  # type: ignore
+    Querier.api_version = "3.0"
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/recipe/slow":
+            time.sleep(1)
+        else:
+            time.sleep(0.2)
+        return httpx.Response(200, json={"status": "OK"})
+
+    real_client = httpx.Client
+    with patch(
+        "httpx.Client", lambda: real_client(transport=httpx.MockTransport(handler))
+    ):
+        querier = Querier.get_instance()
+        start = time.monotonic()
+        await asyncio.gather(
+            *[
+                querier.send_get_request(NormalisedURLPath("/recipe/test"))
+                for _ in range(5)
+            ]
+        )
+        assert time.monotonic() - start < 0.8
+
+        start = time.monotonic()
+        with raises(asyncio.TimeoutError):
+            await asyncio.wait_for(
+                querier.send_get_request(NormalisedURLPath("/recipe/slow")), 0.1
+            )
+        assert time.monotonic() - start < 0.5
+
+
+async def test_wsgi_core_request_threads_bounds_concurrent_core_requests():
+    init(
+        **{
+            **get_st_init_args([session.init()]),
+            "mode": "wsgi",
+            "supertokens_config": SupertokensConfig(
+                "http://localhost:3567", wsgi_core_request_threads=2
+            ),
+        }
+    )  # type: ignore
+    Querier.api_version = "3.0"
+
+    def handler(_: httpx.Request) -> httpx.Response:
+        time.sleep(0.2)
+        return httpx.Response(200, json={"status": "OK"})
+
+    real_client = httpx.Client
+    with patch(
+        "httpx.Client", lambda: real_client(transport=httpx.MockTransport(handler))
+    ):
+        querier = Querier.get_instance()
+        start = time.monotonic()
+        await asyncio.gather(
+            *[
+                querier.send_get_request(NormalisedURLPath("/recipe/test"))
+                for _ in range(4)
+            ]
+        )
+        assert 0.4 <= time.monotonic() - start < 0.6
+
+
+def test_wsgi_core_request_threads_must_be_positive():
+    with raises(GeneralError):
+        init(
+            **{
+                **get_st_init_args([session.init()]),
+                "supertokens_config": SupertokensConfig(
+                    "http://localhost:3567", wsgi_core_request_threads=0
+                ),
+            }
+        )  # type: ignore
+
+
+async def test_wsgi_mode_uses_async_client_with_background_event_loop():
+    init(**{**get_st_init_args([session.init()]), "mode": "wsgi"})  # type: ignore
+    Querier.api_version = "3.0"
+    requests: List[httpx.Request] = []
+
+    start_background_event_loop()
+    try:
+        with mock_core(requests), patch(
+            "httpx.Client", side_effect=Exception("should not be used")
+        ):
+            await Querier.get_instance().send_get_request(
+                NormalisedURLPath("/recipe/test")
+            )
+    finally:
+        stop_background_event_loop()
+
+    assert len(requests) == 1
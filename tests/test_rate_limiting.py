@@ -0,0 +1,195 @@
+from typing import Any, Dict, List
+from unittest.mock import patch
+
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+from pytest import fixture, mark
+
+from supertokens_python import init
+from supertokens_python.framework.fastapi import get_middleware
+from supertokens_python.rate_limiting import (
+    InMemoryRateLimiterStore,
+    RateLimit,
+    RateLimiter,
+)
+from supertokens_python.recipe import emailpassword, session
+from supertokens_python.recipe.emailpassword.interfaces import (
+    APIInterface,
+    SignInPostWrongCredentialsError,
+)
+from supertokens_python.recipe.emailpassword.recipe import EmailPasswordRecipe
+from supertokens_python.recipe.emailpassword.types import FormField
+from tests.utils import get_st_init_args, reset
+
+
+def setup_function(_: Any) -> None:
+    reset(stop_core=False)
+
+
+def teardown_function(_: Any) -> None:
+    reset(stop_core=False)
+
+
+@mark.asyncio
+async def test_token_bucket_refills_over_time():
+    store = InMemoryRateLimiterStore()
+    rate_limit = RateLimit(2, 10)
+
+    with patch("supertokens_python.rate_limiting.monotonic", lambda: 100.0):
+        assert await store.consume([("a", rate_limit)], {}) == 0
+        assert await store.consume([("a", rate_limit)], {}) == 0
+        assert await store.consume([("a", rate_limit)], {}) == 5
+        assert await store.consume([("b", rate_limit)], {}) == 0
+
+    with patch("supertokens_python.rate_limiting.monotonic", lambda: 105.0):
+        assert await store.consume([("a", rate_limit)], {}) == 0
+        assert await store.consume([("a", rate_limit)], {}) == 5
+
+
+@mark.asyncio
+async def test_buckets_are_only_consumed_if_all_have_a_token():
+    store = InMemoryRateLimiterStore()
+    wide, narrow = RateLimit(2, 60), RateLimit(1, 60)
+
+    with patch("supertokens_python.rate_limiting.monotonic", lambda: 100.0):
+        assert await store.consume([("ip", wide), ("email", narrow)], {}) == 0
+        assert await store.consume([("ip", wide), ("email", narrow)], {}) == 60
+        assert await store.consume([("ip", wide), ("email", narrow)], {}) == 60
+        # the rejected requests didn't use the ip bucket
+        assert await store.consume([("ip", wide)], {}) == 0
+        assert await store.consume([("ip", wide)], {}) == 30
+
+
+@mark.asyncio
+async def test_in_memory_store_forgets_least_recently_used_keys():
+    store = InMemoryRateLimiterStore(max_keys=2, shard_count=1)
+    rate_limit = RateLimit(1, 60)
+
+    for key in ["a", "b", "c"]:
+        assert await store.consume([(key, rate_limit)], {}) == 0
+
+    assert await store.consume([("c", rate_limit)], {}) > 0
+    assert await store.consume([("a", rate_limit)], {}) == 0
+
+
+@fixture(name="signed_in_emails")
+def signed_in_emails_fixture() -> List[str]:
+    return []
+
+
+@fixture(name="client")
+def client_fixture(signed_in_emails: List[str]) -> TestClient:
+    def override_apis(original: APIInterface) -> APIInterface:
+        async def sign_in_post(
+            form_fields: List[FormField],
+            tenant_id: str,
+            api_options: Any,
+            user_context: Dict[str, Any],
+        ):
+            signed_in_emails.append(form_fields[0].value)
+            return SignInPostWrongCredentialsError()
+
+        original.sign_in_post = sign_in_post
+        return original
+
+    init(
+        **get_st_init_args(
+            [
+                session.init(),
+                emailpassword.init(
+                    override=emailpassword.InputOverrideConfig(apis=override_apis)
+                ),
+            ]
+        ),
+        rate_limiter=RateLimiter(
+            {"/signin": {"ip": RateLimit(3, 60), "email": RateLimit(2, 60)}}
+        ),
+    )  # type: ignore
+    app = FastAPI()
+    app.add_middleware(get_middleware())
+    return TestClient(app)
+
+
+def sign_in(client: TestClient, email: str):
+    return client.post(
+        "/auth/signin",
+        json={
+            "formFields": [
+                {"id": "email", "value": email},
+                {"id": "password", "value": "password1"},
+            ]
+        },
+    )
+
+
+def test_limited_requests_are_rejected_before_the_api(
+    client: TestClient, signed_in_emails: List[str]
+):
+    assert sign_in(client, "john@example.com").status_code == 200
+    assert sign_in(client, " John@example.com").status_code == 200
+
+    response = sign_in(client, "john@example.com")
+    assert response.status_code == 429
+    assert response.headers["Retry-After"] == "30"
+    assert response.json() == {"message": "Too many requests, please try again later"}
+
+    # the rejected request didn't use the ip limit
+    assert sign_in(client, "jane@example.com").status_code == 200
+    # the ip limit is reached
+    assert sign_in(client, "other@example.com").status_code == 429
+
+    assert signed_in_emails == [
+        "john@example.com",
+        "John@example.com",
+        "jane@example.com",
+    ]
+
+
+def create_client_with_app_sign_in(override_apis: Any) -> TestClient:
+    init(
+        **get_st_init_args(
+            [
+                session.init(),
+                emailpassword.init(
+                    override=emailpassword.InputOverrideConfig(apis=override_apis)
+                ),
+            ]
+        ),
+        rate_limiter=RateLimiter(
+            {"/signin": {"ip": RateLimit(1, 60), "email": RateLimit(1, 60)}}
+        ),
+    )  # type: ignore
+    app = FastAPI()
+    app.add_middleware(get_middleware())
+
+    @app.post("/auth/signin")
+    async def sign_in_of_the_app(request: Request) -> Dict[str, Any]:  # type: ignore
+        return await request.json()
+
+    return TestClient(app)
+
+
+def test_disabled_apis_are_not_limited():
+    def override_apis(original: APIInterface) -> APIInterface:
+        original.disable_sign_in_post = True
+        return original
+
+    client = create_client_with_app_sign_in(override_apis)
+
+    for _ in range(3):
+        response = sign_in(client, "john@example.com")
+        assert response.status_code == 200
+        assert response.json()["formFields"][0]["value"] == "john@example.com"
+
+
+def test_app_gets_the_body_of_requests_the_sdk_does_not_handle():
+    client = create_client_with_app_sign_in(lambda original: original)
+
+    async def handle_api_request(*_: Any):
+        return None
+
+    with patch.object(EmailPasswordRecipe, "handle_api_request", handle_api_request):
+        response = sign_in(client, "john@example.com")
+
+    assert response.status_code == 200
+    assert response.json()["formFields"][0]["value"] == "john@example.com"
@@ -0,0 +1,113 @@
+import csv
+import json
+from io import StringIO
+from typing import Any, Dict, List, Optional
+from unittest.mock import patch
+
+from pytest import mark
+
+from supertokens_python import Supertokens, init
+from supertokens_python.asyncio import export_users
+from supertokens_python.recipe import session, usermetadata, userroles
+from supertokens_python.recipe.session.recipe import SessionRecipe
+from supertokens_python.recipe.usermetadata.interfaces import MetadataResult
+from supertokens_python.recipe.usermetadata.recipe import UserMetadataRecipe
+from supertokens_python.recipe.userroles.interfaces import GetRolesForUserOkResult
+from supertokens_python.recipe.userroles.recipe import UserRolesRecipe
+from supertokens_python.types import User, UsersResponse
+from supertokens_python.user_export import UserExportCheckpoint
+from tests.utils import get_st_init_args, reset
+
+pytestmark = mark.asyncio
+
+PAGES = {
+    None: UsersResponse(
+        [
+            User("emailpassword", "user1", 1, "a@b.com", None, None, ["public"]),
+            User("emailpassword", "user2", 2, "c@d.com", None, None, ["public"]),
+        ],
+        "page2",
+    ),
+    "page2": UsersResponse(
+        [User("passwordless", "user3", 3, None, "+1234", None, ["public"])], None
+    ),
+}
+
+
+def setup_function(_: Any) -> None:
+    reset(stop_core=False)
+
+
+def teardown_function(_: Any) -> None:
+    reset(stop_core=False)
+
+
+def init_with_mocked_core():
+    init(**get_st_init_args([session.init(), usermetadata.init(), userroles.init()]))  # type: ignore
+
+    async def get_users(
+        _self: Any,
+        _tenant_id: str,
+        _order: str,
+        _limit: Optional[int],
+        pagination_token: Optional[str],
+        _include_recipe_ids: Optional[List[str]],
+        _query: Optional[Dict[str, str]] = None,
+    ):
+        return PAGES[pagination_token]
+
+    async def get_user_metadata(user_id: str, _user_context: Dict[str, Any]):
+        return MetadataResult({"first_name": user_id})
+
+    async def get_roles_for_user(user_id: str, _tenant_id: str, _: Dict[str, Any]):
+        return GetRolesForUserOkResult(["admin"] if user_id == "user1" else [])
+
+    async def get_all_session_handles_for_user(user_id: str, *_: Any):
+        return [user_id + "-handle"]
+
+    UserMetadataRecipe.get_instance().recipe_implementation.get_user_metadata = get_user_metadata  # type: ignore
+    UserRolesRecipe.get_instance().recipe_implementation.get_roles_for_user = get_roles_for_user  # type: ignore
+    SessionRecipe.get_instance().recipe_implementation.get_all_session_handles_for_user = get_all_session_handles_for_user  # type: ignore
+    return patch.object(Supertokens, "get_users", get_users)
+
+
+async def test_export_users_ndjson_with_checkpoints():
+    checkpoints: List[UserExportCheckpoint] = []
+    output = StringIO()
+
+    with init_with_mocked_core():
+        result = await export_users(
+            "public", output, page_size=2, on_checkpoint=checkpoints.append
+        )
+
+    lines = [json.loads(line) for line in output.getvalue().splitlines()]
+    assert result.users_exported == 3
+    assert result.pages_exported == 2
+    assert [line["user"]["id"] for line in lines] == ["user1", "user2", "user3"]
+    assert lines[0]["metadata"] == {"first_name": "user1"}
+    assert lines[0]["roles"] == ["admin"]
+    assert lines[2]["sessionHandles"] == ["user3-handle"]
+    assert [(c.pagination_token, c.users_exported) for c in checkpoints] == [
+        ("page2", 2),
+        (None, 3),
+    ]
+
+
+async def test_export_users_csv_resume_does_not_repeat_header():
+    output = StringIO()
+
+    with init_with_mocked_core():
+        result = await export_users(
+            "public",
+            output,
+            export_format="csv",
+            pagination_token="page2",
+            include_roles=False,
+        )
+
+    rows = list(csv.reader(StringIO(output.getvalue())))
+    assert result.users_exported == 1
+    assert len(rows) == 1
+    assert rows[0][:5] == ["passwordless", "user3", "3", "", "+1234"]
+    assert rows[0][-2] == ""
+    assert json.loads(rows[0][-1]) == ["user3-handle"]
@@ -3,8 +3,12 @@ from typing import Union, List, Any, Dict
 import pytest
 import threading
 
+from unittest.mock import patch
+
+from supertokens_python import utils
 from supertokens_python.utils import humanize_time, is_version_gte
-from supertokens_python.utils import RWMutex
+from supertokens_python.utils import LRUCache, RWMutex
+from supertokens_python.utils import get_top_level_domain_for_same_site_resolution
 
 from tests.utils import is_subset
 
@@ -171,3 +175,45 @@ def test_rw_mutex_writes():
     expected_balance -= 10 * 5  # 10 threads withdrawing 5 each
     actual_balance, _ = account.get_stats()
     assert actual_balance == expected_balance, "Incorrect account balance"
+
+
+def test_lru_cache_evicts_least_recently_used():
+    cache: LRUCache[str, int] = LRUCache(2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+
+    cache.put("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert len(cache) == 2
+
+    cache.remove("a")
+    assert cache.get("a") is None
+
+
+@pytest.mark.parametrize(
+    "url,top_level_domain",
+    [
+        ("https://api.example.com", "example.com"),
+        ("https://a.b.example.co.uk:8080/path", "example.co.uk"),
+        ("https://my-app.vercel.app", "my-app.vercel.app"),
+        ("http://localhost:3000", "localhost"),
+        ("http://127.0.0.1", "localhost"),
+    ],
+)
+def test_get_top_level_domain_for_same_site_resolution(url: str, top_level_domain: str):
+    assert get_top_level_domain_for_same_site_resolution(url) == top_level_domain
+
+
+def test_top_level_domain_is_resolved_once_per_hostname():
+    utils.top_level_domains.clear()
+    extractor = utils._get_tld_extractor()  # pylint: disable=protected-access
+
+    with patch.object(utils, "_tld_extractor", wraps=extractor) as wrapped:
+        get_top_level_domain_for_same_site_resolution("https://api.example.org")
+        get_top_level_domain_for_same_site_resolution("https://api.example.org/auth")
+        get_top_level_domain_for_same_site_resolution("https://www.example.org")
+
+    assert wrapped.call_count == 2
@@ -0,0 +1,117 @@
+from typing import Any, Dict, List
+
+from pytest import mark
+
+from supertokens_python import init
+from supertokens_python.recipe import (
+    emailverification,
+    session,
+    thirdpartyemailpassword,
+)
+from supertokens_python.recipe.emailpassword.types import User as EPUser
+from supertokens_python.recipe.emailverification.interfaces import (
+    GetEmailForUserIdOkResult,
+    UnknownUserIdError,
+)
+from supertokens_python.recipe.emailverification.recipe import (
+    EmailVerificationRecipe,
+)
+from supertokens_python.recipe.thirdparty.types import ThirdPartyInfo
+from supertokens_python.recipe.thirdparty.types import User as TPUser
+from supertokens_python.recipe.thirdpartyemailpassword.recipe import (
+    ThirdPartyEmailPasswordRecipe,
+)
+from tests.utils import get_st_init_args, reset
+
+pytestmark = mark.asyncio
+
+
+def setup_function(_: Any) -> None:
+    reset(stop_core=False)
+
+
+def teardown_function(_: Any) -> None:
+    reset(stop_core=False)
+
+
+def init_with_mocked_core() -> List[str]:
+    init(
+        **get_st_init_args(
+            [
+                session.init(),
+                emailverification.init("OPTIONAL"),
+                thirdpartyemailpassword.init(),
+            ]
+        )  # type: ignore
+    )
+    lookups: List[str] = []
+
+    async def ep_get_user_by_id(user_id: str, _: Dict[str, Any]):
+        lookups.append("emailpassword")
+        if user_id == "ep-user":
+            return EPUser(user_id, "ep@example.com", 1, ["public"])
+        return None
+
+    async def tp_get_user_by_id(user_id: str, _: Dict[str, Any]):
+        lookups.append("thirdparty")
+        if user_id == "tp-user":
+            return TPUser(
+                user_id,
+                "tp@example.com",
+                1,
+                ["public"],
+                ThirdPartyInfo("tp-id", "google"),
+            )
+        return None
+
+    impl = ThirdPartyEmailPasswordRecipe.get_instance().recipe_implementation
+    impl.ep_get_user_by_id = ep_get_user_by_id  # type: ignore
+    impl.tp_get_user_by_id = tp_get_user_by_id  # type: ignore
+    return lookups
+
+
+async def test_owning_recipe_is_probed_first_after_the_first_lookup():
+    lookups = init_with_mocked_core()
+    recipe = EmailVerificationRecipe.get_instance()
+
+    res = await recipe.get_email_for_user_id("tp-user", {})
+    assert isinstance(res, GetEmailForUserIdOkResult)
+    assert res.email == "tp@example.com"
+
+    lookups.clear()
+    res = await recipe.get_email_for_user_id("tp-user", {})
+    assert isinstance(res, GetEmailForUserIdOkResult)
+    assert res.email == "tp@example.com"
+    assert lookups == ["thirdparty"]
+
+    lookups.clear()
+    await recipe.get_email_for_user_id("ep-user", {})
+    lookups.clear()
+    res = await recipe.get_email_for_user_id("ep-user", {})
+    assert isinstance(res, GetEmailForUserIdOkResult)
+    assert lookups == ["emailpassword"]
+
+
+async def test_unknown_user_is_not_cached():
+    lookups = init_with_mocked_core()
+    recipe = EmailVerificationRecipe.get_instance()
+
+    await recipe.get_email_for_user_id("tp-user", {})
+    assert recipe.user_id_owner_cache.get("tp-user") is not None
+
+    res = await recipe.get_email_for_user_id("unknown", {})
+    assert isinstance(res, UnknownUserIdError)
+    assert recipe.user_id_owner_cache.get("unknown") is None
+
+    # A deleted user is dropped from the cache on the next lookup
+    impl = ThirdPartyEmailPasswordRecipe.get_instance().recipe_implementation
+
+    async def get_user_by_id(_: str, __: Dict[str, Any]):
+        lookups.append("deleted")
+        return None
+
+    impl.tp_get_user_by_id = get_user_by_id  # type: ignore
+    res = await recipe.get_email_for_user_id("tp-user", {})
+    assert isinstance(res, UnknownUserIdError)
+    assert recipe.user_id_owner_cache.get("tp-user") is None
+    assert impl.user_id_recipe_cache.get("tp-user") is None